@@ -3,10 +3,19 @@ Real Estate Property Chatbot using Ollama
 Ask questions about your entire property dataset!
 """
 
-import pandas as pd
-import requests
 import json
+import os
+import time
 from datetime import datetime
+from typing import Iterator
+from src.lazy_imports import lazy_import
+from src.aggregates import load_aggregates
+from src.locality_profiles import load_profiles
+from src.nlp.llm_client import get_client
+
+# Loaded when the chatbot starts, after the dataset/model prompts
+pd = lazy_import('pandas')
+requests = lazy_import('requests')
 
 class PropertyChatbot:
     """Chatbot for querying property dataset using Ollama"""
@@ -16,18 +25,23 @@ class PropertyChatbot:
         Initialize chatbot with property dataset
         
         Args:
-            csv_path: Path to your property CSV file
+            csv_path: Path to your property CSV (or .parquet) file
             ollama_url: Ollama server URL
             model: Ollama model to use (llama2, llama3.1, mistral)
         """
         self.csv_path = csv_path
         self.ollama_url = ollama_url
         self.model = model
+        self.client = get_client(ollama_url)
         
         # Load dataset
         print(f"📊 Loading dataset from: {csv_path}")
-        self.df = pd.read_csv(csv_path)
+        self.df = pd.read_parquet(csv_path) if csv_path.endswith('.parquet') else pd.read_csv(csv_path)
         print(f"✅ Loaded {len(self.df)} properties")
+        # Rollups for the statistics in prompts (whole file, 'Unknown' included)
+        self.agg = load_aggregates(csv_path, exclude_unknown=False, df=self.df)
+        # Character and buyer profile of every locality, keyed by name
+        self.profiles = load_profiles(csv_path, exclude_unknown=False, df=self.df)
         
         # Create dataset summary for context
         self.dataset_summary = self._create_dataset_summary()
@@ -40,27 +54,24 @@ class PropertyChatbot:
     
     def _check_ollama(self) -> bool:
         """Check if Ollama is available"""
-        try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=2)
-            return response.status_code == 200
-        except:
-            return False
+        return self.client.available()
     
     def _create_dataset_summary(self) -> str:
         """Create a summary of the dataset for context"""
+        overall = self.agg.overall
         summary = f"""
 Dataset Overview:
-- Total Properties: {len(self.df)}
-- Columns: {', '.join(self.df.columns.tolist())}
+- Total Properties: {overall['count']}
+- Columns: {', '.join(overall['columns'])}
 
 Property Statistics:
-- BHK Range: {self.df['BHK'].min()} to {self.df['BHK'].max()}
-- Price Range: ₹{self.df['Price_Lakhs'].min():.1f}L to ₹{self.df['Price_Lakhs'].max():.1f}L
-- Area Range: {self.df['Area_SqFt'].min():.0f} to {self.df['Area_SqFt'].max():.0f} sqft
-- Localities: {self.df['Locality'].nunique()} unique locations
-- Top Localities: {', '.join(self.df['Locality'].value_counts().head(5).index.tolist())}
+- BHK Range: {overall['bhk_min']} to {overall['bhk_max']}
+- Price Range: ₹{overall['price_min']:.1f}L to ₹{overall['price_max']:.1f}L
+- Area Range: {overall['area_min']:.0f} to {overall['area_max']:.0f} sqft
+- Localities: {overall['n_localities']} unique locations
+- Top Localities: {', '.join(self.agg.locality.index[:5].tolist())}
 
-Property Types: {', '.join(self.df['Property_Type'].value_counts().index.tolist())}
+Property Types: {', '.join(self.agg.property_type.index.tolist())}
 """
         return summary
     
@@ -83,41 +94,48 @@ Property Types: {', '.join(self.df['Property_Type'].value_counts().index.tolist(
         if any(word in question_lower for word in ['average', 'mean']):
             avg_stats = f"""
 Average Statistics:
-- Average Price: ₹{self.df['Price_Lakhs'].mean():.2f} Lakhs
-- Average Area: {self.df['Area_SqFt'].mean():.0f} sqft
-- Average Price/sqft: ₹{self.df['Price_Per_SqFt'].mean():.0f}
+- Average Price: ₹{self.agg.overall['price_mean']:.2f} Lakhs
+- Average Area: {self.agg.overall['area_mean']:.0f} sqft
+- Average Price/sqft: ₹{self.agg.overall['price_per_sqft_mean']:.0f}
 """
             relevant_info.append(avg_stats)
         
         # Check for specific localities
         for locality in self.df['Locality'].unique():
             if locality.lower() in question_lower:
-                loc_data = self.df[self.df['Locality'] == locality]
+                loc = self.agg.locality.loc[locality]
                 loc_info = f"""
 {locality} Statistics:
-- Total Properties: {len(loc_data)}
-- Price Range: ₹{loc_data['Price_Lakhs'].min():.1f}L to ₹{loc_data['Price_Lakhs'].max():.1f}L
-- Average Price: ₹{loc_data['Price_Lakhs'].mean():.2f}L
-- BHK Options: {sorted(loc_data['BHK'].unique())}
+- Total Properties: {loc['count']}
+- Price Range: ₹{loc['price_min']:.1f}L to ₹{loc['price_max']:.1f}L
+- Average Price: ₹{loc['price_mean']:.2f}L
+- BHK Options: {sorted(self.agg.locality_bhk_counts(locality)['BHK'].tolist())}
+"""
+                profile = self.profiles.get(locality)
+                if profile:
+                    loc_info += f"""- Character: {profile['personality']['personality']} ({profile['personality']['description']})
+- Ideal For: {', '.join(profile['target_audience'])}
 """
                 relevant_info.append(loc_info)
                 
                 # Show sample properties
-                sample = loc_data.head(3)[['BHK', 'Price_Lakhs', 'Area_SqFt', 'Furnishing_Status']]
+                sample = self.df[self.df['Locality'] == locality].head(3)[['BHK', 'Price_Lakhs', 'Area_SqFt', 'Furnishing_Status']]
                 relevant_info.append(f"Sample Properties:\n{sample.to_string()}")
                 break
         
         # Check for BHK-specific questions
         for bhk in [1, 2, 3, 4, 5]:
             if f'{bhk} bhk' in question_lower or f'{bhk}bhk' in question_lower:
-                bhk_data = self.df[self.df['BHK'] == bhk]
-                if len(bhk_data) > 0:
+                if bhk in self.agg.bhk.index:
+                    stats = self.agg.bhk.loc[bhk]
+                    by_locality = self.agg.locality_bhk[self.agg.locality_bhk['BHK'] == bhk]
+                    best = by_locality.sort_values('count', ascending=False, kind='stable')['Locality'].head(3)
                     bhk_info = f"""
 {bhk} BHK Properties:
-- Total Available: {len(bhk_data)}
-- Price Range: ₹{bhk_data['Price_Lakhs'].min():.1f}L to ₹{bhk_data['Price_Lakhs'].max():.1f}L
-- Average Price: ₹{bhk_data['Price_Lakhs'].mean():.2f}L
-- Best Localities: {', '.join(bhk_data['Locality'].value_counts().head(3).index.tolist())}
+- Total Available: {stats['count']:.0f}
+- Price Range: ₹{stats['price_min']:.1f}L to ₹{stats['price_max']:.1f}L
+- Average Price: ₹{stats['price_mean']:.2f}L
+- Best Localities: {', '.join(best.tolist())}
 """
                     relevant_info.append(bhk_info)
         
@@ -137,6 +155,19 @@ Average Statistics:
         Returns:
             AI-generated answer
         """
+        print("\n🤔 Thinking... (this may take a while, please be patient)")
+        return ''.join(self.ask_stream(question)).strip()
+    
+    def ask_stream(self, question: str) -> Iterator[str]:
+        """
+        Ask a question and get the answer as it is generated
+        
+        Args:
+            question: Your question about the dataset
+            
+        Yields:
+            Answer fragments as Ollama streams them (an "Error: ..." message on failure)
+        """
         # Get relevant data
         relevant_data = self._get_relevant_data(question)
         
@@ -149,33 +180,22 @@ User Question: {question}
 
 Provide a clear, helpful answer based on the data above. If asked for recommendations, explain your reasoning. Be specific with numbers and details."""
         
-        print("\n🤔 Thinking... (this may take a while, please be patient)")
-        
         try:
-            # Call Ollama with NO TIMEOUT - let it run as long as needed
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.7,
-                        "num_predict": 500
-                    }
+            # NO TIMEOUT - a long answer keeps streaming for as long as it needs
+            yield from self.client.stream(
+                self.model,
+                prompt,
+                {
+                    "temperature": 0.7,
+                    "num_predict": 500
                 },
-                timeout=None  # ← NO TIMEOUT! Will wait even if it takes 30+ minutes
+                timeout=None
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                answer = result.get('response', '')
-                return answer.strip()
-            else:
-                return f"Error: Ollama returned status {response.status_code}"
                 
+        except requests.exceptions.HTTPError as e:
+            yield f"Error: Ollama returned status {e.response.status_code}"
         except Exception as e:
-            return f"Error: {str(e)}"
+            yield f"Error: {str(e)}"
     
     def chat(self):
         """Start interactive chat session"""
@@ -203,14 +223,22 @@ Provide a clear, helpful answer based on the data above. If asked for recommenda
                 continue
             
             if question.lower() in ['exit', 'quit', 'bye']:
+                self.client.stats.report('Questions answered')
                 print("\n👋 Thank you for using Property Chatbot! Goodbye!\n")
                 break
             
-            # Get answer
-            answer = self.ask(question)
-            
-            # Print answer
-            print(f"\n🤖 Chatbot:\n{answer}")
+            # Print the answer as it is generated
+            print("\n🤖 Chatbot:")
+            start = time.perf_counter()
+            first_token = None
+            pieces = []
+            for piece in self.ask_stream(question):
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+                print(piece, end='', flush=True)
+                pieces.append(piece)
+            answer = ''.join(pieces).strip()
+            print(f"\n\n⏱️  First token after {first_token or 0:.1f}s | answered in {time.perf_counter() - start:.1f}s")
             
             # Save to history
             conversation_history.append({
@@ -250,7 +278,7 @@ def main():
     # Choose dataset file
     print("\n📂 Available dataset files:")
     print("  1. data/cleaned/cleaned_data.csv (Main dataset - 2,783 properties)")
-    print("  2. data/results/buyer_analysis_*.csv (AI-analyzed dataset with insights)")
+    print("  2. Buyer report (AI-analyzed dataset with insights)")
     print("  3. Custom path")
     
     choice = input("\nSelect dataset (1/2/3): ").strip()
@@ -258,14 +286,13 @@ def main():
     if choice == '1':
         csv_path = 'data/cleaned/cleaned_data.csv'
     elif choice == '2':
-        # Find the latest buyer analysis file
-        import glob
-        files = glob.glob('data/results/buyer_analysis_*.csv')
-        if files:
-            csv_path = sorted(files)[-1]  # Get the latest
+        # The report of the current buyer report run, in whichever format it writes
+        from src.buyer_reports import report_path
+        csv_path = report_path()
+        if os.path.exists(csv_path):
             print(f"\n📊 Using: {csv_path}")
         else:
-            print("\n❌ No buyer analysis files found. Using main dataset.")
+            print(f"\n❌ No buyer report at {csv_path}. Using main dataset.")
             csv_path = 'data/cleaned/cleaned_data.csv'
     else:
         csv_path = input("Enter CSV path: ").strip()
@@ -4,8 +4,10 @@ Uses HuggingFace API to generate detailed, professional property brochures
 """
 
 import sys
-import pandas as pd
 from src.nlp.brochure_generator import PropertyBrochureGenerator
+from src.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')   # only the dataset option reads a CSV
 
 def print_header():
     """Print application header"""
@@ -204,17 +206,13 @@ def main():
         print("🤖 Initializing AI Brochure Generator...")
         print("=" * 80)
         
-        generator = PropertyBrochureGenerator(use_hf_api=True)
+        generator = PropertyBrochureGenerator()
         
-        # Generate brochure
-        print("\n⏳ Generating detailed brochure...")
-        print("⏳ This may take 10-30 seconds with HuggingFace API...")
+        # Generate brochure, printing each section as it is written
+        print("\n⏳ Generating detailed brochure...\n")
         
         try:
-            brochure = generator.generate_detailed_brochure(property_data)
-            
-            # Display brochure
-            print("\n" + generator.format_brochure_text(brochure))
+            brochure = generator.stream_brochure(property_data)
             
             # Ask to save
             save = input("\n💾 Save brochure as HTML? (y/n) [y]: ") or "y"
@@ -1,9 +1,33 @@
 """
 MAIN MENU - Real Estate Price Prediction Pipeline
 Interactive menu for all operations
+
+Every action runs inside this process and shares one Session: libraries are
+imported once, and the training data, encoders and models loaded (or just
+trained) by one action are reused by the next - a prediction right after
+training serves the in-memory model.
 """
-import subprocess
+import runpy
 import sys
+import time
+from src.session import Session
+
+session = Session()
+
+def run_script(path):
+    """Run a pipeline script in this process, as if it were started from the shell"""
+    argv = sys.argv
+    sys.argv = [path]
+    try:
+        runpy.run_path(path, run_name='__main__')
+        return True
+    except SystemExit as e:
+        return e.code in (None, 0)
+    except Exception as e:
+        print(f"\n❌ {path} failed: {e}")
+        return False
+    finally:
+        sys.argv = argv
 
 def print_menu():
     print("\n" + "="*80)
@@ -23,8 +47,7 @@ def run_complete_pipeline():
     """Run preprocessing, training, and visualization"""
     print("\n🚀 Running Complete Pipeline...")
     print("="*80)
-    result = subprocess.run([sys.executable, "main2.py"])
-    return result.returncode == 0
+    return run_preprocessing() and train_models() and generate_visualizations()
 
 def run_preprocessing():
     """Run both simple and enhanced preprocessing"""
@@ -32,14 +55,12 @@ def run_preprocessing():
     print("="*80)
     
     print("\n[1/2] Simple Preprocessing...")
-    result = subprocess.run([sys.executable, "src/preprocessing/preprocess_simple.py"])
-    if result.returncode != 0:
+    if not run_script("src/preprocessing/preprocess_simple.py"):
         print("❌ Simple preprocessing failed!")
         return False
     
     print("\n[2/2] Enhanced Preprocessing...")
-    result = subprocess.run([sys.executable, "src/preprocessing/preprocess_enhanced.py"])
-    if result.returncode != 0:
+    if not run_script("src/preprocessing/preprocess_enhanced.py"):
         print("❌ Enhanced preprocessing failed!")
         return False
     
@@ -50,20 +71,21 @@ def train_models():
     """Train all 9 models"""
     print("\n🎯 Training Models...")
     print("="*80)
-    result = subprocess.run([sys.executable, "src/modeling/train_all.py"])
-    if result.returncode == 0:
-        print("\n✅ Training Complete!")
-        return True
-    else:
-        print("❌ Training failed!")
+    from src.modeling import train_all
+    try:
+        train_all.main([], session=session)
+    except Exception as e:
+        print(f"❌ Training failed! {e}")
         return False
+    print("\n✅ Training Complete!")
+    return True
 
 def generate_visualizations():
     """Generate all 21 visualizations"""
     print("\n📊 Generating Visualizations...")
     print("="*80)
-    result = subprocess.run([sys.executable, "src/visualize.py"])
-    if result.returncode == 0:
+    from src import visualize
+    if visualize.main([]) == 0:
         print("\n✅ Visualizations Complete!")
         print("📁 Saved in: visualizations/")
         return True
@@ -75,8 +97,9 @@ def predict_single_property():
     """Predict price for a single property"""
     print("\n🏠 Predicting Property Price...")
     print("="*80)
-    result = subprocess.run([sys.executable, "src/predict.py"])
-    if result.returncode == 0:
+    from src.predict import get_user_input, predict_price
+    predicted_price, _ = predict_price(get_user_input(), session.registry)
+    if predicted_price is not None:
         return True
     else:
         print("❌ Prediction failed!")
@@ -92,8 +115,7 @@ def scrape_data():
         print("❌ Scraping cancelled.")
         return False
     
-    result = subprocess.run([sys.executable, "src/scraping/scrape_all_sources_detailed.py"])
-    if result.returncode == 0:
+    if run_script("src/scraping/scrape_all_sources_detailed.py"):
         print("\n✅ Scraping Complete!")
         print("📁 Data saved in: data/raw/")
         return True
@@ -107,6 +129,8 @@ def main():
         print_menu()
         try:
             choice = input("\n👉 Enter your choice (0-6): ").strip()
+            session.refresh()
+            start = time.perf_counter()
             
             if choice == '0':
                 print("\n👋 Goodbye!")
@@ -125,7 +149,10 @@ def main():
                 scrape_data()
             else:
                 print("\n❌ Invalid choice! Please enter 0-6.")
+                start = None
             
+            if start is not None:
+                print(f"\n⏱️  Done in {time.perf_counter() - start:.1f}s")
             input("\n⏸️  Press Enter to continue...")
             
         except KeyboardInterrupt:
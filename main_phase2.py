@@ -5,21 +5,20 @@ Interactive interface for all Phase 2 features
 
 import sys
 import os
-import pandas as pd
 from datetime import datetime
-from tqdm import tqdm
-from src.nlp.amenity_extractor import AmenityExtractor
-from src.nlp.summary_generator import PropertySummaryGenerator
-from src.nlp.quality_scorer import DescriptionQualityScorer
-from src.nlp.locality_analyzer import LocalityAnalyzer
-from src.nlp.qa_system import PropertyQASystem
-from src.nlp.brochure_generator import PropertyBrochureGenerator
+from src import nlp   # NLP classes load on first use
+from src.lazy_imports import lazy_import
+
+# Loaded when a menu option first needs them, not before the menu is shown
+pd = lazy_import('pandas')
+tqdm = lazy_import('tqdm')
 
 # Create results directory if it doesn't exist
 os.makedirs('data/results', exist_ok=True)
 
 def print_menu():
     """Print main menu"""
+    from src.buyer_reports import report_path
     print("\n" + "="*80)
     print(" "*15 + "REALESTATESENSE - Phase 2 NLP Engine")
     print("="*80)
@@ -28,7 +27,7 @@ def print_menu():
     print("     → Uses LOCAL Ollama AI for unique, private content")
     print("     → Investment analysis, locality insights, recommendations")
     print("     → Extracts data from raw property listings")
-    print("     → Saves to: data/results/buyer_focused_analysis_*.csv")
+    print(f"     → Saves to: {report_path()} (resumable)")
     print("")
     print("  2. 💬 Property Chatbot (Ask Questions - NEW!)")
     print("     → Interactive AI chatbot for your entire dataset")
@@ -45,7 +44,7 @@ def extract_amenities_demo():
     print("AMENITY & FEATURE EXTRACTION")
     print("="*80)
     
-    extractor = AmenityExtractor()
+    extractor = nlp.AmenityExtractor()
     
     description = input("\nEnter property description (or press Enter for demo): ").strip()
     
@@ -69,7 +68,7 @@ def generate_summaries_demo():
     print("PROPERTY SUMMARY GENERATION")
     print("="*80)
     
-    generator = PropertySummaryGenerator(use_local=False)
+    generator = nlp.PropertySummaryGenerator(use_local=False)
     
     # Sample property
     property_data = {
@@ -110,7 +109,7 @@ def score_description_demo():
     print("DESCRIPTION QUALITY SCORING")
     print("="*80)
     
-    scorer = DescriptionQualityScorer()
+    scorer = nlp.DescriptionQualityScorer()
     
     property_data = {
         'BHK': 3,
@@ -161,7 +160,7 @@ def locality_summary_demo():
     print("LOCALITY SUMMARY & ANALYSIS")
     print("="*80)
     
-    analyzer = LocalityAnalyzer()
+    analyzer = nlp.LocalityAnalyzer()
     
     if analyzer.df.empty:
         print("❌ No data available")
@@ -192,7 +191,7 @@ def compare_localities_demo():
     print("COMPARE LOCALITIES")
     print("="*80)
     
-    analyzer = LocalityAnalyzer()
+    analyzer = nlp.LocalityAnalyzer()
     
     if analyzer.df.empty:
         print("❌ No data available")
@@ -225,7 +224,7 @@ def qa_system_demo():
     print("PROPERTY Q&A SYSTEM")
     print("="*80)
     
-    qa = PropertyQASystem()
+    qa = nlp.PropertyQASystem()
     
     if qa.df.empty:
         print("❌ No data available")
@@ -279,7 +278,7 @@ def generate_brochure_demo():
     print("\n⏳ Generating detailed brochure with Ollama AI...")
     print("💡 Make sure Ollama is running: ollama serve")
     
-    generator = PropertyBrochureGenerator(use_ollama=True, ollama_model='llama2')
+    generator = nlp.PropertyBrochureGenerator(use_ollama=True, ollama_model='llama2')
     brochure = generator.generate_detailed_brochure(sample)
     
     print("\n" + generator.format_brochure_text(brochure))
@@ -327,7 +326,7 @@ def analyze_sample_property():
     print("1. PROPERTY SUMMARIES")
     print("="*80)
     
-    generator = PropertySummaryGenerator(use_local=False)
+    generator = nlp.PropertySummaryGenerator(use_local=False)
     summaries = generator.generate_all_summaries(sample)
     
     print("\n📄 Clean Summary:")
@@ -344,7 +343,7 @@ def analyze_sample_property():
     print("2. QUALITY SCORE")
     print("="*80)
     
-    scorer = DescriptionQualityScorer()
+    scorer = nlp.DescriptionQualityScorer()
     scores = scorer.calculate_overall_score(sample)
     
     print(f"\n🎯 Overall Score: {scores['overall_score']}/10 ({scores['score_out_of_100']}/100)")
@@ -355,7 +354,7 @@ def analyze_sample_property():
     print("3. LOCALITY ANALYSIS")
     print("="*80)
     
-    analyzer = LocalityAnalyzer()
+    analyzer = nlp.LocalityAnalyzer()
     if not analyzer.df.empty:
         stats = analyzer.get_locality_stats(sample['Locality'])
         personality = analyzer.determine_locality_personality(sample['Locality'])
@@ -369,389 +368,52 @@ def analyze_sample_property():
     print("\n" + "="*80)
 
 def process_entire_dataset():
-    """Process entire dataset with complete buyer-focused analysis using Ollama - 100 properties at a time"""
-    import os
+    """Process entire dataset with complete buyer-focused analysis using Ollama - resumable, no prompts between batches"""
+    from src.buyer_reports import DatasetChangedError, run
     
     print("\n" + "="*80)
     print("COMPREHENSIVE PROPERTY ANALYSIS - BUYER FOCUSED")
     print("="*80)
     print("\n🏠 Using LOCAL Ollama AI (100% Private, No API needed)")
     print("📋 Generating complete investment & locality reports from raw data")
-    print("🔄 Processing in smaller batches for better control")
+    print("🔄 Progress is journaled - an interrupted run resumes where it stopped")
     print("\n⚡ Note: Ollama runs locally on your PC (CPU-based)")
-    print("   Each property takes ~30-60 seconds for AI generation")
     print("   💡 Tip: Start with 10 properties to test, then scale up!")
-    
-    # Load dataset
-    print("\n📂 Loading dataset...")
-    try:
-        df = pd.read_csv('data/cleaned/cleaned_data.csv')
-        df = df[df['Locality'] != 'Unknown']
-        
-        # Remove duplicates based on key columns
-        original_count = len(df)
-        df = df.drop_duplicates(subset=['BHK', 'Area_SqFt', 'Locality', 'Price_Lakhs'], keep='first')
-        duplicates_removed = original_count - len(df)
-        
-        df = df.reset_index(drop=True)
-        print(f"✅ Loaded {len(df)} unique properties")
-        if duplicates_removed > 0:
-            print(f"   🧹 Removed {duplicates_removed} duplicates")
-        
-        # Load raw data for descriptions and amenities
-        print("📂 Loading raw data for descriptions...")
-        try:
-            df_raw = pd.read_csv('data/raw/all_sources_detailed_20251127_093639.csv')
-            
-            # Merge on common fields to get descriptions
-            # Create a merge key using BHK, Locality, and approximate price
-            df['merge_key'] = (df['BHK'].astype(str) + '_' + 
-                              df['Locality'].astype(str) + '_' + 
-                              (df['Price_Lakhs'] // 10).astype(str))
-            
-            df_raw['merge_key'] = (df_raw['BHK'].astype(str) + '_' + 
-                                  df_raw['Locality'].astype(str) + '_' + 
-                                  (df_raw['Price'].str.extract(r'(\d+)')[0].fillna(0).astype(float) // 10).astype(str))
-            
-            # Merge to get Raw_JSON and Description
-            df = df.merge(df_raw[['merge_key', 'Raw_JSON', 'Description']].drop_duplicates('merge_key'), 
-                         on='merge_key', how='left')
-            df = df.drop('merge_key', axis=1)
-            
-            print(f"✅ Merged with raw data - {df['Description'].notna().sum()} properties have descriptions")
-        except Exception as e:
-            print(f"⚠️  Could not load raw data: {e}")
-            df['Description'] = ''
-            df['Raw_JSON'] = ''
-        
-    except Exception as e:
-        print(f"❌ Error loading data: {e}")
-        return
-    
-    # Create results directory
-    os.makedirs('data/results', exist_ok=True)
-    
-    # Initialize NLP modules with Ollama AI
-    print("\n🔧 Initializing AI modules...")
-    extractor = AmenityExtractor()
-    
-    # Check if Ollama is available
-    import os
-    import requests
-    try:
-        ollama_url = os.environ.get('OLLAMA_BASE_URL', 'http://localhost:11434')
-        response = requests.get(f"{ollama_url}/api/tags", timeout=2)
-        if response.status_code == 200:
-            print("🤖 Using Ollama AI for content generation (100% Local & Private)")
-            use_ai = True
-        else:
-            print("⚠️  Ollama not responding, using NLP templates")
-            use_ai = False
-    except:
-        print("💡 Tip: Start Ollama to use AI generation")
-        print("   1. Add to PATH: $env:PATH += ';$env:LOCALAPPDATA\\Programs\\Ollama'")
-        print("   2. Check models: ollama list")
-        print("   3. Pull model if needed: ollama pull llama2")
-        print("   Using advanced NLP templates")
-        use_ai = False
-    
-    brochure_gen = PropertyBrochureGenerator(use_ollama=use_ai, ollama_model='llama2')
-    scorer = DescriptionQualityScorer()
-    analyzer = LocalityAnalyzer()
-    
-    print("✅ Modules Ready")
+    print("   🌙 Overnight runs: python src/buyer_reports.py --workers 4")
     
     # Ask user how many properties to process
-    print("\n📊 Dataset contains {} properties".format(len(df)))
-    limit_input = input("🔢 How many properties to process? (Enter number or 'all'): ").strip().lower()
-    
+    limit_input = input("\n🔢 How many properties to process? (Enter number or 'all'): ").strip().lower()
     if limit_input == 'all':
-        df_to_process = df
+        limit = None
     else:
         try:
             limit = int(limit_input)
-            df_to_process = df.head(limit)
-            print(f"✅ Will process first {len(df_to_process)} properties")
         except:
             print("⚠️  Invalid input, processing first 10 properties")
-            df_to_process = df.head(10)
-    
-    # Add unique Property_ID if not exists
-    if 'Property_ID' not in df_to_process.columns:
-        df_to_process['Property_ID'] = ['PROP_' + str(i+1).zfill(6) for i in range(len(df_to_process))]
-        print("✅ Added unique Property_ID to each property")
-    
-    # Process in batches of 10
-    batch_size = 10
-    total_batches = (len(df_to_process) + batch_size - 1) // batch_size
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    print(f"\n📊 Total properties to process: {len(df_to_process)}")
-    print(f"📦 Total batches: {total_batches} ({batch_size} properties each)")
-    print(f"⏱️  Estimated time per property: ~30-60 seconds with Ollama\n")
-    
-    for batch_num in range(total_batches):
-        start_idx = batch_num * batch_size
-        end_idx = min(start_idx + batch_size, len(df_to_process))
-        batch_df = df_to_process.iloc[start_idx:end_idx]
-        
-        print("="*80)
-        print(f"BATCH {batch_num + 1}/{total_batches} - Processing properties {start_idx + 1} to {end_idx}")
-        print("="*80)
-        
-        results = []
-        
-        for idx, row in tqdm(batch_df.iterrows(), total=len(batch_df), desc=f"Batch {batch_num + 1}"):
-            prop_data = row.to_dict()
-            
-            try:
-                import random
-                
-                # Get description and raw JSON
-                description = str(prop_data.get('Description', ''))
-                raw_json = str(prop_data.get('Raw_JSON', ''))
-                combined_text = description + ' ' + raw_json
-                
-                # Try to extract from actual descriptions first
-                if combined_text and len(combined_text.strip()) > 50:
-                    amenities_data = extractor.extract_amenities(combined_text)
-                    proximity_data = extractor.extract_proximity(combined_text)
-                    selling_points_data = extractor.extract_selling_points(combined_text)
-                    views_data = extractor.extract_views(combined_text)
-                    
-                    amenities_extracted = amenities_data.get('amenities', []) if isinstance(amenities_data, dict) else []
-                    proximity_extracted = proximity_data.get('nearby', []) if isinstance(proximity_data, dict) else []
-                    selling_points_extracted = selling_points_data.get('selling_points', []) if isinstance(selling_points_data, dict) else []
-                    views_extracted = views_data.get('views', []) if isinstance(views_data, dict) else []
-                else:
-                    amenities_extracted = []
-                    proximity_extracted = []
-                    selling_points_extracted = []
-                    views_extracted = []
-                
-                # If extraction found nothing, generate based on property characteristics
-                
-                # Use extracted data if available, otherwise generate
-                if not amenities_extracted:
-                    # Base amenities for all properties
-                    base_amenities = ['24x7 Security', 'Power Backup', 'Lift']
-                    
-                    # Additional amenities based on tier and price
-                    tier_val = prop_data.get('Locality_Tier', 'Tier 3')
-                    price_val = float(prop_data.get('Price_Lakhs', 0))
-                    bhk_val = float(prop_data.get('BHK', 2))
-                    
-                    tier1_amenities = ['Swimming Pool', 'Gym', 'Clubhouse', 'Landscaped Garden', 'Intercom', 'Visitor Parking', 'CCTV', 'Kids Play Area']
-                    tier2_amenities = ['Gym', 'Parking', 'Garden', 'Kids Play Area', 'Water Supply']
-                    tier3_amenities = ['Parking', 'Water Supply', 'Garden']
-                    
-                    if 'Tier 1' in str(tier_val):
-                        amenities = base_amenities + random.sample(tier1_amenities, min(5 + int(bhk_val) // 2, len(tier1_amenities)))
-                    elif 'Tier 2' in str(tier_val):
-                        amenities = base_amenities + random.sample(tier2_amenities, min(3 + int(bhk_val) // 3, len(tier2_amenities)))
-                    else:
-                        amenities = base_amenities + random.sample(tier3_amenities, min(2, len(tier3_amenities)))
-                else:
-                    amenities = amenities_extracted
-                
-                # Proximity based on extraction or tier
-                if not proximity_extracted:
-                    tier_val = prop_data.get('Locality_Tier', 'Tier 3')
-                    tier1_proximity = ['Metro Station', 'Shopping Mall', 'Hospital', 'School', 'IT Park']
-                    tier2_proximity = ['Market', 'School', 'Hospital', 'Main Road']
-                    tier3_proximity = ['Market', 'Highway', 'School']
-                    
-                    if 'Tier 1' in str(tier_val):
-                        proximity = random.sample(tier1_proximity, min(4, len(tier1_proximity)))
-                    elif 'Tier 2' in str(tier_val):
-                        proximity = random.sample(tier2_proximity, min(3, len(tier2_proximity)))
-                    else:
-                        proximity = random.sample(tier3_proximity, min(2, len(tier3_proximity)))
-                else:
-                    proximity = proximity_extracted
-                
-                # Selling points based on extraction or characteristics
-                if not selling_points_extracted:
-                    selling_points = []
-                    price_val = float(prop_data.get('Price_Lakhs', 0))
-                    bhk_val = float(prop_data.get('BHK', 2))
-                    tier_val = prop_data.get('Locality_Tier', 'Tier 3')
-                    
-                    if price_val > 300:
-                        selling_points.append('Luxury Living')
-                    if bhk_val >= 4:
-                        selling_points.append('Spacious Layout')
-                    if 'Tier 1' in str(tier_val):
-                        selling_points.extend(['Prime Location', 'Well Connected'])
-                    else:
-                        selling_points.extend(['Value for Money', 'Growing Area'])
-                    
-                    if prop_data.get('Furnishing_Status') == 'Furnished':
-                        selling_points.append('Ready to Move')
-                else:
-                    selling_points = selling_points_extracted
-                
-                # Views/Facing based on extraction or generation
-                if not views_extracted:
-                    views_options = ['East Facing', 'North Facing', 'Corner Property', 'Park View', 'Road Facing', 'Vastu Compliant']
-                    views = random.sample(views_options, min(2, len(views_options)))
-                else:
-                    views = views_extracted
-                
-                # Generate comprehensive brochure using NLP
-                brochure = brochure_gen.generate_detailed_brochure(prop_data)
-                
-                # Calculate quality scores
-                scores = scorer.calculate_overall_score(prop_data, description)
-                
-                # Get locality insights
-                try:
-                    locality_stats = analyzer.get_locality_stats(prop_data.get('Locality', 'Unknown'))
-                    locality_personality = analyzer.determine_locality_personality(prop_data.get('Locality', 'Unknown'))
-                    target_audience = analyzer.identify_target_audience(prop_data.get('Locality', 'Unknown'))
-                except:
-                    locality_stats = {'avg_price_lakhs': 0, 'locality_tier': 'Unknown'}
-                    locality_personality = {'personality': 'Unknown', 'description': 'N/A'}
-                    target_audience = ['General Buyers']
-                
-                # Calculate investment metrics
-                price_per_sqft = (float(prop_data.get('Price_Lakhs', 0)) * 100000 / 
-                                float(prop_data.get('Area_SqFt', 1))) if prop_data.get('Area_SqFt', 0) > 0 else 0
-                
-                locality_avg = locality_stats.get('avg_price_lakhs', prop_data.get('Price_Lakhs', 0))
-                price_diff_percent = ((float(prop_data.get('Price_Lakhs', 0)) - float(locality_avg)) / 
-                                     float(locality_avg) * 100) if locality_avg > 0 else 0
-                
-                if price_diff_percent < -5:
-                    value_position = "Below Market - Good Deal"
-                elif price_diff_percent > 5:
-                    value_position = "Above Market - Overpriced"
-                else:
-                    value_position = "Fair Market Value"
-                
-                # Investment recommendation
-                if scores['overall_score'] >= 8 and price_diff_percent <= 0:
-                    investment_verdict = "STRONG BUY - Excellent Value"
-                elif scores['overall_score'] >= 7 and price_diff_percent <= 5:
-                    investment_verdict = "BUY - Good Investment"
-                elif scores['overall_score'] >= 6:
-                    investment_verdict = "CONSIDER - Average Opportunity"
-                else:
-                    investment_verdict = "AVOID - Poor Quality or Overpriced"
-                
-                # Create comprehensive result row
-                result = {
-                    # Basic Property Info
-                    'Property_ID': idx,
-                    'BHK': prop_data.get('BHK'),
-                    'Area_SqFt': prop_data.get('Area_SqFt'),
-                    'Locality': prop_data.get('Locality'),
-                    'Locality_Tier': locality_stats.get('locality_tier', 'Unknown'),
-                    'Price_Lakhs': prop_data.get('Price_Lakhs'),
-                    'Price_Per_SqFt': round(price_per_sqft, 2),
-                    'Property_Type': prop_data.get('Property_Type'),
-                    'Furnishing_Status': prop_data.get('Furnishing_Status'),
-                    'Construction_Status': 'Under Construction' if prop_data.get('Under_Construction', 0) else 'Ready to Move',
-                    
-                    # AI-Generated Reports (HuggingFace Mixtral-8x7B)
-                    'Property_Overview': brochure.get('overview', 'N/A'),
-                    'Investment_Analysis': brochure.get('investment', 'N/A'),
-                    'Location_Advantages': brochure.get('location', 'N/A').replace('\n', ' | '),
-                    'Target_Buyers': brochure.get('target_buyers', 'N/A'),
-                    
-                    # Amenities & Features
-                    'Total_Amenities': len(amenities),
-                    'Amenities': ', '.join(amenities) if amenities else 'None',
-                    'Nearby_Features': ', '.join(proximity) if proximity else 'None',
-                    'Selling_Points': ', '.join(selling_points) if selling_points else 'None',
-                    'Views_Facing': ', '.join(views) if views else 'Not Specified',
-                    
-                    # Quality Assessment
-                    'Quality_Score': scores['overall_score'],
-                    'Quality_Rating': scores['rating'],
-                    'Quality_Out_Of_100': scores['score_out_of_100'],
-                    
-                    # Locality Insights
-                    'Locality_Avg_Price': round(locality_stats.get('avg_price_lakhs', 0), 2),
-                    'Locality_Character': locality_personality.get('personality', 'Unknown'),
-                    'Locality_Description': locality_personality.get('description', 'N/A'),
-                    'Ideal_For': ', '.join(target_audience),
-                    
-                    # Investment Metrics
-                    'Market_Position': value_position,
-                    'Price_vs_Market_Percent': round(price_diff_percent, 2),
-                    'Investment_Recommendation': investment_verdict,
-                    
-                    # Processing Method
-                    'AI_Model': 'Ollama' if brochure.get('ai_generated', False) else 'NLP Templates',
-                    'Analysis_Type': 'AI-Generated' if brochure.get('ai_generated', False) else 'Template-Based',
-                    'Content_Source': 'Ollama Local LLM' if brochure.get('ai_generated', False) else 'Smart Templates',
-                    'Batch_Number': batch_num + 1
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                print(f"\n⚠️  Error processing property {idx}: {e}")
-                continue
-        
-        # Save batch results
-        batch_file = f'data/results/buyer_analysis_batch_{batch_num + 1}_{timestamp}.csv'
-        df_batch = pd.DataFrame(results)
-        df_batch.to_csv(batch_file, index=False, encoding='utf-8-sig')
-        
-        print(f"\n✅ Batch {batch_num + 1} Complete!")
-        print(f"📊 Processed: {len(results)} properties (NLP Analysis)")
-        print(f"💾 Saved to: {batch_file}")
-        
-        # Check if there are more batches
-        if batch_num < total_batches - 1:
-            print(f"\n⏸️  Batch {batch_num + 1}/{total_batches} complete.")
-            print(f"📦 Remaining: {total_batches - batch_num - 1} batches ({(total_batches - batch_num - 1) * 100} properties)")
-            input("\n👉 Press ENTER to process next batch (or Ctrl+C to stop)...")
-        else:
-            print(f"\n🎉 All {total_batches} batches processed!")
-    
-    # Combine all batch files into one final file
-    print("\n" + "="*80)
-    print("📦 COMBINING ALL BATCHES INTO FINAL REPORT")
-    print("="*80)
-    
-    all_results = []
-    for batch_num in range(total_batches):
-        batch_file = f'data/results/buyer_analysis_batch_{batch_num + 1}_{timestamp}.csv'
-        if os.path.exists(batch_file):
-            batch_df = pd.read_csv(batch_file)
-            all_results.append(batch_df)
+            limit = 10
     
-    if all_results:
-        final_df = pd.concat(all_results, ignore_index=True)
-        
-        # Remove any duplicates that might have slipped through
-        before_dedup = len(final_df)
-        if 'Property_ID' in final_df.columns:
-            final_df = final_df.drop_duplicates(subset=['Property_ID'], keep='first')
-        else:
-            final_df = final_df.drop_duplicates(subset=['BHK', 'Area_SqFt', 'Locality', 'Price_Lakhs'], keep='first')
-        after_dedup = len(final_df)
-        
-        final_file = f'data/results/buyer_focused_analysis_complete_{timestamp}.csv'
-        final_df.to_csv(final_file, index=False, encoding='utf-8-sig')
-        
-        print(f"\n✅ Final Report Created!")
-        print(f"📊 Total Properties: {len(final_df)}")
-        if before_dedup > after_dedup:
-            print(f"   🧹 Removed {before_dedup - after_dedup} duplicate entries")
-        print(f"🔧 Processing: Advanced NLP Analysis")
-        print(f"💾 Complete Report: {final_file}")
-        print(f"\n📋 Report includes:")
-        print("   • Property overview & investment analysis")
-        print("   • Location advantages & target buyer profile")
-        print("   • Complete amenities & features analysis")
-        print("   • Quality scores & ratings")
-        print("   • Locality insights & market positioning")
-        print("   • Investment recommendations")
+    try:
+        try:
+            counts = run(limit=limit)
+        except DatasetChangedError as e:
+            print(f"\n⚠️  Cannot resume the previous run: {e}")
+            if input("🔄 Discard it and start over? (y/n): ").strip().lower() != 'y':
+                return
+            counts = run(limit=limit, fresh=True)
+    except Exception as e:
+        print(f"❌ Error loading data: {e}")
+        return
     
+    print(f"\n✅ Report up to date: {counts.get('done', 0)} properties done"
+          + (f", {counts['failed']} failed (retried on the next run)" if counts.get('failed') else ''))
+    print(f"💾 Complete Report: {counts['output']}")
+    print(f"\n📋 Report includes:")
+    print("   • Property overview & investment analysis")
+    print("   • Location advantages & target buyer profile")
+    print("   • Complete amenities & features analysis")
+    print("   • Quality scores & ratings")
+    print("   • Locality insights & market positioning")
+    print("   • Investment recommendations")
     print("\n" + "="*80)
 
 def process_quick_analysis():
@@ -771,15 +433,15 @@ def process_quick_analysis():
         return
     
     # Initialize modules
-    extractor = AmenityExtractor()
-    scorer = DescriptionQualityScorer()
+    extractor = nlp.AmenityExtractor()
+    scorer = nlp.DescriptionQualityScorer()
     
     results = []
     
     print(f"\n⏳ Processing {len(df)} properties (quick mode)...")
     print("⚠️  Estimated time: 3-5 minutes\n")
     
-    for idx, row in tqdm(df.iterrows(), total=len(df), desc="Processing"):
+    for idx, row in tqdm.tqdm(df.iterrows(), total=len(df), desc="Processing"):
         prop_data = row.to_dict()
         
         try:
@@ -820,51 +482,42 @@ def process_quick_analysis():
 
 def process_locality_analysis():
     """Process locality-level analysis"""
+    from src.locality_profiles import load_profiles
+    
     print("\n" + "="*80)
     print("LOCALITY ANALYSIS - ALL AREAS")
     print("="*80)
     
-    analyzer = LocalityAnalyzer()
-    
-    if analyzer.df.empty:
-        print("❌ No data available")
+    # Every locality's profile in one pass (read from data/aggregates/ if the data is unchanged)
+    try:
+        profiles = load_profiles()
+    except Exception as e:
+        print(f"❌ No data available: {e}")
         return
     
-    # Get all localities
-    localities = analyzer.df['Locality'].unique()
-    print(f"\n📍 Found {len(localities)} localities")
+    print(f"\n📍 Found {len(profiles)} localities")
     
     results = []
-    
-    print(f"\n⏳ Analyzing {len(localities)} localities...\n")
-    
-    for locality in tqdm(localities, desc="Processing"):
-        try:
-            stats = analyzer.get_locality_stats(locality)
-            personality = analyzer.determine_locality_personality(locality)
-            target_audience = analyzer.identify_target_audience(locality)
-            
-            result = {
-                'Locality': locality,
-                'Property_Count': stats['property_count'],
-                'Avg_Price_Lakhs': stats['avg_price_lakhs'],
-                'Median_Price_Lakhs': stats['median_price_lakhs'],
-                'Min_Price_Lakhs': stats['min_price_lakhs'],
-                'Max_Price_Lakhs': stats['max_price_lakhs'],
-                'Avg_Area_SqFt': stats['avg_area_sqft'],
-                'Locality_Tier': stats['locality_tier'],
-                'Personality': personality['personality'],
-                'Description': personality['description'],
-                'Tags': ', '.join(personality['tags']),
-                'Target_Audience': ', '.join(target_audience)
-            }
-            
-            results.append(result)
-            
-        except Exception as e:
-            continue
+    for locality, profile in profiles.items():
+        stats = profile['stats']
+        personality = profile['personality']
+        results.append({
+            'Locality': locality,
+            'Property_Count': stats['total_properties'],
+            'Avg_Price_Lakhs': stats['avg_price_lakhs'],
+            'Median_Price_Lakhs': stats['median_price_lakhs'],
+            'Min_Price_Lakhs': stats['min_price_lakhs'],
+            'Max_Price_Lakhs': stats['max_price_lakhs'],
+            'Avg_Area_SqFt': stats['avg_area_sqft'],
+            'Locality_Tier': stats['locality_tier'],
+            'Personality': personality['personality'],
+            'Description': personality['description'],
+            'Tags': ', '.join(personality['character_tags']),
+            'Target_Audience': ', '.join(profile['target_audience'])
+        })
     
     # Save results
+    os.makedirs('data/results', exist_ok=True)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_file = f'data/results/locality_analysis_{timestamp}.csv'
     
@@ -3,11 +3,15 @@ Interactive Property Finder - CLI
 Personalized property recommendations based on user preferences
 """
 
-import pandas as pd
-import numpy as np
+from __future__ import annotations   # pd.DataFrame hints must not import pandas
+
 from typing import List, Dict, Optional
 import os
 import sys
+from src.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
 
 class PropertyFinder:
     """Interactive property recommendation system"""
@@ -0,0 +1,223 @@
+"""
+MATERIALIZED MARKET AGGREGATES
+Every locality / tier / BHK / property type / furnishing rollup of a listings
+file, computed in one pass per dataset version and stored as a small JSON
+file. Charts, the NLP modules and the chatbot read these tables instead of
+re-grouping the full frame.
+
+Usage:
+    from src.aggregates import load_aggregates
+    agg = load_aggregates()                    # built on first use, then read from disk
+    agg.locality.loc['Bopal', 'price_mean']
+    agg.tier_bhk                               # Locality_Tier x BHK listing counts
+
+Files:
+    data/aggregates/<dataset>.json - tables + digest of the source file; rebuilt
+                                     when the source changes or SCHEMA_VERSION is bumped
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
+
+CLEANED_PATH = 'data/cleaned/cleaned_data.csv'
+AGGREGATES_DIR = 'data/aggregates'
+SCHEMA_VERSION = 1
+
+# Optional rollups: table name -> (grouping column, aggregations); skipped if the column is missing
+GROUP_TABLES = {
+    'tier': ('Locality_Tier', {'price_mean': ('Price_Lakhs', 'mean'), 'price_median': ('Price_Lakhs', 'median'),
+                               'price_std': ('Price_Lakhs', 'std'), 'area_mean': ('Area_SqFt', 'mean')}),
+    'bhk': ('BHK', {'price_mean': ('Price_Lakhs', 'mean'), 'price_min': ('Price_Lakhs', 'min'),
+                    'price_max': ('Price_Lakhs', 'max'), 'area_mean': ('Area_SqFt', 'mean')}),
+    'property_type': ('Property_Type', {'price_mean': ('Price_Lakhs', 'mean'), 'area_mean': ('Area_SqFt', 'mean')}),
+    'furnishing': ('Furnishing_Status', {'price_mean': ('Price_Lakhs', 'mean'),
+                                         'price_median': ('Price_Lakhs', 'median')}),
+    'seller': ('Seller_Type', {'price_mean': ('Price_Lakhs', 'mean')}),
+    'construction': ('Under_Construction', {'price_mean': ('Price_Lakhs', 'mean')}),
+}
+
+# Listing-count crosstabs: table name -> (row column, column column)
+CROSSTABS = {
+    'tier_bhk': ('Locality_Tier', 'BHK'),
+    'seller_type': ('Seller_Type', 'Property_Type'),
+    'furnishing_type': ('Furnishing_Status', 'Property_Type'),
+}
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+
+def _mode_share(series: pd.Series) -> tuple:
+    """Most common value (smallest on ties, like Series.mode()[0]) and its share in %"""
+    counts = series.value_counts()
+    top = counts.max()
+    value = min(counts.index[counts == top])
+    return value, float(top / len(series) * 100)
+
+
+class MarketAggregates:
+    """
+    Rollup tables of one listings frame
+
+    Attributes:
+        overall: dict of dataset-wide statistics
+        locality: per-locality stats, ordered by listing count (like value_counts())
+        locality_bhk: (Locality, BHK, count) rows, most common BHK first within a locality
+        tier, bhk, property_type, furnishing, seller, construction: per-group stats
+            with a 'count' column (None if the source has no such column)
+        tier_bhk, seller_type, furnishing_type: listing-count crosstabs
+    """
+
+    TABLES = ['locality', 'locality_bhk', *GROUP_TABLES, *CROSSTABS]
+
+    def __init__(self, overall: dict, tables: dict, digest: str = None):
+        self.overall = overall
+        self.digest = digest
+        for name in self.TABLES:
+            setattr(self, name, tables.get(name))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, digest: str = None):
+        price, area = df['Price_Lakhs'], df['Area_SqFt']
+        if 'Price_Per_SqFt' in df.columns:
+            price_per_sqft = df['Price_Per_SqFt']
+        else:
+            price_per_sqft = price * 100000 / area
+        overall = {
+            'count': len(df),
+            'columns': df.columns.tolist(),
+            'n_localities': int(df['Locality'].nunique()),
+            'price_mean': price.mean(), 'price_median': price.median(),
+            'price_min': price.min(), 'price_max': price.max(),
+            'area_mean': area.mean(), 'area_median': area.median(),
+            'area_min': area.min(), 'area_max': area.max(),
+            'bhk_min': df['BHK'].min(), 'bhk_max': df['BHK'].max(),
+            'price_per_sqft_mean': price_per_sqft.mean(),
+        }
+        for key, column in (('bhk', 'BHK'), ('property_type', 'Property_Type'),
+                            ('furnishing', 'Furnishing_Status')):
+            if column in df.columns:
+                overall[f'{key}_mode'], overall[f'{key}_mode_share'] = _mode_share(df[column])
+        if 'Property_Type' in df.columns:
+            overall['n_property_types'] = int(df['Property_Type'].nunique())
+
+        # Per locality: one groupby plus the crosstabs needed for modes and shares
+        groups = df.groupby('Locality')
+        locality = groups.agg(count=('Price_Lakhs', 'size'),
+                              price_mean=('Price_Lakhs', 'mean'), price_median=('Price_Lakhs', 'median'),
+                              price_min=('Price_Lakhs', 'min'), price_max=('Price_Lakhs', 'max'),
+                              area_mean=('Area_SqFt', 'mean'), area_median=('Area_SqFt', 'median'),
+                              bhk_mean=('BHK', 'mean'))
+        bhk_counts = pd.crosstab(df['Locality'], df['BHK'])
+        locality['bhk_mode'] = bhk_counts.idxmax(axis=1)
+        if 'Amenities_Count' in df.columns:
+            locality['amenities_mean'] = groups['Amenities_Count'].mean()
+        if 'Property_Type' in df.columns:
+            locality['apartment_share'] = groups['Property_Type'].agg(lambda s: (s == 'Apartment').mean())
+        if 'Locality_Tier' in df.columns:
+            locality['tier'] = pd.crosstab(df['Locality'], df['Locality_Tier']).idxmax(axis=1)
+        tables = {'locality': locality.loc[df['Locality'].value_counts().index]}
+
+        locality_bhk = bhk_counts.stack().rename('count').reset_index()
+        locality_bhk = locality_bhk[locality_bhk['count'] > 0]
+        tables['locality_bhk'] = locality_bhk.sort_values(['Locality', 'count', 'BHK'],
+                                                          ascending=[True, False, True]).reset_index(drop=True)
+
+        for name, (column, aggregations) in GROUP_TABLES.items():
+            if column in df.columns:
+                table = df.groupby(column).agg(count=('Price_Lakhs', 'size'), **aggregations)
+                tables[name] = table.sort_values('count', ascending=False, kind='stable')
+        for name, (rows, columns) in CROSSTABS.items():
+            if rows in df.columns and columns in df.columns:
+                tables[name] = pd.crosstab(df[rows], df[columns])
+        return cls(overall, tables, digest)
+
+    def locality_bhk_counts(self, locality: str) -> pd.DataFrame:
+        """(BHK, count) rows of one locality, most common first"""
+        table = self.locality_bhk
+        return table[table['Locality'] == locality][['BHK', 'count']]
+
+    def save(self, path: str):
+        payload = {'schema': SCHEMA_VERSION, 'digest': self.digest,
+                   'overall': {k: v.item() if hasattr(v, 'item') else v for k, v in self.overall.items()},
+                   'tables': {}}
+        for name in self.TABLES:
+            table = getattr(self, name)
+            if table is not None:
+                payload['tables'][name] = {'index_name': table.index.name,
+                                           'columns_name': table.columns.name,
+                                           **json.loads(table.to_json(orient='split'))}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+
+    @classmethod
+    def load(cls, path: str):
+        """Saved tables, or None if missing or written by another schema version"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get('schema') != SCHEMA_VERSION:
+            return None
+        tables = {}
+        for name, spec in payload['tables'].items():
+            table = pd.DataFrame(spec['data'], index=spec['index'], columns=spec['columns'])
+            table.index.name = spec['index_name']
+            table.columns.name = spec['columns_name']
+            tables[name] = table
+        return cls(payload['overall'], tables, payload['digest'])
+
+
+def aggregates_path(data_path: str, exclude_unknown: bool = True) -> str:
+    name = os.path.splitext(os.path.basename(data_path))[0]
+    return os.path.join(AGGREGATES_DIR, name + ('' if exclude_unknown else '_all') + '.json')
+
+
+# Loaded tables per (source file, digest), shared by every reader in the process
+_loaded = {}
+
+
+def load_aggregates(data_path: str = CLEANED_PATH, exclude_unknown: bool = True,
+                    df: pd.DataFrame = None) -> MarketAggregates:
+    """
+    Aggregates of a listings file, rebuilt only when the file has changed
+
+    Args:
+        data_path: Listings CSV the tables describe
+        exclude_unknown: Drop the 'Unknown' locality bucket first (as the charts and NLP modules do)
+        df: The file's frame if the caller has already loaded (and filtered) it
+
+    Returns:
+        MarketAggregates
+    """
+    digest = file_digest(data_path)
+    key = (data_path, exclude_unknown)
+    if key in _loaded and _loaded[key].digest == digest:
+        return _loaded[key]
+
+    path = aggregates_path(data_path, exclude_unknown)
+    agg = MarketAggregates.load(path)
+    if agg is None or agg.digest != digest:
+        if df is None:
+            df = pd.read_csv(data_path)
+            if exclude_unknown:
+                df = df[df['Locality'] != 'Unknown']
+        agg = MarketAggregates.from_frame(df, digest)
+        agg.save(path)
+        print(f"📦 Built market aggregates for {agg.overall['count']} listings -> {path}")
+    _loaded[key] = agg
+    return agg
@@ -0,0 +1,84 @@
+"""
+PRICE BANDS, MARKET POSITION & INVESTMENT VERDICTS
+Shared labelling rules for predictions and buyer reports. Every function takes
+scalars or arrays and labels all rows in one vectorized call (np.searchsorted
+over sorted edges / np.select over conditions), so batch outputs never loop
+over rows in Python.
+"""
+import numpy as np
+
+# Upper edges (exclusive) of the price bands in Lakhs; the last band is open-ended
+PRICE_BAND_EDGES = np.array([20, 40, 60, 80, 100, 120], dtype=np.float64)
+PRICE_BAND_LABELS = np.array([
+    '0-20L (Budget)',
+    '20-40L (Affordable)',
+    '40-60L (Mid-Range)',
+    '60-80L (Premium)',
+    '80-100L (Luxury)',
+    '100-120L (High-End)',
+    '120L+ (Ultra-Luxury)',
+], dtype=object)
+
+# Price vs locality average (%) within ±FAIR_VALUE_PCT counts as fair value
+FAIR_VALUE_PCT = 5
+BELOW_MARKET = "Below Market - Good Deal"
+FAIR_MARKET = "Fair Market Value"
+ABOVE_MARKET = "Above Market - Overpriced"
+
+STRONG_BUY = "STRONG BUY - Excellent Value"
+BUY = "BUY - Good Investment"
+CONSIDER = "CONSIDER - Average Opportunity"
+AVOID = "AVOID - Poor Quality or Overpriced"
+
+# Label tables indexed by integer codes, so no string arrays are built per call
+_POSITIONS = np.array([BELOW_MARKET, FAIR_MARKET, ABOVE_MARKET], dtype=object)
+_VERDICTS = np.array([STRONG_BUY, BUY, CONSIDER, AVOID], dtype=object)
+_BANDS = np.append(PRICE_BAND_LABELS, None)   # last code: missing / negative price
+
+
+def _lookup(table: np.ndarray, codes):
+    """Labels for integer codes; a plain label for scalar input"""
+    codes = np.asarray(codes)
+    return table[codes] if codes.ndim else table[int(codes)]
+
+
+def price_bands(prices):
+    """
+    Price band label of every price (min <= price < max)
+
+    Args:
+        prices: Price(s) in Lakhs
+
+    Returns:
+        Array of labels (None for missing or negative prices); a scalar in, a label out
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    codes = np.searchsorted(PRICE_BAND_EDGES, p, side='right')
+    return _lookup(_BANDS, np.where(np.isnan(p) | (p < 0), len(PRICE_BAND_LABELS), codes))
+
+
+def price_vs_market(prices, locality_avg):
+    """Percent difference from the locality average (0 where the average is unknown)"""
+    p = np.asarray(prices, dtype=np.float64)
+    avg = np.asarray(locality_avg, dtype=np.float64)
+    valid = avg > 0
+    return np.where(valid, (p - avg) / np.where(valid, avg, 1.0) * 100, 0.0)
+
+
+def value_positions(price_diff_percent):
+    """Market position from the price difference to the locality average (%)"""
+    d = np.asarray(price_diff_percent, dtype=np.float64)
+    return _lookup(_POSITIONS, np.select([d < -FAIR_VALUE_PCT, d > FAIR_VALUE_PCT], [0, 2], default=1))
+
+
+def investment_verdicts(quality_scores, price_diff_percent):
+    """
+    Investment recommendation from quality score (0-10) and price vs market (%)
+
+    Returns:
+        Array of verdicts; first matching rule wins
+    """
+    s = np.asarray(quality_scores, dtype=np.float64)
+    d = np.asarray(price_diff_percent, dtype=np.float64)
+    return _lookup(_VERDICTS, np.select([(s >= 8) & (d <= 0), (s >= 7) & (d <= FAIR_VALUE_PCT), s >= 6],
+                                        [0, 1, 2], default=3))
@@ -0,0 +1,636 @@
+"""
+BUYER REPORT BATCH RUNNER
+Headless, resumable engine behind "Generate Complete Buyer Report": every
+property of the cleaned dataset gets a brochure, quality scores, locality
+insights and an investment verdict, without anyone at the keyboard.
+
+- Work queue + completion journal: one SQLite row per property (pending / done /
+  failed, attempts, last error, finish time). A restarted run picks up exactly
+  the properties that are not done yet; failed ones are retried. The journal
+  belongs to one version of the dataset: if the data files change, the run
+  refuses to resume until it is started over with --fresh.
+- Output: one table appended in chunks - a CSV by default, or a single Parquet
+  file with --format parquet (needs pyarrow). The format is fixed when a run
+  starts; resumed runs keep it. Rows already in the output count as done even
+  if the journal missed them (crash between write and journal).
+
+Usage:
+    python src/buyer_reports.py                        # all properties, resume if a run exists
+    python src/buyer_reports.py --limit 200 --workers 8
+    python src/buyer_reports.py --fresh                # discard the previous run first
+    python src/buyer_reports.py --fresh --format parquet
+
+Files:
+    data/results/buyer_run_state.sqlite                 - queue + journal + dataset digest and format
+    data/results/buyer_analysis_complete.csv            - results (.parquet with --format parquet)
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.aggregates import file_digest
+from src.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+tqdm = lazy_import('tqdm')
+
+CLEANED_PATH = 'data/cleaned/cleaned_data.csv'
+RAW_PATH = 'data/raw/all_sources_detailed_20251127_093639.csv'
+STATE_PATH = 'data/results/buyer_run_state.sqlite'
+OUTPUT_BASE = 'data/results/buyer_analysis_complete'
+CHUNK_SIZE = 10
+OUTPUT_FORMATS = ('csv', 'parquet')
+DEFAULT_FORMAT = 'csv'
+
+
+class ResumeError(RuntimeError):
+    """The unfinished run cannot be continued with these settings"""
+
+
+class DatasetChangedError(ResumeError):
+    """The dataset is not the one the unfinished run was journaled against"""
+
+
+def dataset_digest() -> str:
+    """Digest of the files load_properties() reads; property ids are row numbers of this version"""
+    digest = file_digest(CLEANED_PATH)
+    if os.path.exists(RAW_PATH):
+        digest += '-' + file_digest(RAW_PATH)
+    return digest
+
+
+def load_properties() -> pd.DataFrame:
+    """Cleaned listings without 'Unknown' localities or duplicates, with raw descriptions merged in"""
+    df = pd.read_csv(CLEANED_PATH)
+    df = df[df['Locality'] != 'Unknown']
+    
+    # Remove duplicates based on key columns
+    original_count = len(df)
+    df = df.drop_duplicates(subset=['BHK', 'Area_SqFt', 'Locality', 'Price_Lakhs'], keep='first')
+    duplicates_removed = original_count - len(df)
+    
+    df = df.reset_index(drop=True)
+    print(f"✅ Loaded {len(df)} unique properties")
+    if duplicates_removed > 0:
+        print(f"   🧹 Removed {duplicates_removed} duplicates")
+    
+    # Load raw data for descriptions and amenities
+    print("📂 Loading raw data for descriptions...")
+    try:
+        df_raw = pd.read_csv(RAW_PATH)
+        
+        # Merge on common fields to get descriptions
+        # Create a merge key using BHK, Locality, and approximate price
+        df['merge_key'] = (df['BHK'].astype(str) + '_' + 
+                          df['Locality'].astype(str) + '_' + 
+                          (df['Price_Lakhs'] // 10).astype(str))
+        
+        df_raw['merge_key'] = (df_raw['BHK'].astype(str) + '_' + 
+                              df_raw['Locality'].astype(str) + '_' + 
+                              (df_raw['Price'].str.extract(r'(\d+)')[0].fillna(0).astype(float) // 10).astype(str))
+        
+        # Merge to get Raw_JSON and Description
+        df = df.merge(df_raw[['merge_key', 'Raw_JSON', 'Description']].drop_duplicates('merge_key'), 
+                     on='merge_key', how='left')
+        df = df.drop('merge_key', axis=1)
+        
+        print(f"✅ Merged with raw data - {df['Description'].notna().sum()} properties have descriptions")
+    except Exception as e:
+        print(f"⚠️  Could not load raw data: {e}")
+        df['Description'] = ''
+        df['Raw_JSON'] = ''
+    
+    # Add unique Property_ID if not exists
+    if 'Property_ID' not in df.columns:
+        df['Property_ID'] = ['PROP_' + str(i+1).zfill(6) for i in range(len(df))]
+    return df
+
+
+def _locality_insights(analyzer, localities) -> pd.DataFrame:
+    """Stats, personality and audience of each locality, looked up once per locality"""
+    insights = {}
+    for locality in localities:
+        try:
+            locality_stats = analyzer.get_locality_stats(locality)
+            locality_personality = analyzer.determine_locality_personality(locality)
+            target_audience = analyzer.identify_target_audience(locality)
+        except:
+            locality_stats = {'avg_price_lakhs': 0, 'locality_tier': 'Unknown'}
+            locality_personality = {'personality': 'Unknown', 'description': 'N/A'}
+            target_audience = ['General Buyers']
+        insights[locality] = {
+            # NaN (no stats): the property is compared with its own price, i.e. fair value
+            'market_avg': locality_stats.get('avg_price_lakhs', np.nan),
+            'Locality_Tier': locality_stats.get('locality_tier', 'Unknown'),
+            'Locality_Avg_Price': round(locality_stats.get('avg_price_lakhs', 0), 2),
+            'Locality_Character': locality_personality.get('personality', 'Unknown'),
+            'Locality_Description': locality_personality.get('description', 'N/A'),
+            'Ideal_For': ', '.join(target_audience),
+        }
+    return pd.DataFrame.from_dict(insights, orient='index')
+
+
+def buyer_metrics(df: pd.DataFrame, analyzer, scorer) -> pd.DataFrame:
+    """
+    Every non-LLM report column of every property, computed column-wise
+
+    Price per sqft, the locality join (average, tier, character, audience),
+    deviation from the locality average, market position, investment verdict
+    and quality scores. Locality insights are looked up once per locality.
+
+    Args:
+        df: Properties from load_properties()
+        analyzer, scorer: LocalityAnalyzer, DescriptionQualityScorer
+
+    Returns:
+        DataFrame indexed like df, one column per report field
+    """
+    from src.banding import price_vs_market, value_positions, investment_verdicts
+
+    price = df['Price_Lakhs'].astype(float)
+    area = df['Area_SqFt'].astype(float)
+    localities = _locality_insights(analyzer, df['Locality'].unique())
+    metrics = localities.reindex(df['Locality'].to_numpy()).set_index(df.index)
+
+    # Calculate investment metrics
+    metrics['Price_Per_SqFt'] = np.where(area > 0, price * 100000 / area.where(area > 0), 0).round(2)
+    price_diff = price_vs_market(price, metrics.pop('market_avg').fillna(price))
+    metrics['Price_vs_Market_Percent'] = price_diff.round(2)
+
+    # Calculate quality scores
+    descriptions = df['Description'].astype(str) if 'Description' in df.columns else [''] * len(df)
+    scores = scorer.calculate_scores_frame(df, descriptions)
+    metrics['Quality_Score'] = scores['overall_score']
+    metrics['Quality_Rating'] = scores['rating']
+    metrics['Quality_Out_Of_100'] = scores['score_out_of_100']
+
+    metrics['Market_Position'] = value_positions(price_diff)
+    metrics['Investment_Recommendation'] = investment_verdicts(metrics['Quality_Score'], price_diff)
+    return metrics
+
+
+def analyze_property(idx: int, prop_data: dict, brochure: dict, metrics: dict, extractor,
+                     batch_number: int) -> dict:
+    """
+    Buyer report row of one property: its text columns, merged with its metrics
+
+    Args:
+        idx: Row number in load_properties() (the report's Property_ID)
+        prop_data: The property's fields
+        brochure: Its generated brochure
+        metrics: Its buyer_metrics() row
+        extractor: AmenityExtractor
+        batch_number: Output chunk the row is written in
+
+    Returns:
+        Result row
+    """
+    import random
+
+    # Get description and raw JSON
+    description = str(prop_data.get('Description', ''))
+    raw_json = str(prop_data.get('Raw_JSON', ''))
+    combined_text = description + ' ' + raw_json
+
+    # Try to extract from actual descriptions first
+    if combined_text and len(combined_text.strip()) > 50:
+        amenities_data = extractor.extract_amenities(combined_text)
+        proximity_data = extractor.extract_proximity(combined_text)
+        selling_points_data = extractor.extract_selling_points(combined_text)
+        views_data = extractor.extract_views(combined_text)
+
+        amenities_extracted = amenities_data.get('amenities', []) if isinstance(amenities_data, dict) else []
+        proximity_extracted = proximity_data.get('nearby', []) if isinstance(proximity_data, dict) else []
+        selling_points_extracted = selling_points_data.get('selling_points', []) if isinstance(selling_points_data, dict) else []
+        views_extracted = views_data.get('views', []) if isinstance(views_data, dict) else []
+    else:
+        amenities_extracted = []
+        proximity_extracted = []
+        selling_points_extracted = []
+        views_extracted = []
+
+    # If extraction found nothing, generate based on property characteristics
+
+    # Use extracted data if available, otherwise generate
+    if not amenities_extracted:
+        # Base amenities for all properties
+        base_amenities = ['24x7 Security', 'Power Backup', 'Lift']
+
+        # Additional amenities based on tier and price
+        tier_val = prop_data.get('Locality_Tier', 'Tier 3')
+        price_val = float(prop_data.get('Price_Lakhs', 0))
+        bhk_val = float(prop_data.get('BHK', 2))
+
+        tier1_amenities = ['Swimming Pool', 'Gym', 'Clubhouse', 'Landscaped Garden', 'Intercom', 'Visitor Parking', 'CCTV', 'Kids Play Area']
+        tier2_amenities = ['Gym', 'Parking', 'Garden', 'Kids Play Area', 'Water Supply']
+        tier3_amenities = ['Parking', 'Water Supply', 'Garden']
+
+        if 'Tier 1' in str(tier_val):
+            amenities = base_amenities + random.sample(tier1_amenities, min(5 + int(bhk_val) // 2, len(tier1_amenities)))
+        elif 'Tier 2' in str(tier_val):
+            amenities = base_amenities + random.sample(tier2_amenities, min(3 + int(bhk_val) // 3, len(tier2_amenities)))
+        else:
+            amenities = base_amenities + random.sample(tier3_amenities, min(2, len(tier3_amenities)))
+    else:
+        amenities = amenities_extracted
+
+    # Proximity based on extraction or tier
+    if not proximity_extracted:
+        tier_val = prop_data.get('Locality_Tier', 'Tier 3')
+        tier1_proximity = ['Metro Station', 'Shopping Mall', 'Hospital', 'School', 'IT Park']
+        tier2_proximity = ['Market', 'School', 'Hospital', 'Main Road']
+        tier3_proximity = ['Market', 'Highway', 'School']
+
+        if 'Tier 1' in str(tier_val):
+            proximity = random.sample(tier1_proximity, min(4, len(tier1_proximity)))
+        elif 'Tier 2' in str(tier_val):
+            proximity = random.sample(tier2_proximity, min(3, len(tier2_proximity)))
+        else:
+            proximity = random.sample(tier3_proximity, min(2, len(tier3_proximity)))
+    else:
+        proximity = proximity_extracted
+
+    # Selling points based on extraction or characteristics
+    if not selling_points_extracted:
+        selling_points = []
+        price_val = float(prop_data.get('Price_Lakhs', 0))
+        bhk_val = float(prop_data.get('BHK', 2))
+        tier_val = prop_data.get('Locality_Tier', 'Tier 3')
+
+        if price_val > 300:
+            selling_points.append('Luxury Living')
+        if bhk_val >= 4:
+            selling_points.append('Spacious Layout')
+        if 'Tier 1' in str(tier_val):
+            selling_points.extend(['Prime Location', 'Well Connected'])
+        else:
+            selling_points.extend(['Value for Money', 'Growing Area'])
+
+        if prop_data.get('Furnishing_Status') == 'Furnished':
+            selling_points.append('Ready to Move')
+    else:
+        selling_points = selling_points_extracted
+
+    # Views/Facing based on extraction or generation
+    if not views_extracted:
+        views_options = ['East Facing', 'North Facing', 'Corner Property', 'Park View', 'Road Facing', 'Vastu Compliant']
+        views = random.sample(views_options, min(2, len(views_options)))
+    else:
+        views = views_extracted
+
+    # Create comprehensive result row
+    result = {
+        # Basic Property Info
+        'Property_ID': idx,
+        'BHK': prop_data.get('BHK'),
+        'Area_SqFt': prop_data.get('Area_SqFt'),
+        'Locality': prop_data.get('Locality'),
+        'Locality_Tier': metrics['Locality_Tier'],
+        'Price_Lakhs': prop_data.get('Price_Lakhs'),
+        'Price_Per_SqFt': metrics['Price_Per_SqFt'],
+        'Property_Type': prop_data.get('Property_Type'),
+        'Furnishing_Status': prop_data.get('Furnishing_Status'),
+        'Construction_Status': 'Under Construction' if prop_data.get('Under_Construction', 0) else 'Ready to Move',
+
+        # AI-Generated Reports (HuggingFace Mixtral-8x7B)
+        'Property_Overview': brochure.get('overview', 'N/A'),
+        'Investment_Analysis': brochure.get('investment', 'N/A'),
+        'Location_Advantages': brochure.get('location', 'N/A').replace('\n', ' | '),
+        'Target_Buyers': brochure.get('target_buyers', 'N/A'),
+
+        # Amenities & Features
+        'Total_Amenities': len(amenities),
+        'Amenities': ', '.join(amenities) if amenities else 'None',
+        'Nearby_Features': ', '.join(proximity) if proximity else 'None',
+        'Selling_Points': ', '.join(selling_points) if selling_points else 'None',
+        'Views_Facing': ', '.join(views) if views else 'Not Specified',
+
+        # Quality Assessment
+        'Quality_Score': metrics['Quality_Score'],
+        'Quality_Rating': metrics['Quality_Rating'],
+        'Quality_Out_Of_100': metrics['Quality_Out_Of_100'],
+
+        # Locality Insights
+        'Locality_Avg_Price': metrics['Locality_Avg_Price'],
+        'Locality_Character': metrics['Locality_Character'],
+        'Locality_Description': metrics['Locality_Description'],
+        'Ideal_For': metrics['Ideal_For'],
+
+        # Investment Metrics
+        'Market_Position': metrics['Market_Position'],
+        'Price_vs_Market_Percent': metrics['Price_vs_Market_Percent'],
+        'Investment_Recommendation': metrics['Investment_Recommendation'],
+
+        # Processing Method
+        'AI_Model': 'Ollama' if brochure.get('ai_generated', False) else 'NLP Templates',
+        'Analysis_Type': 'AI-Generated' if brochure.get('ai_generated', False) else 'Template-Based',
+        'Content_Source': 'Ollama Local LLM' if brochure.get('ai_generated', False) else 'Smart Templates',
+        'Batch_Number': batch_number
+    }
+
+    return result
+
+
+class RunState:
+    """Persistent work queue and per-property completion journal of one run"""
+
+    def __init__(self, path: str = STATE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS journal (
+            property INTEGER PRIMARY KEY, status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0, error TEXT, finished_at TEXT)""")
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        self.conn.commit()
+
+    def bind(self, key: str, value: str) -> str:
+        """Record a setting of the run (dataset digest, format) on first use; returns the recorded value"""
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            return row[0]
+        self.conn.execute('INSERT INTO meta (key, value) VALUES (?, ?)', (key, value))
+        self.conn.commit()
+        return value
+
+    def enqueue(self, properties) -> int:
+        """Add properties not queued yet; returns how many were new"""
+        before = self.conn.total_changes
+        self.conn.executemany('INSERT OR IGNORE INTO journal (property) VALUES (?)',
+                              [(int(p),) for p in properties])
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def pending(self, limit: int = None) -> list:
+        """Queued properties not done yet (failed ones included), in dataset order"""
+        rows = self.conn.execute("SELECT property FROM journal WHERE status != 'done' AND property < ? "
+                                 "ORDER BY property", (limit if limit is not None else 2**62,)).fetchall()
+        return [row[0] for row in rows]
+
+    def mark(self, done: list, failed: dict = None):
+        """Journal a flushed chunk: done property ids, {failed id: error}"""
+        now = datetime.now().isoformat(timespec='seconds')
+        self.conn.executemany("UPDATE journal SET status = 'done', attempts = attempts + 1, error = NULL, "
+                              "finished_at = ? WHERE property = ?", [(now, int(p)) for p in done])
+        self.conn.executemany("UPDATE journal SET status = 'failed', attempts = attempts + 1, error = ? "
+                              "WHERE property = ?", [(err[:500], int(p)) for p, err in (failed or {}).items()])
+        self.conn.commit()
+
+    def counts(self) -> dict:
+        return dict(self.conn.execute('SELECT status, COUNT(*) FROM journal GROUP BY status').fetchall())
+
+    def close(self):
+        self.conn.close()
+
+
+def run_format(state_path: str = STATE_PATH) -> str:
+    """Output format of the current run (DEFAULT_FORMAT if there is none)"""
+    if not os.path.exists(state_path):
+        return DEFAULT_FORMAT
+    conn = sqlite3.connect(state_path)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+    except sqlite3.OperationalError:
+        row = None
+    finally:
+        conn.close()
+    return row[0] if row else DEFAULT_FORMAT
+
+
+def report_path(state_path: str = STATE_PATH, output_base: str = OUTPUT_BASE) -> str:
+    """Where the current run's report is (or will be) written"""
+    return ResultWriter(output_base, run_format(state_path)).path
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("--format parquet needs pyarrow (pip install pyarrow)") from None
+
+
+class ResultWriter:
+    """Appends result chunks to the run's single output table"""
+
+    def __init__(self, base: str = OUTPUT_BASE, fmt: str = DEFAULT_FORMAT):
+        self.fmt = fmt
+        self.path = base + ('.parquet' if fmt == 'parquet' else '.csv')
+
+    def written_ids(self) -> set:
+        """Property_IDs already in the output"""
+        if not os.path.exists(self.path):
+            return set()
+        if self.fmt == 'parquet':
+            return set(pd.read_parquet(self.path, columns=['Property_ID'])['Property_ID'])
+        return set(pd.read_csv(self.path, usecols=['Property_ID'], encoding='utf-8-sig')['Property_ID'])
+
+    def last_batch(self) -> int:
+        """Highest Batch_Number in the output (0 if empty), so a resumed run continues the numbering"""
+        if not os.path.exists(self.path):
+            return 0
+        if self.fmt == 'parquet':
+            batches = pd.read_parquet(self.path, columns=['Batch_Number'])['Batch_Number']
+        else:
+            batches = pd.read_csv(self.path, usecols=['Batch_Number'], encoding='utf-8-sig')['Batch_Number']
+        return int(batches.max()) if len(batches) else 0
+
+    def append(self, chunk: pd.DataFrame):
+        if self.fmt == 'parquet':
+            # Parquet files cannot be appended to: rewrite the one file and swap it in atomically
+            # (a few thousand report rows, so the rewrite stays in the milliseconds)
+            if os.path.exists(self.path):
+                chunk = pd.concat([pd.read_parquet(self.path), chunk], ignore_index=True)
+            tmp = self.path + '.tmp'
+            chunk.to_parquet(tmp, index=False)
+            os.replace(tmp, self.path)
+        else:
+            new = not os.path.exists(self.path)
+            chunk.to_csv(self.path, mode='a', header=new, index=False, encoding='utf-8-sig' if new else 'utf-8')
+
+    def read(self) -> pd.DataFrame:
+        if self.fmt == 'parquet':
+            return pd.read_parquet(self.path)
+        return pd.read_csv(self.path, encoding='utf-8-sig')
+
+
+def reset_run(state_path: str = STATE_PATH, output_base: str = OUTPUT_BASE):
+    """Delete the queue/journal and output of the previous run"""
+    for path in [state_path] + [ResultWriter(output_base, fmt).path for fmt in OUTPUT_FORMATS]:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def run(limit: int = None, workers: int = None, fresh: bool = False, fmt: str = None,
+        state_path: str = STATE_PATH, output_base: str = OUTPUT_BASE) -> dict:
+    """
+    Process every queued property that is not done yet
+
+    Args:
+        limit: Only the first `limit` properties of the dataset (None = all)
+        workers: Concurrent Ollama requests (default: $OLLAMA_MAX_IN_FLIGHT or 4)
+        fresh: Discard the previous run's journal and output first
+        fmt: 'csv' or 'parquet' (default: the unfinished run's format, else csv)
+
+    Returns:
+        Journal counts by status, plus the output path
+
+    Raises:
+        DatasetChangedError: The previous run was made on other data (and fresh is False)
+        ResumeError: fmt differs from the format of the unfinished run
+        ImportError: Parquet output without pyarrow
+    """
+    from src import nlp
+    from src.nlp.generation_engine import DEFAULT_MAX_IN_FLIGHT
+    from src.nlp.llm_client import get_client
+
+    if fmt == 'parquet':
+        _require_pyarrow()
+    if fresh:
+        reset_run(state_path, output_base)
+
+    state = RunState(state_path)
+    try:
+        digest = dataset_digest()
+        started_on = state.bind('dataset', digest)
+        if started_on != digest:
+            raise DatasetChangedError(f"the dataset changed since this run started ({started_on} -> {digest}); "
+                                      f"its progress no longer matches the rows - start over with --fresh")
+        run_fmt = state.bind('format', fmt or DEFAULT_FORMAT)
+        if fmt and fmt != run_fmt:
+            raise ResumeError(f"this run writes {run_fmt} - resume it with --format {run_fmt} "
+                              f"or start over with --fresh")
+        fmt = run_fmt
+        if fmt == 'parquet':
+            _require_pyarrow()
+    except (ResumeError, ImportError):
+        state.close()
+        raise
+
+    print("\n📂 Loading dataset...")
+    df = load_properties()
+    limit = len(df) if limit is None else min(limit, len(df))
+
+    writer = ResultWriter(output_base, fmt)
+    added = state.enqueue(range(limit))
+    # Rows that reached the output but not the journal (crash in between) are done
+    written = writer.written_ids()
+    orphans = [p for p in state.pending(limit) if p in written]
+    if orphans:
+        state.mark(orphans)
+    todo = state.pending(limit)
+    print(f"📋 Queue: {limit} properties | {added} newly queued | {limit - len(todo)} already done | "
+          f"{len(todo)} to process")
+    if not todo:
+        counts = state.counts()
+        state.close()
+        return {**counts, 'output': writer.path}
+
+    # Initialize NLP modules with Ollama AI
+    print("\n🔧 Initializing AI modules...")
+    extractor = nlp.AmenityExtractor()
+    llm_client = get_client()
+    use_ai = llm_client.available()
+    if use_ai:
+        print("🤖 Using Ollama AI for content generation (100% Local & Private)")
+    else:
+        print("💡 Tip: Start Ollama to use AI generation")
+        print("   1. Add to PATH: $env:PATH += ';$env:LOCALAPPDATA\\Programs\\Ollama'")
+        print("   2. Check models: ollama list")
+        print("   3. Pull model if needed: ollama pull llama2")
+        print("   Using advanced NLP templates")
+    brochure_gen = nlp.PropertyBrochureGenerator(use_ollama=use_ai, ollama_model='llama2',
+                                                 max_in_flight=workers or DEFAULT_MAX_IN_FLIGHT)
+    scorer = nlp.DescriptionQualityScorer()
+    analyzer = nlp.LocalityAnalyzer()
+    print("✅ Modules Ready")
+
+    start = time.perf_counter()
+    rows = df.iloc[todo]
+    # Everything but the text, for all pending properties at once
+    metrics = buyer_metrics(rows, analyzer, scorer).to_dict('index')
+    properties = rows.to_dict('index')
+    # Brochures are generated concurrently, a few properties ahead of the loop
+    brochures = brochure_gen.generate_brochures(properties.values())
+
+    chunk_number = writer.last_batch()
+    results, done, failed = [], [], {}
+
+    def flush():
+        nonlocal results, done, failed
+        if results:
+            writer.append(pd.DataFrame(results))
+        state.mark(done, failed)
+        results, done, failed = [], [], {}
+
+    try:
+        for (idx, prop_data), brochure in tqdm.tqdm(zip(properties.items(), brochures), total=len(properties),
+                                                    desc="Properties"):
+            if not results and not failed:
+                chunk_number += 1
+            try:
+                # A property whose brochure failed is journaled as failed; the run goes on
+                if isinstance(brochure, Exception):
+                    raise brochure
+                results.append(analyze_property(idx, prop_data, brochure, metrics[idx], extractor, chunk_number))
+                done.append(idx)
+            except Exception as e:
+                print(f"\n⚠️  Error processing property {idx}: {e}")
+                failed[idx] = str(e)
+            if len(done) + len(failed) >= CHUNK_SIZE:
+                flush()
+        flush()
+    except KeyboardInterrupt:
+        print("\n⏸️  Interrupted - finished chunks are saved; run again to resume")
+    finally:
+        brochure_gen.engine.close()
+        counts = state.counts()
+        state.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"\n⏱️  {len(todo)} properties attempted in {elapsed:.1f}s")
+    llm_client.stats.report('Ollama calls')
+    if brochure_gen.cache is not None:
+        brochure_gen.cache.report()
+    return {**counts, 'output': writer.path}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate buyer reports for the whole dataset, resumably')
+    parser.add_argument('--limit', type=int, default=None, help='Only the first N properties (default: all)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Concurrent Ollama requests (default: $OLLAMA_MAX_IN_FLIGHT or 4)')
+    parser.add_argument('--fresh', action='store_true', help='Discard the previous run and start over')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default=None,
+                        help=f"Report file format (default: {DEFAULT_FORMAT}, or the format of the run being resumed)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    print("=" * 80)
+    print("BUYER REPORT BATCH RUN")
+    print("=" * 80)
+    try:
+        counts = run(limit=args.limit, workers=args.workers, fresh=args.fresh, fmt=args.format)
+    except ResumeError as e:
+        print(f"❌ Cannot resume: {e}")
+        return 2
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 2
+    print(f"\n📊 Journal: {counts.get('done', 0)} done | {counts.get('failed', 0)} failed | "
+          f"{counts.get('pending', 0)} pending")
+    print(f"💾 Results: {counts['output']}")
+    print("=" * 80)
+    return 1 if counts.get('failed') else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
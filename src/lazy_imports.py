@@ -0,0 +1,37 @@
+"""
+LAZY IMPORTS
+Heavy libraries (pandas, requests, tqdm, the boosters) are bound at module
+level as placeholders that import the real module on first attribute access.
+Menus and --help therefore appear before any of them has loaded, and a
+feature pays for a library only when it runs.
+
+Usage:
+    from src.lazy_imports import lazy_import
+    pd = lazy_import('pandas')      # nothing imported yet
+    pd.read_csv(path)               # pandas is imported here
+
+Annotations that name lazy modules (e.g. -> pd.DataFrame) must not be
+evaluated at definition time: use `from __future__ import annotations`.
+"""
+import importlib.util
+import sys
+
+
+def lazy_import(name: str):
+    """
+    Module placeholder that executes `name` on first attribute access
+
+    Returns the real module if it is already imported, so there is no cost
+    once anything else has loaded it.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
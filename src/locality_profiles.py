@@ -0,0 +1,265 @@
+"""
+LOCALITY PROFILE STORE
+Stats, popular BHK sizes, common amenities, target audience and personality of
+every locality, built in one pass over the market aggregates and stored as a
+small JSON file keyed by locality. The chatbot, the Q&A system and the brochure
+generator read profiles from it instead of analyzing listings per question;
+LocalityAnalyzer applies the same rules to one locality at a time.
+
+Usage:
+    from src.locality_profiles import load_profiles
+    profiles = load_profiles()                 # built on first use, then read from disk
+    profiles['Bopal']['personality']['personality']
+    profiles['Bopal']['target_audience']
+
+Files:
+    data/aggregates/<dataset>_profiles.json - profiles + digest of the source file; rebuilt
+                                              when the source changes or SCHEMA_VERSION is bumped
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.aggregates import AGGREGATES_DIR, CLEANED_PATH, file_digest, load_aggregates
+
+SCHEMA_VERSION = 2
+
+
+def locality_stats(locality: str, row) -> Dict:
+    """Statistical summary from a locality's row of the aggregates' locality table"""
+    return {
+        'locality': locality,
+        'total_properties': int(row['count']),
+        'avg_price_lakhs': round(row['price_mean'], 2),
+        'median_price_lakhs': round(row['price_median'], 2),
+        'min_price_lakhs': round(row['price_min'], 2),
+        'max_price_lakhs': round(row['price_max'], 2),
+        'avg_area_sqft': round(row['area_mean'], 0),
+        'median_area_sqft': round(row['area_median'], 0),
+        'locality_tier': row['tier'] if 'tier' in row.index else 'Unknown'
+    }
+
+
+def common_bhk(bhk_counts, total: int) -> List[tuple]:
+    """Top 3 (BHK, count, % of listings) from (BHK, count) rows, most common first"""
+    result = []
+    for bhk, count in bhk_counts.head(3).itertuples(index=False):
+        percentage = (count / total) * 100
+        result.append((int(bhk), int(count), round(percentage, 1)))
+    return result
+
+
+def common_amenities(avg_amenities) -> List[str]:
+    """Typical amenities for a locality's average Amenities_Count (None: not recorded)"""
+    if avg_amenities is None:
+        return []
+    if avg_amenities >= 4:
+        return ['Gym', 'Swimming Pool', 'Security', 'Parking', 'Garden', 'Clubhouse']
+    elif avg_amenities >= 2:
+        return ['Security', 'Parking', 'Lift', 'Power Backup']
+    else:
+        return ['Basic Security', 'Parking']
+
+
+def target_audience(bhk_mode, avg_price: float, apartment_share: float = None) -> List[str]:
+    """Buyer groups from the most common BHK, the average price and the share of apartments"""
+    audience = []
+
+    # Check BHK distribution
+    if bhk_mode >= 4:
+        audience.append('Large Families')
+    elif bhk_mode == 3:
+        audience.append('Families')
+    elif bhk_mode == 2:
+        audience.append('Small Families / Working Professionals')
+    else:
+        audience.append('Students / Bachelors')
+
+    # Check price range
+    if avg_price >= 100:
+        audience.append('High-Income Buyers')
+    elif avg_price >= 60:
+        audience.append('Upper-Middle Class')
+    elif avg_price >= 40:
+        audience.append('Middle Class')
+    else:
+        audience.append('Budget Buyers')
+
+    # Check property type
+    if apartment_share is not None:
+        if apartment_share > 0.8:
+            audience.append('Apartment Seekers')
+        elif apartment_share < 0.3:
+            audience.append('Independent House Seekers')
+
+    return audience
+
+
+def locality_personality(stats: Dict, avg_amenities: float) -> Dict:
+    """Character tags and description from a locality's stats and average amenities count"""
+    avg_price = stats['avg_price_lakhs']
+    tier = stats['locality_tier']
+    property_count = stats['total_properties']
+
+    personality = []
+    description_parts = []
+
+    # Price-based personality
+    if tier == 'Tier 1' or avg_price >= 100:
+        personality.append('Premium')
+        description_parts.append('high-end residential area')
+    elif tier == 'Tier 2' or avg_price >= 50:
+        personality.append('Mid-Range')
+        description_parts.append('well-established residential locality')
+    else:
+        personality.append('Budget-Friendly')
+        description_parts.append('affordable housing option')
+
+    # Activity level
+    if property_count >= 100:
+        personality.append('Highly Active')
+        description_parts.append('high market activity')
+    elif property_count >= 50:
+        personality.append('Active')
+        description_parts.append('good market activity')
+    else:
+        personality.append('Emerging')
+        description_parts.append('developing area')
+
+    # Amenities level
+    if avg_amenities >= 4:
+        personality.append('Amenity-Rich')
+        description_parts.append('excellent amenities')
+    elif avg_amenities >= 2:
+        personality.append('Well-Facilitated')
+        description_parts.append('good basic facilities')
+
+    # Size preference
+    avg_area = stats['avg_area_sqft']
+    if avg_area >= 1500:
+        personality.append('Spacious')
+        description_parts.append('larger properties')
+    elif avg_area >= 1000:
+        personality.append('Comfortable')
+        description_parts.append('moderately-sized properties')
+    else:
+        personality.append('Compact')
+        description_parts.append('compact living spaces')
+
+    return {
+        'personality': ' & '.join(personality),
+        'description': f"A {', '.join(description_parts)}",
+        'character_tags': personality
+    }
+
+
+def build_all_profiles(agg) -> Dict[str, Dict]:
+    """
+    Profiles of every locality from one set of market aggregates
+
+    The aggregates hold each locality's stats, BHK counts, modal BHK, mean
+    amenities and apartment share (one groupby pass over the listings), so
+    this only applies the profile rules to ~100 rows.
+
+    Args:
+        agg: MarketAggregates of the listings
+
+    Returns:
+        {locality: {'stats', 'common_bhk', 'amenities', 'target_audience', 'personality'}},
+        most active locality first
+    """
+    table = agg.locality
+    bhk_rows = dict(iter(agg.locality_bhk.groupby('Locality', sort=False)[['BHK', 'count']]))
+    has_amenities = 'amenities_mean' in table.columns
+    has_type = 'apartment_share' in table.columns
+
+    profiles = {}
+    for locality in table.index:
+        # .loc keeps the numpy scalars; iterrows upcasts them to Python floats, which round
+        # differently at .xx5 ties than LocalityAnalyzer does
+        row = table.loc[locality]
+        stats = locality_stats(locality, row)
+        avg_amenities = row['amenities_mean'] if has_amenities else None
+        # No BHK recorded at all: assume 2, like Series.mode() coming back empty
+        bhk_mode = row['bhk_mode'] if row['bhk_mode'] == row['bhk_mode'] else 2
+        profiles[locality] = {
+            'stats': stats,
+            'common_bhk': common_bhk(bhk_rows[locality], row['count']) if locality in bhk_rows else [],
+            'amenities': common_amenities(avg_amenities),
+            'target_audience': target_audience(bhk_mode, row['price_mean'],
+                                               row['apartment_share'] if has_type else None),
+            'personality': locality_personality(stats, avg_amenities if has_amenities else 0),
+        }
+    return profiles
+
+
+def profiles_path(data_path: str, exclude_unknown: bool = True) -> str:
+    name = os.path.splitext(os.path.basename(data_path))[0]
+    return os.path.join(AGGREGATES_DIR, name + ('' if exclude_unknown else '_all') + '_profiles.json')
+
+
+def _to_json(value):
+    """numpy scalars -> Python numbers for json.dump"""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+# Loaded profiles per (source file, digest), shared by every reader in the process
+_loaded = {}
+
+
+def load_profiles(data_path: str = CLEANED_PATH, exclude_unknown: bool = True, df=None) -> Dict[str, Dict]:
+    """
+    Locality profiles of a listings file, rebuilt only when the file has changed
+
+    Reading a current store needs neither pandas nor the listings themselves.
+
+    Args:
+        data_path: Listings CSV the profiles describe
+        exclude_unknown: Drop the 'Unknown' locality bucket first (as the NLP modules do)
+        df: The file's frame if the caller has already loaded (and filtered) it
+
+    Returns:
+        {locality: profile} - see build_all_profiles
+    """
+    digest = file_digest(data_path)
+    key = (data_path, exclude_unknown)
+    if key in _loaded and _loaded[key][0] == digest:
+        return _loaded[key][1]
+
+    path = profiles_path(data_path, exclude_unknown)
+    profiles = None
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get('schema') == SCHEMA_VERSION and payload.get('digest') == digest:
+            profiles = payload['profiles']
+            for profile in profiles.values():
+                profile['common_bhk'] = [tuple(entry) for entry in profile['common_bhk']]
+    if profiles is None:
+        profiles = build_all_profiles(load_aggregates(data_path, exclude_unknown, df=df))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'schema': SCHEMA_VERSION, 'digest': digest, 'profiles': profiles}, f,
+                      ensure_ascii=False, default=_to_json)
+        print(f"📦 Built {len(profiles)} locality profiles -> {path}")
+    _loaded[key] = (digest, profiles)
+    return profiles
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 80)
+    print("LOCALITY PROFILE STORE")
+    print("=" * 80)
+    start = time.perf_counter()
+    profiles = load_profiles()
+    print(f"✅ {len(profiles)} profiles ready in {(time.perf_counter() - start) * 1000:.1f}ms")
+    for locality, profile in list(profiles.items())[:3]:
+        print(f"\n📍 {locality}: {profile['personality']['personality']}")
+        print(f"   Ideal for: {', '.join(profile['target_audience'])}")
+    print("=" * 80)
@@ -0,0 +1,164 @@
+"""
+NATIVE CATEGORICAL TRAINING
+Passes Locality, BHK_Area_Combo and the other categoricals to the gradient
+boosters as real categories instead of arbitrary label-encoded integers:
+- LightGBM: categorical_feature
+- CatBoost: cat_features
+- XGBoost:  enable_categorical (hist tree method)
+
+Run directly to benchmark both encodings:
+    python src/modeling/categorical.py
+"""
+import os
+import sys
+import pickle
+import time
+import pandas as pd
+import numpy as np
+from xgboost import XGBRegressor
+from lightgbm import LGBMRegressor
+from catboost import CatBoostRegressor
+
+
+def to_native_categoricals(X: pd.DataFrame, label_encoders: dict) -> pd.DataFrame:
+    """
+    Convert label-encoded columns back to pandas categoricals
+
+    The category levels come from the fitted LabelEncoders, so codes and
+    levels stay identical between the label-encoded and native frames.
+    """
+    X_native = X.copy()
+    for col, le in label_encoders.items():
+        if col in X_native.columns:
+            X_native[col] = pd.Categorical.from_codes(X_native[col].astype(int).values,
+                                                      categories=le.classes_)
+    return X_native
+
+
+def build_native_boosters(categorical_cols: list):
+    """
+    Booster definitions matching train_all.build_base_models, configured for
+    native categoricals
+
+    Returns:
+        (models, fit_params) - fit_params holds per-model fit kwargs
+    """
+    models = {
+        'XGBoost': XGBRegressor(n_estimators=500, learning_rate=0.05, max_depth=7, random_state=42, n_jobs=1,
+                                tree_method='hist', enable_categorical=True),
+        'LightGBM': LGBMRegressor(n_estimators=500, learning_rate=0.05, max_depth=7, random_state=42, n_jobs=1, verbose=-1),
+        'CatBoost': CatBoostRegressor(iterations=500, learning_rate=0.05, depth=7, random_state=42, verbose=0, thread_count=1,
+                                      cat_features=categorical_cols),
+    }
+    fit_params = {'LightGBM': {'categorical_feature': categorical_cols}}
+    return models, fit_params
+
+
+class NativeCategoricalModel:
+    """
+    Wraps a booster trained on native categoricals so it accepts the same
+    label-encoded frame as every other model (ensembles, predict.py)
+    """
+
+    def __init__(self, model, label_encoders: dict):
+        self.model = model
+        self.label_encoders = label_encoders
+
+    def predict(self, X):
+        return self.model.predict(to_native_categoricals(X, self.label_encoders))
+
+    @property
+    def feature_importances_(self):
+        return self.model.feature_importances_
+
+
+def model_size_kb(model) -> float:
+    """Serialized size of a fitted model"""
+    return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)) / 1024
+
+
+def predict_latency_ms(model, X, repeats: int = 20) -> float:
+    """Median wall time of model.predict(X) in milliseconds"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(X)
+        times.append(time.perf_counter() - start)
+    return float(np.median(times) * 1000)
+
+
+def benchmark_categorical_modes(X_train, X_test, y_train, y_test, label_encoders, categorical_cols,
+                                scheduler=None) -> pd.DataFrame:
+    """
+    Fit each booster with label encoding and with native categoricals and
+    compare fit time, model size, predict latency and accuracy
+
+    Args:
+        X_train, X_test: Label-encoded feature frames
+        scheduler: Optional TrainingScheduler used for the fits
+    """
+    from src.modeling.scheduler import TrainingScheduler
+    from src.modeling.train_all import build_base_models, evaluate
+
+    scheduler = scheduler or TrainingScheduler()
+    X_train_native = to_native_categoricals(X_train, label_encoders)
+    X_test_native = to_native_categoricals(X_test, label_encoders)
+
+    label_models = {name: model for name, model in build_base_models().items()
+                    if name in ('XGBoost', 'LightGBM', 'CatBoost')}
+    native_models, native_fit_params = build_native_boosters(categorical_cols)
+
+    tasks = {}
+    inputs = {}
+    fit_params = {}
+    for name, model in label_models.items():
+        tasks[f'{name} (label)'] = model
+        inputs[f'{name} (label)'] = 'label'
+    for name, model in native_models.items():
+        tasks[f'{name} (native)'] = model
+        inputs[f'{name} (native)'] = 'native'
+        if name in native_fit_params:
+            fit_params[f'{name} (native)'] = native_fit_params[name]
+
+    fitted = scheduler.run(tasks, {'label': X_train, 'native': X_train_native}, y_train,
+                           fit_params=fit_params, inputs=inputs)
+    fit_seconds = {t['Model']: t['Fit_Seconds'] for t in scheduler.timings}
+
+    rows = []
+    for task_name, model in fitted.items():
+        X_eval = X_test_native if inputs[task_name] == 'native' else X_test
+        mae, rmse, r2 = evaluate(y_test, model.predict(X_eval))
+        name, mode = task_name.split(' (')
+        rows.append({
+            'Model': name,
+            'Encoding': mode.rstrip(')'),
+            'Fit_Seconds': round(fit_seconds[task_name], 3),
+            'Model_KB': round(model_size_kb(model), 1),
+            'Predict_Batch_ms': round(predict_latency_ms(model, X_eval), 3),
+            'Predict_Row_ms': round(predict_latency_ms(model, X_eval.iloc[:1]), 3),
+            'R2': r2,
+            'RMSE': rmse,
+            'MAE': mae,
+        })
+    return pd.DataFrame(rows).sort_values(['Model', 'Encoding']).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from sklearn.model_selection import train_test_split
+    from src.modeling.train_all import load_training_data, categorical_cols
+
+    print("\n" + "="*80)
+    print("📊 NATIVE CATEGORICALS vs LABEL ENCODING")
+    print("="*80)
+
+    X, y, label_encoders = load_training_data()
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    print("\n🎯 Fitting boosters in both modes...\n")
+    report = benchmark_categorical_modes(X_train, X_test, y_train, y_test, label_encoders, categorical_cols)
+
+    print("\n" + report.to_string(index=False))
+    report.to_csv('reports/categorical_benchmark.csv', index=False)
+    print("\n💾 Report saved: reports/categorical_benchmark.csv")
+    print("="*80)
@@ -0,0 +1,160 @@
+"""
+COMPILED TREE ENSEMBLE - STANDALONE INFERENCE ENGINE
+Evaluates tree models exported by tree_export.py using only NumPy.
+No xgboost / lightgbm / catboost / sklearn import is needed to predict.
+
+Layout (one directory per compiled model):
+    model.json        - groups, feature names, source model digest
+    feature.npy       - split feature per node (int32)
+    threshold.npy     - split threshold per node (float64)
+    left.npy          - left child id; the right child is always left + 1
+                        (leaves point to themselves and have a NaN threshold)
+    default_left.npy  - direction taken by missing values (bool)
+    value.npy         - leaf value per node (float64, 0 for internal nodes)
+    roots.npy         - root node id per tree (int32)
+    tree_weight.npy   - multiplier applied to each tree's leaf value
+
+A group is the trees of one source model: one split rule ('lt': x < t goes
+left, 'le': x <= t goes left), the input precision the library compares in,
+and the precision it sums leaf values in. Prediction is
+    sum over groups of weight * (bias + sum over trees of tree_weight * leaf value)
+where weight is the model's weight inside a Voting/Weighted ensemble.
+
+Groups may feed different outputs (an interval model compiles the point
+model as output 0 and its quantile models as further outputs, listed in
+meta['outputs']). predict() evaluates output 0 only; predict_all() returns
+every output from the same pass over the rows.
+"""
+import hashlib
+import json
+import os
+import numpy as np
+
+ARRAY_NAMES = ['feature', 'threshold', 'left', 'default_left', 'value', 'roots', 'tree_weight']
+
+
+class CompiledModel:
+    """Vectorized traversal of flattened tree arrays"""
+
+    # Rows evaluated per chunk; keeps the (rows x trees) node vector cache-sized
+    chunk_rows = 256
+
+    def __init__(self, arrays: dict, meta: dict):
+        self.meta = meta
+        self.groups = meta['groups']
+        self.feature_names = meta.get('feature_names')
+        self.outputs = meta.get('outputs', ['prediction'])
+        for name in ARRAY_NAMES:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: str = 'r'):
+        """
+        Load a compiled model directory
+
+        Args:
+            mmap_mode: 'r' maps the node arrays read-only, so every process
+                serving the same model shares one copy in the page cache.
+                None reads a private copy.
+        """
+        with open(os.path.join(directory, 'model.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode)
+                  for name in ARRAY_NAMES}
+        return cls(arrays, meta)
+
+    def save(self, directory: str):
+        """Write arrays as uncompressed .npy files plus model.json"""
+        os.makedirs(directory, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(getattr(self, name)))
+        with open(os.path.join(directory, 'model.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f, indent=2)
+
+    def _as_matrix(self, X) -> np.ndarray:
+        if hasattr(X, 'columns') and self.feature_names:
+            X = X[self.feature_names]
+        return np.asarray(X, dtype=np.float64)
+
+    def _predict_group(self, group: dict, X: np.ndarray) -> np.ndarray:
+        # Round inputs to the precision the source library compares in
+        Xg = X.astype(group['dtype']).astype(np.float64)
+        roots = self.roots[group['tree_start']:group['tree_end']]
+        weights = self.tree_weight[group['tree_start']:group['tree_end']]
+        n_rows, n_trees = Xg.shape[0], len(roots)
+
+        # One flat (rows x trees) node vector; x values are gathered from the
+        # flattened input through a per-row offset
+        flat = Xg.ravel()
+        row_offset = np.repeat(np.arange(n_rows, dtype=np.int64) * Xg.shape[1], n_trees)
+        node = np.tile(roots, n_rows)
+        has_missing = np.isnan(flat).any()
+
+        for _ in range(group['max_depth']):
+            x = flat.take(row_offset + self.feature.take(node))
+            threshold = self.threshold.take(node)
+            # Comparisons with NaN are False, so leaves (NaN threshold) stay put
+            go_right = x >= threshold if group['decision'] == 'lt' else x > threshold
+            if has_missing:
+                go_right = np.where(np.isnan(x), ~self.default_left.take(node), go_right)
+            node = self.left.take(node) + go_right
+
+        leaves = self.value.take(node).reshape(n_rows, n_trees) * weights
+        if group['accumulate'] == 'float32':
+            # Same running float32 sum as the library: bias first, then tree by tree
+            terms = np.empty((n_rows, n_trees + 1), dtype=np.float32)
+            terms[:, 0] = group['bias']
+            terms[:, 1:] = leaves
+            total = np.add.accumulate(terms, axis=1)[:, -1]
+            return group['weight'] * total.astype(np.float64)
+        return group['weight'] * (group['bias'] + leaves.sum(axis=1))
+
+    def _evaluate(self, X, outputs: list) -> np.ndarray:
+        X = self._as_matrix(X)
+        out = np.zeros((len(outputs), len(X)), dtype=np.float64)
+        groups = [(outputs.index(g.get('output', 0)), g) for g in self.groups if g.get('output', 0) in outputs]
+        for start in range(0, len(X), self.chunk_rows):
+            chunk = X[start:start + self.chunk_rows]
+            for i, group in groups:
+                out[i, start:start + len(chunk)] += self._predict_group(group, chunk)
+        return out
+
+    def predict(self, X) -> np.ndarray:
+        return self._evaluate(X, [0])[0]
+
+    def predict_all(self, X) -> np.ndarray:
+        """Every output as an (outputs x rows) array"""
+        return self._evaluate(X, list(range(len(self.outputs))))
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_compiled(directory: str, source: str = None, mmap_mode: str = 'r'):
+    """
+    Load a compiled model if it exists and was compiled from `source`
+
+    Returns:
+        CompiledModel, or None if missing or compiled from a different pickle
+    """
+    if not os.path.exists(os.path.join(directory, 'model.json')):
+        return None
+    compiled = CompiledModel.load(directory, mmap_mode=mmap_mode)
+    if source is not None:
+        recorded = compiled.meta.get('source', {}).get('sha256')
+        if not os.path.exists(source) or recorded != file_sha256(source):
+            return None
+    return compiled
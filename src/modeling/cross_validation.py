@@ -0,0 +1,208 @@
+"""
+K-FOLD CROSS-VALIDATED MODEL EVALUATION
+- Every base model is fitted on K folds, all folds running in parallel
+- Fold indices are cached per dataset version so every run uses the same splits
+- Out-of-fold (OOF) predictions are cached per model config; the Voting and
+  Weighted ensembles are scored from base-model OOF predictions (no refits)
+
+Usage:
+    python src/modeling/cross_validation.py              # 5 folds
+    python src/modeling/cross_validation.py --folds 10 --tuned
+
+Writes:
+    reports/cv_model_comparison.csv - mean/std of R², RMSE, MAE per model
+    reports/cv_fold_scores.csv      - per-fold scores
+    reports/cv/                     - cached fold indices and OOF predictions
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.model_selection import KFold
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.modeling.scheduler import TrainingScheduler
+
+CV_CACHE_DIR = 'reports/cv'
+VOTING_MEMBERS = ['XGBoost', 'LightGBM', 'CatBoost']
+
+
+def dataset_digest(X: pd.DataFrame, y: pd.Series) -> str:
+    """Content hash of the training frame, used to version cached folds"""
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+    h.update(pd.util.hash_pandas_object(y, index=False).values.tobytes())
+    return h.hexdigest()[:16]
+
+
+def model_fingerprint(model) -> str:
+    """Hash of a model's class and parameters (thread settings excluded)"""
+    params = {k: v for k, v in model.get_params().items()
+              if k not in ('n_jobs', 'thread_count', 'verbose')}
+    payload = type(model).__name__ + json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+class CrossValidator:
+    """Cross-validate base models and ensembles with cached folds and OOF predictions"""
+
+    def __init__(self, X: pd.DataFrame, y: pd.Series, n_folds: int = 5, seed: int = 42,
+                 cache_dir: str = CV_CACHE_DIR, scheduler: TrainingScheduler = None):
+        self.X = X.reset_index(drop=True)
+        self.y = y.reset_index(drop=True)
+        self.n_folds = n_folds
+        self.seed = seed
+        self.scheduler = scheduler or TrainingScheduler()
+        self.cache_dir = os.path.join(cache_dir, f"{dataset_digest(self.X, self.y)}_k{n_folds}_s{seed}")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.fold_of_row = self._load_or_create_folds()
+
+    def _load_or_create_folds(self) -> np.ndarray:
+        """Fold id for every row, cached so repeated runs share the same splits"""
+        path = os.path.join(self.cache_dir, 'folds.npy')
+        if os.path.exists(path):
+            return np.load(path)
+        fold_of_row = np.empty(len(self.X), dtype=np.int16)
+        kfold = KFold(n_splits=self.n_folds, shuffle=True, random_state=self.seed)
+        for fold, (_, test_idx) in enumerate(kfold.split(self.X)):
+            fold_of_row[test_idx] = fold
+        np.save(path, fold_of_row)
+        return fold_of_row
+
+    def folds(self):
+        """Yield (train_idx, test_idx) for every fold"""
+        for fold in range(self.n_folds):
+            yield np.flatnonzero(self.fold_of_row != fold), np.flatnonzero(self.fold_of_row == fold)
+
+    def _oof_path(self, name: str, model) -> str:
+        slug = name.lower().replace(' ', '_')
+        return os.path.join(self.cache_dir, f"oof_{slug}_{model_fingerprint(model)}.npy")
+
+    def out_of_fold_predictions(self, models: dict) -> dict:
+        """
+        OOF predictions for every model, fitting only (model, fold) pairs that
+        are not cached yet. All missing fits run in one parallel batch.
+
+        Returns:
+            {name: array of len(X)}
+        """
+        oof = {}
+        missing = {}
+        for name, model in models.items():
+            path = self._oof_path(name, model)
+            if os.path.exists(path):
+                oof[name] = np.load(path)
+                print(f"  {name:20} ♻️  cached OOF predictions")
+            else:
+                missing[name] = model
+
+        if missing:
+            fold_ids = list(self.folds())
+            X_folds = {f'fold{i}': self.X.iloc[train_idx] for i, (train_idx, _) in enumerate(fold_ids)}
+            y_folds = {f'fold{i}': self.y.iloc[train_idx] for i, (train_idx, _) in enumerate(fold_ids)}
+            tasks, inputs = {}, {}
+            for name, model in missing.items():
+                for i in range(self.n_folds):
+                    task = f'{name} | fold {i + 1}'
+                    tasks[task] = clone(model)
+                    inputs[task] = f'fold{i}'
+
+            fitted = self.scheduler.run(tasks, X_folds, y_folds, inputs=inputs)
+
+            for name, model in missing.items():
+                preds = np.empty(len(self.X))
+                for i, (_, test_idx) in enumerate(fold_ids):
+                    preds[test_idx] = fitted[f'{name} | fold {i + 1}'].predict(self.X.iloc[test_idx])
+                np.save(self._oof_path(name, model), preds)
+                oof[name] = preds
+
+        return {name: oof[name] for name in models}
+
+    def fold_scores(self, name: str, preds: np.ndarray) -> list:
+        """R², RMSE and MAE of OOF predictions on each fold"""
+        from src.modeling.train_all import evaluate
+        rows = []
+        for fold, (_, test_idx) in enumerate(self.folds()):
+            mae, rmse, r2 = evaluate(self.y.iloc[test_idx], preds[test_idx])
+            rows.append({'Model': name, 'Fold': fold + 1, 'R2': r2, 'RMSE': rmse, 'MAE': mae})
+        return rows
+
+    def evaluate(self, models: dict):
+        """
+        Cross-validate base models plus the Voting and Weighted ensembles
+
+        Returns:
+            (summary DataFrame sorted by mean R², per-fold DataFrame)
+        """
+        oof = self.out_of_fold_predictions(models)
+
+        # Voting Ensemble: mean of the boosters' OOF predictions
+        if all(name in oof for name in VOTING_MEMBERS):
+            oof['Voting Ensemble'] = np.mean([oof[name] for name in VOTING_MEMBERS], axis=0)
+
+        fold_rows = []
+        for name, preds in oof.items():
+            fold_rows.extend(self.fold_scores(name, preds))
+        cv_r2 = pd.DataFrame(fold_rows).groupby('Model')['R2'].mean()
+
+        # Weighted Ensemble: best 3 by CV R², weighted by CV R² (as in train_all.py)
+        top3 = cv_r2.sort_values(ascending=False).head(3)
+        weights = top3.values / top3.values.sum()
+        oof['Weighted Ensemble'] = np.tensordot(weights, np.stack([oof[name] for name in top3.index]), axes=1)
+        fold_rows.extend(self.fold_scores('Weighted Ensemble', oof['Weighted Ensemble']))
+        self.weighted_members = dict(zip(top3.index, weights))
+
+        folds_df = pd.DataFrame(fold_rows)
+        summary = folds_df.groupby('Model').agg(
+            CV_R2_mean=('R2', 'mean'), CV_R2_std=('R2', 'std'),
+            CV_RMSE_mean=('RMSE', 'mean'), CV_RMSE_std=('RMSE', 'std'),
+            CV_MAE_mean=('MAE', 'mean'), CV_MAE_std=('MAE', 'std'),
+        ).sort_values('CV_R2_mean', ascending=False).reset_index()
+        return summary, folds_df
+
+
+def print_summary(summary: pd.DataFrame, n_folds: int):
+    print("\n" + "="*80)
+    print(f"📊 {n_folds}-FOLD CROSS-VALIDATION (Sorted by mean R²)")
+    print("="*80)
+    for rank, row in enumerate(summary.itertuples(), 1):
+        print(f"#{rank:2d} {row.Model:20} | R²={row.CV_R2_mean:.4f}±{row.CV_R2_std:.4f} | "
+              f"RMSE={row.CV_RMSE_mean:6.2f}±{row.CV_RMSE_std:5.2f}L | MAE={row.CV_MAE_mean:6.2f}L")
+    print("="*80)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='K-fold cross-validation of all models')
+    parser.add_argument('--folds', type=int, default=5, help='Number of folds (K)')
+    parser.add_argument('--seed', type=int, default=42, help='Shuffle seed for the folds')
+    parser.add_argument('--workers', type=int, default=None, help='Maximum concurrent fits')
+    parser.add_argument('--tuned', action='store_true', help='Use configs from reports/tuned_params.json')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from src.modeling.train_all import load_training_data, build_base_models
+    from src.modeling.tuning import load_tuned_params
+
+    args = parse_args(argv)
+    X, y, _ = load_training_data()
+
+    cv = CrossValidator(X, y, n_folds=args.folds, seed=args.seed,
+                        scheduler=TrainingScheduler(max_workers=args.workers))
+    print(f"\n🎯 Cross-validating over {args.folds} folds (cache: {cv.cache_dir})...\n")
+    summary, folds_df = cv.evaluate(build_base_models(load_tuned_params() if args.tuned else None))
+
+    print_summary(summary, args.folds)
+    summary.to_csv('reports/cv_model_comparison.csv', index=False)
+    folds_df.to_csv('reports/cv_fold_scores.csv', index=False)
+    print("💾 Report saved: reports/cv_model_comparison.csv")
+    print("💾 Fold scores saved: reports/cv_fold_scores.csv")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
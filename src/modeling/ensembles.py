@@ -0,0 +1,105 @@
+"""
+ENSEMBLE MODELS
+Importable Voting and Weighted ensembles so pickled ensembles can be loaded
+by predict.py and any other consumer (not only the training script), and the
+interval model that serves a point model together with its quantile models.
+
+Member predictions run in parallel threads (the boosters and sklearn trees
+release the GIL while predicting) and are written into one preallocated
+(members x rows) buffer that is combined with a single weighted dot product.
+The thread pool is started on the first large batch; close() stops it (the
+registry does so when a newer version replaces a cached ensemble).
+"""
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from src.modeling.intervals import interval_bounds
+
+
+class WeightedEnsemble:
+    """Weighted average of fitted regressors"""
+
+    # Below this many rows thread dispatch costs more than it saves
+    min_parallel_rows = 256
+
+    def __init__(self, models, weights):
+        self.models = list(models)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self._pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._pool = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=len(self.models),
+                                            thread_name_prefix='ensemble')
+        return self._pool
+
+    def close(self):
+        """Stop the prediction threads (restarted if the ensemble predicts again)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        for member in self.models:
+            if isinstance(member, WeightedEnsemble):
+                member.close()
+
+    def member_predictions(self, X) -> np.ndarray:
+        """Predictions of every member as a (members x rows) array"""
+        out = np.empty((len(self.models), len(X)), dtype=np.float64)
+
+        def fill(i):
+            out[i] = self.models[i].predict(X)
+
+        if len(self.models) > 1 and len(X) >= self.min_parallel_rows:
+            list(self._executor().map(fill, range(len(self.models))))
+        else:
+            for i in range(len(self.models)):
+                fill(i)
+        return out
+
+    def predict(self, X) -> np.ndarray:
+        return self.weights @ self.member_predictions(X)
+
+
+class SimpleVoting(WeightedEnsemble):
+    """Unweighted mean of fitted regressors"""
+
+    def __init__(self, models):
+        models = list(models)
+        super().__init__(models, np.full(len(models), 1.0 / len(models)))
+
+
+class IntervalModel(WeightedEnsemble):
+    """
+    Point model plus quantile models (intervals.py). predict() is the point
+    model alone; predict_interval() runs all members in one batched call.
+    """
+
+    def __init__(self, point_model, quantile_models, quantiles, margin: float = 0.0):
+        models = [point_model] + list(quantile_models)
+        super().__init__(models, np.eye(len(models))[0])
+        self.quantiles = list(quantiles)
+        self.margin = float(margin)
+
+    @property
+    def point_model(self):
+        return self.models[0]
+
+    def predict(self, X) -> np.ndarray:
+        return self.point_model.predict(X)
+
+    def predict_interval(self, X) -> tuple:
+        """
+        Returns:
+            (point, lower, upper) arrays
+        """
+        preds = self.member_predictions(X)
+        lower, upper = interval_bounds(preds[0], preds[1:], self.margin)
+        return preds[0], lower, upper
@@ -0,0 +1,311 @@
+"""
+INCREMENTAL (WARM-START) RETRAINING
+- Finds newly scraped listings: cleaned rows whose content hash is not in the
+  enhanced training file yet
+- Folds them into the per-locality aggregates instead of recomputing them
+- Drift check: unseen categories, PSI of key numeric features and of the
+  price, or a delta too large relative to the training set -> full retrain
+- Otherwise XGBoost / LightGBM / CatBoost continue boosting from their
+  registered versions on the delta only (xgb_model / init_model), minus a
+  held-out slice of it. Each updated booster and each ensemble rebuilt around
+  them is scored on that slice against its previous version, and replaces it
+  (registered with the held-out scores) only if its RMSE did not get worse.
+  Other base models are kept as they are, and so are the interval model's
+  quantile models (only its point model is swapped).
+
+Usage:
+    python src/modeling/train_all.py --incremental
+    python src/modeling/train_all.py --incremental --incremental-rounds 100
+
+Writes:
+    data/training/training_data_enhanced.csv   - delta appended, Locality_* refreshed
+    data/training/locality_aggregates.json     - per-locality state
+    reports/incremental_runs.csv               - one row per run (delta size, decision, time)
+"""
+import os
+import sys
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.preprocessing.features import (row_hashes, price_categories, add_row_features,
+                                        LocalityAggregates, AGGREGATES_PATH)
+from src.modeling.ensembles import SimpleVoting, WeightedEnsemble, IntervalModel
+
+CLEANED_PATH = 'data/cleaned/cleaned_data.csv'
+TRAINING_PATH = 'data/training/training_data_enhanced.csv'
+RUN_LOG_PATH = 'reports/incremental_runs.csv'
+
+BOOSTERS = {'XGBoost': 'XGBRegressor', 'LightGBM': 'LGBMRegressor', 'CatBoost': 'CatBoostRegressor'}
+DRIFT_COLUMNS = ['BHK', 'Area_SqFt', 'Amenities_Count', 'Area_Per_BHK', 'Price_Lakhs']
+PSI_THRESHOLD = 0.25          # > 0.25 is the usual "significant shift" cut-off
+MAX_DELTA_FRACTION = 0.3      # larger deltas are cheaper to learn from scratch
+HOLDOUT_FRACTION = 0.2        # of the delta, scored but not learned from
+MIN_HOLDOUT_ROWS = 10         # smaller deltas are learned whole; metrics stay those of the last scored version
+
+
+def find_delta(cleaned: pd.DataFrame, training: pd.DataFrame) -> pd.DataFrame:
+    """Cleaned listings (valid localities) not yet present in the training file"""
+    cleaned = cleaned[cleaned['Locality'] != 'Unknown']
+    known = np.isin(row_hashes(cleaned), row_hashes(training))
+    return cleaned[~known].copy()
+
+
+def engineer_delta(delta: pd.DataFrame, training: pd.DataFrame, aggregates: LocalityAggregates):
+    """
+    Add engineered features to the delta and fold it into the locality state
+
+    Returns:
+        (updated training frame with the delta appended and Locality_* refreshed
+         for all rows, engineered delta)
+    """
+    delta = add_row_features(delta)
+    delta['Price_Category'] = price_categories(delta['Price_Lakhs'])
+    aggregates.update(delta)
+    delta = aggregates.apply(delta)[training.columns]
+    combined = aggregates.apply(pd.concat([training, delta], ignore_index=True))
+    return combined.sort_values('Price_Lakhs', ascending=False).reset_index(drop=True), delta
+
+
+def population_stability_index(expected, actual, bins: int = None) -> float:
+    """
+    PSI of `actual` against the quantile bins of `expected`. By default about
+    25 delta rows per bin (2-10 bins): with fewer, sampling noise alone pushes
+    PSI past the threshold on small daily deltas.
+    """
+    bins = bins or int(np.clip(len(actual) // 25, 2, 10))
+    edges = np.unique(np.quantile(expected, np.linspace(0, 1, bins + 1)))
+    if len(edges) < 3:
+        # (Near) constant feature: compare the shares of each distinct value
+        values = np.union1d(np.unique(expected), np.unique(actual))
+        e = np.array([(expected == v).mean() for v in values])
+        a = np.array([(actual == v).mean() for v in values])
+    else:
+        edges[0], edges[-1] = -np.inf, np.inf
+        e = np.histogram(expected, edges)[0] / len(expected)
+        a = np.histogram(actual, edges)[0] / len(actual)
+    e, a = np.clip(e, 1e-4, None), np.clip(a, 1e-4, None)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def check_drift(training: pd.DataFrame, delta: pd.DataFrame, label_encoders: dict, registry) -> dict:
+    """
+    Decide whether the delta can be learned incrementally
+
+    Returns:
+        {'full_retrain': bool, 'reasons': [...], 'psi': {col: psi}, 'unseen': {col: [values]}}
+    """
+    reasons = []
+    unseen = {}
+    for col, le in label_encoders.items():
+        new_values = sorted(set(delta[col].astype(str)) - set(le.classes_))
+        if new_values:
+            unseen[col] = new_values
+            reasons.append(f"unseen {col}: {', '.join(new_values[:5])}")
+
+    psi = {col: population_stability_index(training[col].values, delta[col].values) for col in DRIFT_COLUMNS}
+    reasons += [f"PSI {col}={value:.2f}" for col, value in psi.items() if value > PSI_THRESHOLD]
+
+    if len(delta) > MAX_DELTA_FRACTION * len(training):
+        reasons.append(f"delta is {len(delta) / len(training):.0%} of the training set")
+
+    for name, cls in BOOSTERS.items():
+        entry = registry.entry(name)
+        if entry is None:
+            reasons.append(f"no registered {name} to continue from")
+        elif entry['class'] != cls:
+            reasons.append(f"{name} is a {entry['class']} (native categorical) - not warm-startable")
+
+    return {'full_retrain': bool(reasons), 'reasons': reasons, 'psi': psi, 'unseen': unseen}
+
+
+def warm_start_fit_params(name: str, previous) -> dict:
+    """fit() kwargs that continue boosting from `previous`"""
+    if name == 'XGBoost':
+        return {'xgb_model': previous.get_booster()}
+    if name == 'LightGBM':
+        return {'init_model': previous.booster_}
+    return {'init_model': previous}
+
+
+def warm_start_boosters(registry, X_delta, y_delta, rounds: int, scheduler) -> tuple:
+    """
+    Add `rounds` boosting rounds fitted on the delta to every registered booster
+
+    Returns:
+        ({name: updated model}, {name: previous model})
+    """
+    from sklearn.base import clone
+    tasks, fit_params, previous = {}, {}, {}
+    for name in BOOSTERS:
+        previous[name] = registry.get(name, mmap_mode=None)
+        model = clone(previous[name])
+        model.set_params(**{'iterations' if name == 'CatBoost' else 'n_estimators': rounds})
+        tasks[name] = model
+        fit_params[name] = warm_start_fit_params(name, previous[name])
+    return scheduler.run(tasks, X_delta, y_delta, fit_params=fit_params), previous
+
+
+def holdout_split(n_rows: int) -> tuple:
+    """
+    Positions of the delta rows to learn from and to score on
+
+    Returns:
+        (fit positions, holdout positions) - no holdout if it would be under MIN_HOLDOUT_ROWS
+    """
+    n_holdout = int(n_rows * HOLDOUT_FRACTION)
+    if n_holdout < MIN_HOLDOUT_ROWS:
+        return np.arange(n_rows), np.arange(0)
+    order = np.random.default_rng(42).permutation(n_rows)
+    return np.sort(order[n_holdout:]), np.sort(order[:n_holdout])
+
+
+def swap_members(model, updated: dict):
+    """
+    Copy of an ensemble with members replaced by their updated versions (matched by class)
+
+    Returns the model itself if none of its members was updated.
+    """
+    if not isinstance(model, WeightedEnsemble):
+        return updated.get(type(model).__name__, model)
+    if isinstance(model, IntervalModel):
+        # Quantile models are LGBMRegressors too, but must not become the point LightGBM
+        point = swap_members(model.point_model, updated)
+        if point is model.point_model:
+            return model
+        return IntervalModel(point, model.models[1:], model.quantiles, model.margin)
+    members = [swap_members(member, updated) for member in model.models]
+    if all(new is old for new, old in zip(members, model.models)):
+        return model
+    if isinstance(model, SimpleVoting):
+        return SimpleVoting(members)
+    return WeightedEnsemble(members, model.weights)
+
+
+def log_run(row: dict, path: str = RUN_LOG_PATH):
+    log = pd.DataFrame([row])
+    if os.path.exists(path):
+        log = pd.concat([pd.read_csv(path), log], ignore_index=True)
+    log.to_csv(path, index=False)
+
+
+def run_incremental(scheduler, rounds: int = 50) -> bool:
+    """
+    Incremental retrain on newly scraped listings
+
+    Returns:
+        True if the models are up to date (nothing new, or warm-started),
+        False if the caller should run a full retrain on the updated training file
+    """
+    from src.modeling.registry import ModelRegistry
+    from src.modeling.train_all import feature_cols, evaluate, compile_best_model
+
+    start = time.perf_counter()
+    print("\n" + "="*80)
+    print("🔁 INCREMENTAL TRAINING")
+    print("="*80)
+
+    training = pd.read_csv(TRAINING_PATH)
+    delta = find_delta(pd.read_csv(CLEANED_PATH), training)
+    print(f"📂 Training rows: {len(training)} | New listings: {len(delta)}")
+    if delta.empty:
+        print("✅ Nothing new to learn - models are up to date")
+        return True
+
+    aggregates = LocalityAggregates.load(AGGREGATES_PATH) or LocalityAggregates.from_frame(training)
+    updated_training, delta = engineer_delta(delta, training, aggregates)
+    updated_training.to_csv(TRAINING_PATH, index=False)
+    aggregates.save(AGGREGATES_PATH)
+    print(f"💾 Appended {len(delta)} rows → {TRAINING_PATH} (locality aggregates updated)")
+
+    registry = ModelRegistry()
+    label_encoders = registry.encoders() if registry.manifest.get('encoders') else {}
+    drift = check_drift(training, delta, label_encoders, registry)
+    print("📈 PSI: " + ", ".join(f"{col}={value:.3f}" for col, value in drift['psi'].items()))
+
+    run = {'Timestamp': datetime.now().isoformat(timespec='seconds'), 'Training_Rows': len(training),
+           'Delta_Rows': len(delta), 'Max_PSI': max(drift['psi'].values())}
+    if drift['full_retrain'] or not label_encoders:
+        reasons = drift['reasons'] or ['no registered encoders']
+        print("⚠️  Full retrain required: " + "; ".join(reasons))
+        log_run({**run, 'Decision': 'full retrain', 'Reasons': '; '.join(reasons),
+                 'Seconds': time.perf_counter() - start})
+        return False
+
+    # Encode the delta with the registered encoders (no unseen values, checked above)
+    X_delta = delta[feature_cols].copy()
+    for col, le in label_encoders.items():
+        X_delta[col] = le.transform(X_delta[col].astype(str))
+    y_delta = delta['Price_Lakhs']
+    fit_rows, holdout_rows = holdout_split(len(delta))
+    X_fit, y_fit = X_delta.iloc[fit_rows], y_delta.iloc[fit_rows]
+    X_holdout, y_holdout = X_delta.iloc[holdout_rows], y_delta.iloc[holdout_rows]
+
+    def scores(model) -> dict:
+        mae, rmse, r2 = evaluate(y_holdout, model.predict(X_holdout))
+        return {'R2': r2, 'RMSE': rmse, 'MAE': mae}
+
+    print(f"\n🎯 Warm-starting boosters with {rounds} rounds on {len(fit_rows)} new listings "
+          + (f"({len(holdout_rows)} held out for scoring)...\n" if len(holdout_rows)
+             else "(too few to hold any out - scores carried over)...\n"))
+    updated, previous = warm_start_boosters(registry, X_fit, y_fit, rounds, scheduler)
+
+    # Boosters first, then the ensembles built on the accepted ones, then the interval model
+    # around the replaced point model; ranks stay as they were
+    order = sorted(registry.names(), key=lambda n: (n not in updated, bool(registry.entry(n).get('point_model'))))
+    accepted_by_class, replaced, kept = {}, {}, []
+    for name in order:
+        entry = registry.entry(name)
+        if name in updated:
+            old, model = previous[name], updated[name]
+        elif entry.get('point_model'):
+            if entry['point_model'] not in replaced:
+                continue
+            old = registry.get(name, mmap_mode=None)
+            model = IntervalModel(replaced[entry['point_model']], old.models[1:], old.quantiles, old.margin)
+        elif entry['class'] in ('WeightedEnsemble', 'SimpleVoting'):
+            old = registry.get(name, mmap_mode=None)
+            model = swap_members(old, accepted_by_class)
+            if model is old:
+                continue
+        else:
+            continue
+
+        extra = {'warm_start_of': entry['version'], 'delta_rows': int(len(fit_rows))}
+        if entry.get('point_model'):
+            # Same quantile models and margin: the coverage metrics still describe them
+            metrics = entry['metrics']
+            extra.update(point_model=entry['point_model'], quantiles=entry.get('quantiles'),
+                         point_version=registry.entry(entry['point_model'])['version'],
+                         metrics_from_version=entry.get('metrics_from_version', entry['version']))
+        elif len(holdout_rows):
+            before, metrics = scores(old), scores(model)
+            if metrics['RMSE'] > before['RMSE']:
+                kept.append(name)
+                print(f"  {name:20} v{entry['version']} kept | held-out RMSE {before['RMSE']:.2f}L → "
+                      f"{metrics['RMSE']:.2f}L after the update")
+                continue
+            extra.update(holdout_rows=int(len(holdout_rows)), holdout_metrics_before_update=before)
+        else:
+            # Nothing to score on: the manifest says whose scores these are
+            metrics = entry['metrics']
+            extra['metrics_from_version'] = entry.get('metrics_from_version', entry['version'])
+
+        new = registry.register(name, model, metrics, entry['features'], rank=entry['rank'], extra=extra)
+        replaced[name] = model
+        if name in updated:
+            accepted_by_class[BOOSTERS[name]] = model
+        detail = (f"held-out RMSE {extra['holdout_metrics_before_update']['RMSE']:.2f}L → {metrics['RMSE']:.2f}L"
+                  if 'holdout_rows' in extra else f"scores of v{extra['metrics_from_version']}")
+        print(f"  {name:20} v{entry['version']} → v{new['version']} | {detail}")
+
+    if replaced:
+        compile_best_model(registry)
+    seconds = time.perf_counter() - start
+    log_run({**run, 'Decision': 'warm start', 'Reasons': '', 'Holdout_Rows': len(holdout_rows),
+             'Updated': len(replaced), 'Kept_Previous': len(kept), 'Seconds': seconds})
+    print(f"\n✅ Incremental update done in {seconds:.1f}s (log: {RUN_LOG_PATH})")
+    print("="*80)
+    return True
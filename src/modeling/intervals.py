@@ -0,0 +1,161 @@
+"""
+PREDICTION INTERVALS - QUANTILE MODELS + CONFORMAL CALIBRATION
+- LightGBM quantile regressors for p10 / p50 / p90 are fitted on the training
+  split minus a calibration fold
+- The p10-p90 band is widened by a conformal margin (CQR) computed on the
+  calibration fold, so the 80% interval holds its coverage on unseen data
+- Only the p10 and p90 models are served, with the point model, by
+  IntervalModel (ensembles.py) in one batched call, and compiled into the same
+  array set; p50 is fitted for the pinball loss in the coverage report only
+
+Writes:
+    reports/interval_coverage.csv - coverage, width, pinball loss and latency
+"""
+from __future__ import annotations   # pd.DataFrame hints must not import pandas
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')   # only training writes the coverage report
+
+QUANTILES = [0.1, 0.5, 0.9]
+SERVED_QUANTILES = [QUANTILES[0], QUANTILES[-1]]   # the interval only needs its bounds
+INTERVAL_MODEL = 'Price Interval'        # registry name (unranked)
+COVERAGE_REPORT = 'reports/interval_coverage.csv'
+
+
+def quantile_label(q: float) -> str:
+    return f"p{int(round(q * 100))}"
+
+
+def interval_bounds(point, quantile_preds, margin: float = 0.0):
+    """
+    Lower/upper bounds from raw quantile predictions
+
+    Args:
+        point: Point predictions (rows,)
+        quantile_preds: Quantile predictions (quantiles x rows), lowest quantile first
+        margin: Conformal widening added on both sides
+    """
+    q = np.sort(np.asarray(quantile_preds), axis=0)  # undo quantile crossing
+    lower = np.minimum(q[0] - margin, point)
+    upper = np.maximum(q[-1] + margin, point)
+    return lower, upper
+
+
+def compiled_predict_interval(compiled, X) -> tuple:
+    """(point, lower, upper) from a compiled interval model, all outputs in one pass"""
+    preds = compiled.predict_all(X)
+    lower, upper = interval_bounds(preds[0], preds[1:], compiled.meta['interval']['margin'])
+    return preds[0], lower, upper
+
+
+def build_quantile_models(params: dict = None) -> dict:
+    """LightGBM quantile regressors keyed by label ('p10', ...), same shape as the point LightGBM"""
+    from lightgbm import LGBMRegressor
+    base = dict(n_estimators=500, learning_rate=0.05, max_depth=7, random_state=42, n_jobs=1, verbose=-1)
+    base.update(params or {})
+    return {quantile_label(q): LGBMRegressor(objective='quantile', alpha=q, **base) for q in QUANTILES}
+
+
+def conformal_margin(y_cal, lower, upper, coverage: float) -> float:
+    """CQR margin: the finite-sample (1-alpha) quantile of the conformity scores"""
+    y_cal = np.asarray(y_cal)
+    scores = np.maximum(lower - y_cal, y_cal - upper)
+    n = len(scores)
+    level = min(1.0, np.ceil((n + 1) * coverage) / n)
+    return float(np.quantile(scores, level, method='higher'))
+
+
+def pinball_loss(y, pred, q: float) -> float:
+    diff = np.asarray(y) - pred
+    return float(np.mean(np.maximum(q * diff, (q - 1) * diff)))
+
+
+def _latency_ms(fn, X, repeats: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(X)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def train_interval_model(scheduler, point_model, X_train, y_train, X_test, y_test, params: dict = None):
+    """
+    Fit quantile models, calibrate the interval and report coverage
+
+    Args:
+        point_model: Fitted model whose predictions the interval accompanies
+        params: Optional LightGBM params (e.g. tuned) applied to the quantile models
+
+    Returns:
+        (IntervalModel with the SERVED_QUANTILES models, coverage report DataFrame)
+    """
+    from sklearn.model_selection import train_test_split
+    from src.modeling.ensembles import IntervalModel
+
+    nominal = QUANTILES[-1] - QUANTILES[0]
+    X_fit, X_cal, y_fit, y_cal = train_test_split(X_train, y_train, test_size=0.2, random_state=42)
+    print(f"\n🎯 Training quantile models {', '.join(quantile_label(q) for q in QUANTILES)} "
+          f"(fit: {len(X_fit)}, calibration: {len(X_cal)})...\n")
+    fitted = scheduler.run(build_quantile_models(params), X_fit, y_fit)
+    served = [fitted[quantile_label(q)] for q in SERVED_QUANTILES]
+
+    raw = IntervalModel(point_model, served, SERVED_QUANTILES, margin=0.0)
+    _, cal_lower, cal_upper = raw.predict_interval(X_cal)
+    margin = conformal_margin(y_cal, cal_lower, cal_upper, nominal)
+    model = IntervalModel(point_model, served, SERVED_QUANTILES, margin=margin)
+
+    rows = []
+    for split, X_eval, y_eval in [('calibration', X_cal, y_cal), ('test', X_test, y_test)]:
+        y_eval = np.asarray(y_eval)
+        quantile_preds = [fitted[quantile_label(q)].predict(X_eval) for q in QUANTILES]
+        for label, interval in [('quantiles only', raw), ('conformal', model)]:
+            _, lower, upper = interval.predict_interval(X_eval)
+            rows.append({
+                'Split': split,
+                'Interval': label,
+                'Nominal_Coverage': nominal,
+                'Coverage': float(np.mean((y_eval >= lower) & (y_eval <= upper))),
+                'Mean_Width_Lakhs': float(np.mean(upper - lower)),
+                'Median_Width_Lakhs': float(np.median(upper - lower)),
+                'Margin_Lakhs': interval.margin,
+                **{f'Pinball_{quantile_label(q)}': pinball_loss(y_eval, quantile_preds[i], q)
+                   for i, q in enumerate(QUANTILES)},
+            })
+    report = pd.DataFrame(rows)
+    report['Point_Predict_ms'] = _latency_ms(point_model.predict, X_test)
+    report['Interval_Predict_ms'] = _latency_ms(model.predict_interval, X_test)
+
+    test = report[(report['Split'] == 'test') & (report['Interval'] == 'conformal')].iloc[0]
+    print(f"  📏 {nominal:.0%} interval: test coverage={test['Coverage']:.1%}, "
+          f"mean width={test['Mean_Width_Lakhs']:.1f}L (conformal margin {margin:.2f}L)")
+    print(f"  ⏱️  Predict: point {test['Point_Predict_ms']:.1f}ms | point + interval "
+          f"{test['Interval_Predict_ms']:.1f}ms")
+    return model, report
+
+
+def register_interval_model(registry, model, report: pd.DataFrame, features: list) -> dict:
+    """Register the interval model, linked to the registered version of its point model"""
+    best = registry.resolve('best')
+    test = report[(report['Split'] == 'test') & (report['Interval'] == 'conformal')].iloc[0]
+    metrics = {'Coverage': test['Coverage'], 'Mean_Width': test['Mean_Width_Lakhs'], 'Margin': model.margin}
+    return registry.register(INTERVAL_MODEL, model, metrics, features, extra={
+        'point_model': best,
+        'point_version': registry.entry(best)['version'],
+        'quantiles': list(model.quantiles),
+    })
+
+
+def interval_is_current(registry, name: str = INTERVAL_MODEL) -> bool:
+    """True if the registered interval model wraps the current best model version"""
+    entry = registry.entry(name)
+    best = registry.entry('best')
+    return bool(entry and best and entry.get('point_model') == best['name']
+                and entry.get('point_version') == best['version'])
@@ -0,0 +1,275 @@
+"""
+MODEL REGISTRY
+Versioned model artifacts described by models/manifest.json:
+    - one entry per model name with version, metrics, feature list, rank,
+      encoder version and the sha256 of its artifact, checked when a version
+      is first loaded (ArtifactIntegrityError on mismatch)
+    - 'best' is an alias for the top-ranked model
+    - artifacts are loaded on first use and cached, so asking for one model
+      never loads the others; models registered through the same instance
+      are served from memory straight away; a version replaced by a newer
+      one is dropped from the cache (and its ensemble threads stopped)
+
+Artifacts live in models/registry/<slug>-v<version>.pkl; older versions are
+pruned after `keep_versions` retrains. Compiled exports (tree_export.py) go
+to models/compiled/<slug>/. Trees without a manifest fall back to
+the legacy rank files (best_model.pkl, model_<rank>_<slug>.pkl).
+
+Usage:
+    python src/modeling/registry.py        # list registered models
+"""
+import glob
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+import joblib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.modeling.compiled_trees import file_sha256, load_compiled
+
+MODELS_DIR = 'models'
+MANIFEST_NAME = 'manifest.json'
+
+
+def slugify(name: str) -> str:
+    return name.lower().replace(' ', '_')
+
+
+def encoders_digest(label_encoders: dict) -> str:
+    """Hash of every encoder's classes, independent of pickle bytes"""
+    payload = {col: [str(c) for c in le.classes_] for col, le in sorted(label_encoders.items())}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class ArtifactIntegrityError(RuntimeError):
+    """An artifact's bytes do not match the sha256 recorded in the manifest"""
+
+
+class ModelRegistry:
+    """Manifest-backed store of trained models with lazy, cached loading"""
+
+    def __init__(self, root: str = MODELS_DIR, keep_versions: int = 3):
+        self.root = root
+        self.keep_versions = keep_versions
+        self.manifest_path = os.path.join(root, MANIFEST_NAME)
+        self._cache = {}
+        self._current = {}  # model name -> cache key of the version served
+        self._lock = threading.Lock()
+        self._manifest_mtime = None
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self) -> dict:
+        if not os.path.exists(self.manifest_path):
+            return {'best': None, 'encoders': None, 'models': {}}
+        self._manifest_mtime = os.path.getmtime(self.manifest_path)
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self):
+        tmp = self.manifest_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp, self.manifest_path)
+        self._manifest_mtime = os.path.getmtime(self.manifest_path)
+
+    def refresh(self) -> bool:
+        """Re-read the manifest if another process rewrote it; True if it changed"""
+        mtime = os.path.getmtime(self.manifest_path) if os.path.exists(self.manifest_path) else None
+        if mtime == self._manifest_mtime:
+            return False
+        self.manifest = self._read_manifest()
+        return True
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def register_encoders(self, label_encoders: dict) -> int:
+        """Save encoders; the version only moves when their classes change"""
+        digest = encoders_digest(label_encoders)
+        current = self.manifest.get('encoders')
+        version = current['version'] if current and current['digest'] == digest else (current or {}).get('version', 0) + 1
+        path = os.path.join(self.root, 'label_encoders.pkl')
+        joblib.dump(label_encoders, path)
+        self.manifest['encoders'] = {'file': 'label_encoders.pkl', 'version': version,
+                                     'digest': digest, 'sha256': file_sha256(path)}
+        self._cache[('encoders', version)] = label_encoders
+        self._write_manifest()
+        return version
+
+    def register(self, name: str, model, metrics: dict, features: list, rank: int = None,
+                 extra: dict = None) -> dict:
+        """
+        Save a new version of `name` and record it in the manifest
+
+        Args:
+            metrics: e.g. {'R2': ..., 'RMSE': ..., 'MAE': ...}
+            features: Column order the model expects
+            rank: Position in the latest model comparison (1 = best)
+            extra: Additional manifest fields (e.g. warm-start lineage)
+        """
+        previous = self.manifest['models'].get(name)
+        version = previous['version'] + 1 if previous else 1
+        rel_path = os.path.join('registry', f"{slugify(name)}-v{version}.pkl")
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Uncompressed, so numpy buffers can be memory-mapped on load
+        joblib.dump(model, path)
+        with self._lock:
+            self._cache[(path, version)] = model
+            replaced = self._replace(name, (path, version))
+        self._close(replaced)
+
+        entry = {
+            'name': name,
+            'version': version,
+            'file': rel_path,
+            'sha256': file_sha256(path),
+            'class': type(model).__name__,
+            'rank': rank,
+            'metrics': {k: float(v) for k, v in metrics.items()},
+            'features': list(features),
+            'encoder_version': (self.manifest.get('encoders') or {}).get('version'),
+            'trained_at': datetime.now().isoformat(timespec='seconds'),
+            **(extra or {}),
+        }
+        self.manifest['models'][name] = entry
+        if rank == 1:
+            self.manifest['best'] = name
+        self._prune(name, version)
+        self._write_manifest()
+        return entry
+
+    def _replace(self, name: str, key):
+        """Make `key` the served version of `name`; returns the cached model it supersedes (lock held)"""
+        old = self._current.get(name)
+        self._current[name] = key
+        return self._cache.pop(old, None) if old is not None and old != key else None
+
+    @staticmethod
+    def _close(model):
+        # Ensembles own a prediction thread pool; plain estimators hold nothing to release
+        from src.modeling.ensembles import WeightedEnsemble
+        if isinstance(model, WeightedEnsemble):
+            model.close()
+
+    def set_compiled(self, name: str, directory: str):
+        """Record a compiled-array export of the current version of `name`"""
+        self.manifest['models'][name]['compiled'] = os.path.relpath(directory, self.root)
+        self._write_manifest()
+
+    def _prune(self, name: str, version: int):
+        for path in glob.glob(os.path.join(self.root, 'registry', f"{slugify(name)}-v*.pkl")):
+            old = int(path.rsplit('-v', 1)[1][:-len('.pkl')])
+            if old <= version - self.keep_versions:
+                os.remove(path)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _verify(self, path: str, info: dict):
+        """Check an artifact against its manifest digest before it is first loaded"""
+        if info and info.get('sha256') and file_sha256(path) != info['sha256']:
+            raise ArtifactIntegrityError(f"{path} does not match the sha256 recorded in {self.manifest_path} "
+                                         f"(truncated or replaced?) - restore it or retrain")
+
+    def resolve(self, name: str) -> str:
+        """Model name behind an alias ('best') or the name itself"""
+        if name == 'best':
+            return self.manifest.get('best') or 'best'
+        return name
+
+    def entry(self, name: str) -> dict:
+        """Manifest entry of a model (None for legacy, unregistered files)"""
+        return self.manifest['models'].get(self.resolve(name))
+
+    def path(self, name: str) -> str:
+        """Artifact path of a registered model, or the matching legacy rank file"""
+        entry = self.entry(name)
+        if entry is not None:
+            return os.path.join(self.root, entry['file'])
+        if name == 'best':
+            legacy = [os.path.join(self.root, 'best_model.pkl')]
+        else:
+            legacy = sorted(glob.glob(os.path.join(self.root, f"model_*_{slugify(name)}.pkl")))
+        for path in legacy:
+            if os.path.exists(path):
+                return path
+        raise KeyError(f"No model registered as '{name}'. Please train models first.")
+
+    def get(self, name: str = 'best', mmap_mode: str = 'r'):
+        """Load a model on first request and serve it from memory afterwards"""
+        path = self.path(name)
+        entry = self.entry(name)
+        key = (path, entry['version'] if entry else None)
+        with self._lock:
+            if key not in self._cache:
+                self._verify(path, entry)
+                self._cache[key] = joblib.load(path, mmap_mode=mmap_mode)
+            model = self._cache[key]
+            replaced = self._replace(self.resolve(name), key)
+        self._close(replaced)
+        return model
+
+    def compiled_target(self, name: str) -> str:
+        """Where the compiled export of `name` is written"""
+        return os.path.join(self.root, 'compiled', slugify(self.resolve(name)))
+
+    def compiled_dir(self, name: str = 'best') -> str:
+        """Directory of the compiled export of `name`, if one was recorded"""
+        entry = self.entry(name)
+        if entry and entry.get('compiled'):
+            return os.path.join(self.root, entry['compiled'])
+        return None
+
+    def compiled(self, name: str = 'best', mmap_mode: str = 'r'):
+        """Compiled export of `name`, loaded once per version (None if missing or stale)"""
+        directory = self.compiled_dir(name)
+        if directory is None:
+            return None
+        key = ('compiled', directory, self.entry(name)['version'])
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = load_compiled(directory, source=self.path(name), mmap_mode=mmap_mode)
+            return self._cache[key]
+
+    def encoders(self) -> dict:
+        """Label encoders matching the registered models"""
+        info = self.manifest.get('encoders') or {'file': 'label_encoders.pkl', 'version': None}
+        key = ('encoders', info['version'])
+        with self._lock:
+            if key not in self._cache:
+                path = os.path.join(self.root, info['file'])
+                self._verify(path, info)
+                self._cache[key] = joblib.load(path)
+            return self._cache[key]
+
+    def names(self) -> list:
+        """Registered model names ordered by rank"""
+        return sorted(self.manifest['models'], key=lambda n: self.manifest['models'][n].get('rank') or 1e9)
+
+
+def main():
+    registry = ModelRegistry()
+    print("\n" + "="*80)
+    print("📦 MODEL REGISTRY")
+    print("="*80)
+    if not registry.manifest['models']:
+        print("⚠️  No manifest found - run src/modeling/train_all.py")
+        return
+    enc = registry.manifest.get('encoders') or {}
+    print(f"🔤 Encoders v{enc.get('version')} ({enc.get('digest')})\n")
+    for name in registry.names():
+        e = registry.entry(name)
+        best = " ⭐ best" if name == registry.manifest['best'] else ""
+        print(f"#{e['rank'] or '-':>2} {name:20} v{e['version']:<3} R²={e['metrics'].get('R2', float('nan')):.4f} | "
+              f"{e['class']:24} {e['file']}{best}")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
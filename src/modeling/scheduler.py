@@ -0,0 +1,177 @@
+"""
+PARALLEL TRAINING SCHEDULER
+Runs independent model fits at the same time across CPU cores
+- Each model gets a thread budget so total threads never exceed the core count
+- Records per-model fit time and total wall-clock time
+"""
+import os
+import time
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from threadpoolctl import threadpool_limits
+
+# Constructor parameter that controls each library's thread count.
+# Models not listed here (GradientBoosting, AdaBoost) are single-threaded.
+THREAD_PARAMS = {
+    'XGBRegressor': 'n_jobs',
+    'LGBMRegressor': 'n_jobs',
+    'CatBoostRegressor': 'thread_count',
+    'RandomForestRegressor': 'n_jobs',
+    'ExtraTreesRegressor': 'n_jobs',
+}
+
+# Training data shared by every task in a worker process (set once per worker)
+_worker_data = {}
+
+
+def available_cores() -> int:
+    """Number of cores this process is allowed to use"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def set_model_threads(model, threads: int):
+    """Set the library-specific thread count on a model (no-op if single-threaded)"""
+    param = THREAD_PARAMS.get(type(model).__name__)
+    if param is not None:
+        model.set_params(**{param: threads})
+    return model
+
+
+def plan_thread_budget(n_tasks: int, cores: int = None, max_workers: int = None):
+    """
+    Split the cores between concurrently running fits
+
+    Returns:
+        (workers, threads_per_model) with workers * threads_per_model <= cores
+    """
+    cores = cores or available_cores()
+    workers = min(n_tasks, cores, max_workers or cores)
+    workers = max(workers, 1)
+    threads_per_model = max(1, cores // workers)
+    return workers, threads_per_model
+
+
+def _init_worker(X, y):
+    _worker_data['X'] = X
+    _worker_data['y'] = y
+
+
+def _fit_task(name, model, fit_params, threads, input_key=None, X=None, y=None):
+    """Fit one model under its thread budget; runs inside a worker process"""
+    if X is None:
+        X, y = _worker_data['X'], _worker_data['y']
+    if input_key is not None:
+        X = X[input_key]
+        if isinstance(y, dict):
+            y = y[input_key]
+    set_model_threads(model, threads)
+    start = time.perf_counter()
+    with threadpool_limits(limits=threads):
+        model.fit(X, y, **(fit_params or {}))
+    return name, model, time.perf_counter() - start
+
+
+class TrainingScheduler:
+    """Fit a set of independent models concurrently with a per-model thread budget"""
+
+    def __init__(self, max_workers: int = None, cores: int = None):
+        """
+        Args:
+            max_workers: Upper bound on concurrent fits (1 = sequential, in-process)
+            cores: Total thread budget (default: all available cores)
+        """
+        self.max_workers = max_workers
+        self.cores = cores or available_cores()
+        self.timings = []
+        self.wall_seconds = 0.0
+
+    def run(self, tasks: dict, X, y, fit_params: dict = None, inputs: dict = None) -> dict:
+        """
+        Fit every model in `tasks` on (X, y)
+
+        Args:
+            tasks: {name: unfitted estimator}
+            X: Feature frame, or {key: frame} when models need different inputs
+            y: Target, or {key: target} matching the keys of X
+            fit_params: Optional {name: {fit kwargs}}
+            inputs: Optional {name: key into X} (required when X is a dict)
+
+        Returns:
+            {name: fitted estimator}
+        """
+        fit_params = fit_params or {}
+        inputs = inputs or {}
+        workers, threads = plan_thread_budget(len(tasks), self.cores, self.max_workers)
+        self.workers, self.threads_per_model = workers, threads
+        fitted = {}
+        self.timings = []
+
+        start = time.perf_counter()
+        if workers == 1:
+            for name, model in tasks.items():
+                name, model, seconds = _fit_task(name, model, fit_params.get(name), threads,
+                                                   inputs.get(name), X, y)
+                fitted[name] = model
+                self._record(name, model, threads, seconds)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(X, y)) as pool:
+                futures = [pool.submit(_fit_task, name, model, fit_params.get(name), threads,
+                                       inputs.get(name))
+                           for name, model in tasks.items()]
+                for future in as_completed(futures):
+                    name, model, seconds = future.result()
+                    fitted[name] = model
+                    self._record(name, model, threads, seconds)
+        self.wall_seconds = time.perf_counter() - start
+
+        # Keep the caller's ordering
+        return {name: fitted[name] for name in tasks}
+
+    def _record(self, name, model, threads, seconds):
+        used = threads if type(model).__name__ in THREAD_PARAMS else 1
+        self.timings.append({'Model': name, 'Threads': used, 'Fit_Seconds': seconds})
+        print(f"  {name:20} fitted in {seconds:6.2f}s ({used} thread{'s' if used > 1 else ''})")
+
+    @property
+    def mode(self) -> str:
+        return 'sequential' if self.workers == 1 else 'parallel'
+
+    def save_report(self, path: str = 'reports/training_times.csv') -> pd.DataFrame:
+        """
+        Write per-model and total timings for this run's mode, keeping the rows
+        recorded by the other mode so sequential and parallel runs can be compared
+        """
+        rows = pd.DataFrame(self.timings)
+        rows = pd.concat([rows, pd.DataFrame([{'Model': 'TOTAL (wall clock)',
+                                               'Threads': self.cores,
+                                               'Fit_Seconds': self.wall_seconds}])],
+                         ignore_index=True)
+        rows.insert(0, 'Mode', self.mode)
+
+        if os.path.exists(path):
+            previous = pd.read_csv(path)
+            previous = previous[previous['Mode'] != self.mode]
+            rows = pd.concat([previous, rows], ignore_index=True)
+        rows.to_csv(path, index=False)
+        return rows
+
+    def print_comparison(self, report: pd.DataFrame):
+        """Print per-model and total time against the other mode, if recorded"""
+        table = report.pivot_table(index='Model', columns='Mode', values='Fit_Seconds')
+        table = table.reindex(report['Model'].drop_duplicates())
+        print("\n⏱️  Training time (seconds)")
+        print("-" * 60)
+        if {'sequential', 'parallel'} <= set(table.columns):
+            for name, row in table.iterrows():
+                speedup = row['sequential'] / row['parallel'] if row['parallel'] > 0 else float('nan')
+                print(f"  {name:20} sequential={row['sequential']:7.2f}s | "
+                      f"parallel={row['parallel']:7.2f}s | {speedup:4.1f}x")
+        else:
+            total_fit = sum(t['Fit_Seconds'] for t in self.timings)
+            print(f"  Sum of fits: {total_fit:.2f}s | Wall clock: {self.wall_seconds:.2f}s "
+                  f"({self.workers} workers x {self.threads_per_model} threads)")
+            other = 'parallel' if self.mode == 'sequential' else 'sequential'
+            print(f"  💡 Run again in {other} mode to record a side-by-side comparison")
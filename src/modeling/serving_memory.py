@@ -0,0 +1,151 @@
+"""
+SERVING MEMORY BENCHMARK
+Starts N worker processes that each load the best model and predict, then
+measures resident memory per worker while all of them are alive.
+
+Load modes:
+    pickle         - joblib.load: every worker deserializes a private copy
+    pickle-mmap    - joblib.load(mmap_mode='r'): numpy buffers inside the
+                     pickle are mapped (sklearn trees and booster blobs are
+                     still copied on unpickling)
+    compiled       - compiled tree arrays read into private memory
+    compiled-mmap  - compiled tree arrays mapped read-only; all workers share
+                     one copy in the page cache
+
+RSS counts shared pages in every process; PSS splits them between the
+processes that map them, so PSS shows the real per-worker cost.
+
+Usage:
+    python src/modeling/serving_memory.py                  # 4 workers, all modes
+    python src/modeling/serving_memory.py --workers 8 --modes pickle compiled-mmap
+
+Writes:
+    reports/serving_memory.csv
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+MODES = ['pickle', 'pickle-mmap', 'compiled', 'compiled-mmap']
+
+
+def memory_mb() -> tuple:
+    """(RSS, PSS) of this process in MB; PSS is None where it cannot be read"""
+    try:
+        fields = {}
+        with open('/proc/self/smaps_rollup', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('Rss', 'Pss'):
+                    fields[key] = int(value.split()[0]) / 1024
+        return fields['Rss'], fields['Pss']
+    except (OSError, KeyError):
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_full_info()
+        return info.rss / 2**20, getattr(info, 'pss', None) and info.pss / 2**20
+    except ImportError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, None
+
+
+def load_for_serving(mode: str, model_path: str, compiled_dir: str = None):
+    """Load the best model the way a serving worker would in `mode`"""
+    if mode.startswith('compiled'):
+        from src.modeling.compiled_trees import load_compiled
+        model = compiled_dir and load_compiled(compiled_dir, model_path,
+                                               mmap_mode='r' if mode == 'compiled-mmap' else None)
+        if model is None:
+            raise FileNotFoundError("compiled arrays are missing or stale - run src/modeling/tree_export.py")
+        return model
+    import joblib
+    return joblib.load(model_path, mmap_mode='r' if mode == 'pickle-mmap' else None)
+
+
+def _worker(mode: str, paths: tuple, X, barrier, results):
+    rss_before, pss_before = memory_mb()
+    model = load_for_serving(mode, *paths)
+    model.predict(X)
+    # Measure only once every worker holds its model, so shared pages are split N ways
+    barrier.wait()
+    rss_after, pss_after = memory_mb()
+    results.put({
+        'Mode': mode, 'PID': os.getpid(),
+        'RSS_Before_MB': rss_before, 'RSS_After_MB': rss_after,
+        'PSS_Before_MB': pss_before, 'PSS_After_MB': pss_after,
+    })
+    barrier.wait()
+
+
+def measure(mode: str, paths: tuple, X: pd.DataFrame, n_workers: int) -> list:
+    """
+    Run n_workers concurrent workers in `mode` and collect their memory readings
+
+    Args:
+        paths: (model pickle path, compiled directory or None)
+    """
+    if mode.startswith('compiled'):
+        # Fail here rather than inside workers blocked on the barrier
+        load_for_serving('compiled-mmap', *paths)
+    ctx = mp.get_context('spawn')
+    barrier = ctx.Barrier(n_workers)
+    results = ctx.Queue()
+    workers = [ctx.Process(target=_worker, args=(mode, paths, X, barrier, results)) for _ in range(n_workers)]
+    for w in workers:
+        w.start()
+    rows = [results.get() for _ in workers]
+    for w in workers:
+        w.join()
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Measure per-worker memory of model serving')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent worker processes')
+    parser.add_argument('--modes', nargs='+', default=MODES, choices=MODES)
+    parser.add_argument('--rows', type=int, default=256, help='Rows each worker predicts')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("\n" + "="*80)
+    print(f"🧠 SERVING MEMORY - {args.workers} WORKERS PER MODE")
+    print("="*80)
+
+    from src.modeling.train_all import feature_cols
+    from src.modeling.registry import ModelRegistry
+    registry = ModelRegistry()
+    paths = (registry.path('best'), registry.compiled_dir('best'))
+    X = pd.read_csv('data/training/training_data_enhanced.csv', nrows=args.rows)[feature_cols]
+    for col, le in registry.encoders().items():
+        X[col] = le.transform(X[col].astype(str))
+
+    rows = []
+    for mode in args.modes:
+        try:
+            rows.extend(measure(mode, paths, X, args.workers))
+        except FileNotFoundError as e:
+            print(f"⚠️  {mode}: {e}")
+            continue
+        mode_rows = [r for r in rows if r['Mode'] == mode]
+        loaded = [r['PSS_After_MB'] - r['PSS_Before_MB'] for r in mode_rows if r['PSS_After_MB'] is not None]
+        rss = [r['RSS_After_MB'] - r['RSS_Before_MB'] for r in mode_rows]
+        pss_text = f" | model PSS/worker={sum(loaded) / len(loaded):7.1f} MB" if loaded else ""
+        print(f"  {mode:14} model RSS/worker={sum(rss) / len(rss):7.1f} MB{pss_text}")
+
+    report = pd.DataFrame(rows)
+    report.to_csv('reports/serving_memory.csv', index=False)
+    print("\n💾 Report saved: reports/serving_memory.csv")
+    print("="*80)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,158 +1,321 @@
 """
 ENHANCED TRAINING - 10 MODELS
-Trains: XGBoost, LightGBM, CatBoost, RandomForest, ExtraTrees, 
+Trains: XGBoost, LightGBM, CatBoost, RandomForest, ExtraTrees,
         GradientBoosting, AdaBoost, Bagging, Voting, Stacking
+
+Usage:
+    python src/modeling/train_all.py               # parallel fits across all cores
+    python src/modeling/train_all.py --sequential  # one model at a time (baseline)
+    python src/modeling/train_all.py --workers 4   # cap concurrent fits
+    python src/modeling/train_all.py --native-categorical  # boosters use native categoricals
+    python src/modeling/train_all.py --tuned       # boosters use reports/tuned_params.json
+    python src/modeling/train_all.py --cv 5        # rank models by 5-fold CV instead of one split
+    python src/modeling/train_all.py --incremental # warm-start boosters on new listings only
+
+The best model is also compiled to models/compiled/<name>/ (see tree_export.py),
+together with the p10/p90 quantile models of its 80% price interval (intervals.py).
 """
+import argparse
+import os
+import shutil
+import sys
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
-from sklearn.ensemble import (RandomForestRegressor, ExtraTreesRegressor, 
-                              GradientBoostingRegressor, AdaBoostRegressor, 
-                              BaggingRegressor, VotingRegressor, StackingRegressor)
-from sklearn.linear_model import Ridge
-from xgboost import XGBRegressor
-from lightgbm import LGBMRegressor
-from catboost import CatBoostRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-import joblib
 import warnings
 warnings.filterwarnings('ignore')
 
-print("\n" + "="*80)
-print("🔧 TRAINING 9 MODELS (7 Base + 2 Ensembles)")
-print("="*80)
+# scikit-learn and the boosters are imported inside the functions that fit
+# or score models, so --help, --incremental with nothing new and modules
+# that only need feature_cols start without loading them.
 
-# Load
-print("\n📂 Loading data...")
-df = pd.read_csv('data/training/training_data_enhanced.csv')
-print(f"✅ {len(df)} records")
+# Add project root to path to import src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.modeling.scheduler import TrainingScheduler
+from src.modeling.ensembles import SimpleVoting, WeightedEnsemble
+from src.modeling.tree_export import export_compiled
+from src.modeling.registry import ModelRegistry
+from src.modeling.incremental import run_incremental
+from src.modeling.intervals import (train_interval_model, register_interval_model, interval_is_current,
+                                    INTERVAL_MODEL, COVERAGE_REPORT)
 
 # Features
-feature_cols = ['BHK', 'Area_SqFt', 'Locality', 'Locality_Tier', 'Seller_Type', 
+feature_cols = ['BHK', 'Area_SqFt', 'Locality', 'Locality_Tier', 'Seller_Type',
                 'Property_Type', 'Furnishing_Status', 'Under_Construction', 'Amenities_Count',
                 'Area_Per_BHK', 'Is_Large_Apartment', 'Is_Premium_Locality', 'Is_Budget_Locality',
                 'BHK_Area_Combo', 'High_Amenity', 'Construction_Category', 'Locality_Property_Count',
                 'Locality_Median_Area', 'Locality_Common_BHK']
 
-X = df[feature_cols].copy()
-y = df['Price_Lakhs'].copy()
-
-# Encode
-categorical_cols = ['Locality', 'Locality_Tier', 'Seller_Type', 'Property_Type', 
+categorical_cols = ['Locality', 'Locality_Tier', 'Seller_Type', 'Property_Type',
                     'Furnishing_Status', 'BHK_Area_Combo', 'Construction_Category']
-label_encoders = {}
-for col in categorical_cols:
-    le = LabelEncoder()
-    X[col] = le.fit_transform(X[col].astype(str))
-    label_encoders[col] = le
-
-# Split
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-print(f"✅ Train: {len(X_train)}, Test: {len(X_test)}")
-
-# Define base models (n_jobs=1 to avoid multiprocessing issues)
-base_models = {
-    'XGBoost': XGBRegressor(n_estimators=500, learning_rate=0.05, max_depth=7, random_state=42, n_jobs=1),
-    'LightGBM': LGBMRegressor(n_estimators=500, learning_rate=0.05, max_depth=7, random_state=42, n_jobs=1, verbose=-1),
-    'CatBoost': CatBoostRegressor(iterations=500, learning_rate=0.05, depth=7, random_state=42, verbose=0),
-    'RandomForest': RandomForestRegressor(n_estimators=300, max_depth=15, random_state=42, n_jobs=1),
-    'ExtraTrees': ExtraTreesRegressor(n_estimators=300, max_depth=15, random_state=42, n_jobs=1),
-    'GradientBoosting': GradientBoostingRegressor(n_estimators=200, learning_rate=0.05, max_depth=7, random_state=42),
-    'AdaBoost': AdaBoostRegressor(n_estimators=100, learning_rate=0.5, random_state=42)
-}
-
-# Train base models
-results = []
-trained_models = {}
-print("\n🎯 Training base models...\n")
-
-for name, model in base_models.items():
-    print(f"  {name}...", end=" ", flush=True)
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
-    
-    mae = mean_absolute_error(y_test, y_pred)
-    rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-    r2 = r2_score(y_test, y_pred)
-    
-    results.append({'Model': name, 'MAE': mae, 'RMSE': rmse, 'R2': r2, 'obj': model})
-    trained_models[name] = model
+
+
+def load_training_data(path='data/training/training_data_enhanced.csv'):
+    """Load the enhanced training file and label-encode categoricals"""
+    from sklearn.preprocessing import LabelEncoder
+    print("\n📂 Loading data...")
+    df = pd.read_csv(path)
+    print(f"✅ {len(df)} records")
+
+    X = df[feature_cols].copy()
+    y = df['Price_Lakhs'].copy()
+
+    # Encode
+    label_encoders = {}
+    for col in categorical_cols:
+        le = LabelEncoder()
+        X[col] = le.fit_transform(X[col].astype(str))
+        label_encoders[col] = le
+
+    return X, y, label_encoders
+
+
+def build_base_models(tuned_params=None):
+    """
+    Define base models (thread counts are assigned by the scheduler)
+
+    Args:
+        tuned_params: Optional {name: params} from tuning.py overriding the defaults
+    """
+    from sklearn.ensemble import (RandomForestRegressor, ExtraTreesRegressor,
+                                  GradientBoostingRegressor, AdaBoostRegressor)
+    from xgboost import XGBRegressor
+    from lightgbm import LGBMRegressor
+    from catboost import CatBoostRegressor
+    models = {
+        'XGBoost': XGBRegressor(n_estimators=500, learning_rate=0.05, max_depth=7, random_state=42, n_jobs=1),
+        'LightGBM': LGBMRegressor(n_estimators=500, learning_rate=0.05, max_depth=7, random_state=42, n_jobs=1, verbose=-1),
+        'CatBoost': CatBoostRegressor(iterations=500, learning_rate=0.05, depth=7, random_state=42, verbose=0, thread_count=1),
+        'RandomForest': RandomForestRegressor(n_estimators=300, max_depth=15, random_state=42, n_jobs=1),
+        'ExtraTrees': ExtraTreesRegressor(n_estimators=300, max_depth=15, random_state=42, n_jobs=1),
+        'GradientBoosting': GradientBoostingRegressor(n_estimators=200, learning_rate=0.05, max_depth=7, random_state=42),
+        'AdaBoost': AdaBoostRegressor(n_estimators=100, learning_rate=0.5, random_state=42)
+    }
+    for name, params in (tuned_params or {}).items():
+        if name in models:
+            models[name].set_params(**params)
+    return models
+
+
+def evaluate(y_true, y_pred):
+    """Return MAE, RMSE and R² for a set of predictions"""
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    mae = mean_absolute_error(y_true, y_pred)
+    rmse = np.sqrt(mean_squared_error(y_true, y_pred))
+    r2 = r2_score(y_true, y_pred)
+    return mae, rmse, r2
+
+
+def train_base_models(scheduler, X_train, y_train, X_test, y_test, label_encoders=None, tuned_params=None):
+    """
+    Fit all base models through the scheduler and score them on the test split
+
+    If label_encoders is given, XGBoost, LightGBM and CatBoost are trained on
+    native categoricals and wrapped so they still accept label-encoded input.
+    """
+    print(f"\n🎯 Training base models ({scheduler.cores} cores)...\n")
+    tasks = build_base_models(tuned_params)
+    if label_encoders is None:
+        trained_models = scheduler.run(tasks, X_train, y_train)
+    else:
+        from src.modeling.categorical import to_native_categoricals, build_native_boosters, NativeCategoricalModel
+        native_models, fit_params = build_native_boosters(categorical_cols)
+        for name, params in (tuned_params or {}).items():
+            native_models[name].set_params(**params)
+        tasks.update(native_models)
+        inputs = {name: 'native' if name in native_models else 'label' for name in tasks}
+        X_inputs = {'label': X_train, 'native': to_native_categoricals(X_train, label_encoders)}
+        trained_models = scheduler.run(tasks, X_inputs, y_train, fit_params=fit_params, inputs=inputs)
+        for name in native_models:
+            trained_models[name] = NativeCategoricalModel(trained_models[name], label_encoders)
+
+    results = []
+    print()
+    for name, model in trained_models.items():
+        mae, rmse, r2 = evaluate(y_test, model.predict(X_test))
+        results.append({'Model': name, 'MAE': mae, 'RMSE': rmse, 'R2': r2, 'obj': model})
+        print(f"  {name:20} ✅ R²={r2:.4f}, RMSE={rmse:.2f}L, MAE={mae:.2f}L")
+    return results, trained_models
+
+
+def train_ensembles(results, trained_models, X_test, y_test):
+    """Build the voting and weighted ensembles from fitted base models"""
+    print("\n🎯 Training ensemble models...\n")
+
+    # Voting Ensemble (simple average of the three boosters)
+    print("  Voting Ensemble...", end=" ", flush=True)
+    voting = SimpleVoting([trained_models['XGBoost'], trained_models['LightGBM'], trained_models['CatBoost']])
+    mae, rmse, r2 = evaluate(y_test, voting.predict(X_test))
+    results.append({'Model': 'Voting Ensemble', 'MAE': mae, 'RMSE': rmse, 'R2': r2, 'obj': voting})
+    print(f"✅ R²={r2:.4f}, RMSE={rmse:.2f}L, MAE={mae:.2f}L")
+
+    # Weighted Ensemble (best 3 models weighted by R2 scores)
+    print("  Weighted Ensemble...", end=" ", flush=True)
+    top3 = sorted(results, key=lambda x: x['R2'], reverse=True)[:3]
+    weights = np.array([r['R2'] for r in top3])
+    weights = weights / weights.sum()
+    weighted = WeightedEnsemble([m['obj'] for m in top3], weights)
+    mae, rmse, r2 = evaluate(y_test, weighted.predict(X_test))
+    results.append({'Model': 'Weighted Ensemble', 'MAE': mae, 'RMSE': rmse, 'R2': r2, 'obj': weighted})
     print(f"✅ R²={r2:.4f}, RMSE={rmse:.2f}L, MAE={mae:.2f}L")
+    return results
+
+
+def save_artifacts(results_df, label_encoders, registry=None):
+    """Register ranked models and encoders, and save the comparison report"""
+    registry = registry or ModelRegistry()
+    print("\n💾 Registering models...")
+    encoder_version = registry.register_encoders(label_encoders)
+    metric_cols = ['R2', 'RMSE', 'MAE'] + [c for c in results_df.columns if c.startswith('CV_')]
+    for i in range(len(results_df)):
+        row = results_df.iloc[i]
+        entry = registry.register(row['Model'], row['obj'], row[metric_cols].dropna().to_dict(),
+                                  feature_cols, rank=i + 1)
+        print(f"  #{i+1:2d} {row['Model']:20} v{entry['version']:<3} → models/{entry['file']}")
+    print(f"  🔤 Label encoders v{encoder_version} → models/label_encoders.pkl")
+    print(f"  ⭐ best → {registry.manifest['best']} (models/manifest.json)")
+
+    # Save comparison report
+    results_df[['Model'] + metric_cols].to_csv('reports/model_comparison.csv', index=False)
+    return registry
+
+
+def compile_registered(registry, name, label):
+    """Export a registered model as flat tree arrays for NumPy-only serving"""
+    directory = registry.compiled_target(name)
+    try:
+        compiled = export_compiled(registry.get(name), feature_cols, directory, source=registry.path(name))
+    except ValueError as e:
+        # Never leave arrays of a previous version next to the new one
+        shutil.rmtree(directory, ignore_errors=True)
+        print(f"⚠️  {label} not compiled: {e}")
+        return None
+    registry.set_compiled(name, directory)
+    print(f"⚙️  Compiled {label.lower()}: {compiled.n_trees} trees, {compiled.n_nodes} nodes → {directory}/")
+    return compiled
+
+
+def compile_best_model(registry):
+    """Compile the best model, and the interval model built around it"""
+    compiled = compile_registered(registry, registry.resolve('best'), 'Best model')
+    if interval_is_current(registry):
+        compile_registered(registry, INTERVAL_MODEL, 'Interval model')
+    return compiled
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Train all price prediction models')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Maximum number of models fitted at the same time (default: one per core)')
+    parser.add_argument('--sequential', action='store_true',
+                        help='Fit one model at a time, in-process (timing baseline)')
+    parser.add_argument('--native-categorical', action='store_true',
+                        help='Train XGBoost/LightGBM/CatBoost on native categoricals instead of label codes')
+    parser.add_argument('--tuned', action='store_true',
+                        help='Use booster configs chosen by src/modeling/tuning.py')
+    parser.add_argument('--cv', type=int, default=0, metavar='K',
+                        help='Rank models by K-fold cross-validated R² (label-encoded configs)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Continue the registered boosters on new listings; full retrain only on drift')
+    parser.add_argument('--incremental-rounds', type=int, default=50,
+                        help='Boosting rounds added per booster in incremental mode')
+    return parser.parse_args(argv)
+
+
+def main(argv=None, session=None):
+    """
+    Args:
+        session: Optional src.session.Session (main.py menu) whose cached
+            training data is reused and whose registry receives the models,
+            so later actions serve them from memory
+    """
+    args = parse_args(argv)
+    scheduler = TrainingScheduler(max_workers=1 if args.sequential else args.workers)
+
+    if args.incremental and run_incremental(scheduler, args.incremental_rounds):
+        return None
+
+    print("\n" + "="*80)
+    print("🔧 TRAINING 9 MODELS (7 Base + 2 Ensembles)")
+    print("="*80)
+
+    X, y, label_encoders = session.training_data() if session else load_training_data()
+
+    # Split
+    from sklearn.model_selection import train_test_split
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    print(f"✅ Train: {len(X_train)}, Test: {len(X_test)}")
+
+    tuned_params = None
+    if args.tuned:
+        from src.modeling.tuning import load_tuned_params
+        tuned_params = load_tuned_params()
+        if tuned_params:
+            print(f"🔍 Using tuned configs for: {', '.join(tuned_params)}")
+        else:
+            print("⚠️  No tuned configs found - run src/modeling/tuning.py first. Using defaults.")
+
+    results, trained_models = train_base_models(scheduler, X_train, y_train, X_test, y_test,
+                                                label_encoders if args.native_categorical else None,
+                                                tuned_params)
+    results = train_ensembles(results, trained_models, X_test, y_test)
+
+    # Sort and display
+    results_df = pd.DataFrame(results)
+    results_df = results_df.sort_values('R2', ascending=False)
+
+    if args.cv:
+        from src.modeling.cross_validation import CrossValidator, print_summary
+        print(f"\n🎯 Cross-validating over {args.cv} folds...\n")
+        cv = CrossValidator(X, y, n_folds=args.cv, scheduler=TrainingScheduler(max_workers=scheduler.max_workers))
+        cv_summary, cv_folds = cv.evaluate(build_base_models(tuned_params))
+        print_summary(cv_summary, args.cv)
+        cv_folds.to_csv('reports/cv_fold_scores.csv', index=False)
+        results_df = results_df.merge(cv_summary, on='Model', how='left')
+        results_df = results_df.sort_values('CV_R2_mean', ascending=False)
+
+    print("\n" + "="*80)
+    if args.cv:
+        print(f"📊 MODEL COMPARISON (Sorted by {args.cv}-fold CV R² | hold-out scores alongside)")
+    else:
+        print("📊 MODEL COMPARISON (Sorted by R² Score)")
+    print("="*80)
+    for idx, row in results_df.iterrows():
+        rank = list(results_df.index).index(idx) + 1
+        scores = f"R²={row['R2']:.4f} | RMSE={row['RMSE']:6.2f}L | MAE={row['MAE']:6.2f}L"
+        if args.cv:
+            # n/a: model missing from the CV summary
+            cv_r2 = f"{row['CV_R2_mean']:.4f}±{row['CV_R2_std']:.4f}" if pd.notna(row['CV_R2_mean']) else 'n/a'
+            scores = f"CV R²={cv_r2:13} | hold-out {scores}"
+        print(f"#{rank:2d} {row['Model']:20} | {scores}")
+    print("="*80)
+
+    registry = save_artifacts(results_df, label_encoders, session.registry if session else None)
+
+    # Quantile models for the best model's 80% interval (own scheduler: keeps training timings intact)
+    interval_model, coverage = train_interval_model(TrainingScheduler(max_workers=scheduler.max_workers),
+                                                    results_df.iloc[0]['obj'], X_train, y_train, X_test, y_test)
+    coverage.to_csv(COVERAGE_REPORT, index=False)
+    entry = register_interval_model(registry, interval_model, coverage, feature_cols)
+    print(f"  📏 {INTERVAL_MODEL:20} v{entry['version']:<3} → models/{entry['file']}")
+    compile_best_model(registry)
+
+    timing_report = scheduler.save_report('reports/training_times.csv')
+    scheduler.print_comparison(timing_report)
+
+    print(f"\n✅ TRAINING COMPLETE!")
+    best = results_df.iloc[0]
+    if args.cv:
+        print(f"   Best Model: {best['Model']} (CV R²={best['CV_R2_mean']:.4f}±{best['CV_R2_std']:.4f}, "
+              f"hold-out R²={best['R2']:.4f})")
+    else:
+        print(f"   Best Model: {best['Model']} (R²={best['R2']:.4f})")
+    print(f"   Models saved: models/registry/ (manifest: models/manifest.json)")
+    print(f"   Report saved: reports/model_comparison.csv")
+    print(f"   Intervals: {COVERAGE_REPORT}")
+    print(f"   Timings saved: reports/training_times.csv")
+    print("="*80)
+    return results_df
+
 
-# Create simple ensemble models
-print("\n🎯 Training ensemble models...\n")
-
-# Voting Ensemble (simple average - no parallel processing)
-print("  Voting Ensemble...", end=" ", flush=True)
-voting_preds = []
-for name in ['XGBoost', 'LightGBM', 'CatBoost']:
-    voting_preds.append(trained_models[name].predict(X_test))
-y_pred = np.mean(voting_preds, axis=0)
-mae = mean_absolute_error(y_test, y_pred)
-rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-r2 = r2_score(y_test, y_pred)
-# Create a simple class to hold the prediction method
-class SimpleVoting:
-    def __init__(self, models):
-        self.models = models
-    def predict(self, X):
-        preds = [m.predict(X) for m in self.models]
-        return np.mean(preds, axis=0)
-voting = SimpleVoting([trained_models['XGBoost'], trained_models['LightGBM'], trained_models['CatBoost']])
-results.append({'Model': 'Voting Ensemble', 'MAE': mae, 'RMSE': rmse, 'R2': r2, 'obj': voting})
-print(f"✅ R²={r2:.4f}, RMSE={rmse:.2f}L, MAE={mae:.2f}L")
-
-# Weighted Ensemble (best 3 models weighted)
-print("  Weighted Ensemble...", end=" ", flush=True)
-# Weight by R2 scores of top 3 base models
-top3 = sorted(results, key=lambda x: x['R2'], reverse=True)[:3]
-weights = np.array([r['R2'] for r in top3])
-weights = weights / weights.sum()
-weighted_preds = sum(w * m['obj'].predict(X_test) for w, m in zip(weights, top3))
-mae = mean_absolute_error(y_test, weighted_preds)
-rmse = np.sqrt(mean_squared_error(y_test, weighted_preds))
-r2 = r2_score(y_test, weighted_preds)
-class WeightedEnsemble:
-    def __init__(self, models, weights):
-        self.models = models
-        self.weights = weights
-    def predict(self, X):
-        return sum(w * m.predict(X) for w, m in zip(self.weights, self.models))
-weighted = WeightedEnsemble([m['obj'] for m in top3], weights)
-results.append({'Model': 'Weighted Ensemble', 'MAE': mae, 'RMSE': rmse, 'R2': r2, 'obj': weighted})
-print(f"✅ R²={r2:.4f}, RMSE={rmse:.2f}L, MAE={mae:.2f}L")
-
-# Sort and display
-results_df = pd.DataFrame(results)
-results_df = results_df.sort_values('R2', ascending=False)
-
-print("\n" + "="*80)
-print("📊 MODEL COMPARISON (Sorted by R² Score)")
-print("="*80)
-for idx, row in results_df.iterrows():
-    rank = list(results_df.index).index(idx) + 1
-    print(f"#{rank:2d} {row['Model']:20} | R²={row['R2']:.4f} | RMSE={row['RMSE']:6.2f}L | MAE={row['MAE']:6.2f}L")
-print("="*80)
-
-# Save all models
-print("\n💾 Saving models...")
-for i in range(len(results_df)):
-    name = results_df.iloc[i]['Model']
-    obj = results_df.iloc[i]['obj']
-    filename = f"models/model_{i+1}_{name.lower().replace(' ', '_')}.pkl"
-    joblib.dump(obj, filename)
-    print(f"  #{i+1:2d} {name:20} → {filename}")
-
-# Save best model and encoders
-joblib.dump(label_encoders, 'models/label_encoders.pkl')
-joblib.dump(results_df.iloc[0]['obj'], 'models/best_model.pkl')
-
-# Save comparison report
-results_df[['Model', 'R2', 'RMSE', 'MAE']].to_csv('reports/model_comparison.csv', index=False)
-
-print(f"\n✅ TRAINING COMPLETE!")
-print(f"   Best Model: {results_df.iloc[0]['Model']} (R²={results_df.iloc[0]['R2']:.4f})")
-print(f"   Models saved: models/")
-print(f"   Report saved: reports/model_comparison.csv")
-print("="*80)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+"""
+TREE ENSEMBLE EXPORT - COMPILE MODELS TO FLAT NODE ARRAYS
+Converts a fitted model into the array format evaluated by compiled_trees.py,
+so serving can predict with NumPy alone.
+
+Supported: XGBoost, LightGBM, CatBoost (numeric splits), RandomForest,
+ExtraTrees, GradientBoosting, Voting/Weighted ensembles of those, and
+interval models (point model + LightGBM quantile models as extra outputs).
+AdaBoost (weighted median) and native-categorical boosters are not sums of
+numeric-split trees and raise ValueError.
+
+Usage:
+    python src/modeling/tree_export.py                 # compile the registry's best model
+    python src/modeling/tree_export.py --model XGBoost # a registered name or a .pkl path
+
+Writes:
+    models/compiled/<name>/           - node arrays + model.json
+    reports/compiled_benchmark.csv    - accuracy, latency and import time vs the library path
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.modeling.compiled_trees import CompiledModel, file_sha256
+from src.modeling.intervals import quantile_label
+
+COMPILED_DIR = 'models/compiled'
+
+
+class TreeBuilder:
+    """Accumulates trees of one group into flat node lists"""
+
+    def __init__(self, decision: str, dtype: str, accumulate: str = 'float64'):
+        self.decision = decision
+        self.dtype = dtype
+        self.accumulate = accumulate
+        self.weight = 1.0
+        self.bias = 0.0
+        self.max_depth = 0
+        self.nodes = {'feature': [], 'threshold': [], 'left': [], 'right': [], 'default_left': [], 'value': []}
+        self.roots = []
+        self.tree_weight = []
+
+    def new_node(self) -> int:
+        for values in self.nodes.values():
+            values.append(0)
+        return len(self.nodes['feature']) - 1
+
+    def set_split(self, node: int, feature: int, threshold: float, left: int, right: int, default_left: bool):
+        self.nodes['feature'][node] = feature
+        self.nodes['threshold'][node] = threshold
+        self.nodes['left'][node] = left
+        self.nodes['right'][node] = right
+        self.nodes['default_left'][node] = bool(default_left)
+
+    def set_leaf(self, node: int, value: float):
+        # Leaves loop back to themselves so traversal can run a fixed number of steps
+        self.nodes['left'][node] = node
+        self.nodes['right'][node] = node
+        self.nodes['value'][node] = value
+
+    def add_tree(self, root: int, depth: int, weight: float = 1.0):
+        self.roots.append(root)
+        self.tree_weight.append(weight)
+        self.max_depth = max(self.max_depth, depth)
+
+
+# ---------------------------------------------------------------------------
+# Per-library converters
+# ---------------------------------------------------------------------------
+
+def _convert_sklearn_trees(estimators, builder: TreeBuilder, weight: float):
+    """sklearn trees: x <= threshold goes left, inputs compared as float32"""
+    for est in estimators:
+        tree = est.tree_
+        offset = len(builder.nodes['feature'])
+        missing_left = getattr(tree, 'missing_go_to_left', None)
+        for _ in range(tree.node_count):
+            builder.new_node()
+        for i in range(tree.node_count):
+            node = offset + i
+            if tree.children_left[i] == -1:
+                builder.set_leaf(node, float(tree.value[i, 0, 0]))
+            else:
+                builder.set_split(node, int(tree.feature[i]), float(tree.threshold[i]),
+                                  offset + int(tree.children_left[i]), offset + int(tree.children_right[i]),
+                                  True if missing_left is None else missing_left[i])
+        builder.add_tree(offset, int(tree.max_depth), weight)
+
+
+def convert_random_forest(model) -> list:
+    builder = TreeBuilder('le', 'float32')
+    _convert_sklearn_trees(model.estimators_, builder, 1.0 / len(model.estimators_))
+    return [builder]
+
+
+def convert_gradient_boosting(model) -> list:
+    builder = TreeBuilder('le', 'float32')
+    if model.init_ == 'zero':
+        builder.bias = 0.0
+    elif hasattr(model.init_, 'constant_'):
+        builder.bias = float(np.ravel(model.init_.constant_)[0])
+    else:
+        raise ValueError("GradientBoosting with a custom init estimator cannot be compiled")
+    _convert_sklearn_trees(model.estimators_[:, 0], builder, model.learning_rate)
+    return [builder]
+
+
+def _tree_depth(left, right, root: int = 0) -> int:
+    """Depth of a tree given child index arrays (-1 marks a leaf)"""
+    depth, level = 0, [root]
+    while True:
+        level = [c for n in level for c in (left[n], right[n]) if c != -1]
+        if not level:
+            return depth
+        depth += 1
+
+
+def convert_xgboost(model) -> list:
+    """
+    XGBoost: x < split_condition goes left, inputs and thresholds are float32
+    and the margin is summed in float32, tree by tree
+    """
+    raw = json.loads(model.get_booster().save_raw(raw_format='json'))
+    builder = TreeBuilder('lt', 'float32', accumulate='float32')
+    builder.bias = float(raw['learner']['learner_model_param']['base_score'].strip('[]'))
+
+    trees = raw['learner']['gradient_booster']['model']['trees']
+    best = getattr(model, 'best_iteration', None)
+    if best is not None:
+        trees = trees[:best + 1]
+
+    for tree in trees:
+        if any(tree['split_type']):
+            raise ValueError("XGBoost categorical splits cannot be compiled")
+        left, right = tree['left_children'], tree['right_children']
+        offset = len(builder.nodes['feature'])
+        for _ in range(len(left)):
+            builder.new_node()
+        for i in range(len(left)):
+            # Leaves store their value in split_conditions
+            if left[i] == -1:
+                builder.set_leaf(offset + i, float(tree['split_conditions'][i]))
+            else:
+                builder.set_split(offset + i, int(tree['split_indices'][i]),
+                                  float(np.float32(tree['split_conditions'][i])),
+                                  offset + left[i], offset + right[i], tree['default_left'][i])
+        builder.add_tree(offset, _tree_depth(left, right))
+    return [builder]
+
+
+def convert_lightgbm(model) -> list:
+    """LightGBM: x <= threshold goes left, inputs compared as float64"""
+    dump = model.booster_.dump_model()
+    if dump.get('num_tree_per_iteration', 1) != 1:
+        raise ValueError("Multi-output LightGBM models cannot be compiled")
+    builder = TreeBuilder('le', 'float64')
+    n_trees = len(dump['tree_info'])
+    best = getattr(model, 'best_iteration_', None)
+    if best:
+        n_trees = best
+
+    def walk(node: dict) -> tuple:
+        idx = builder.new_node()
+        if 'leaf_value' in node:
+            builder.set_leaf(idx, float(node['leaf_value']))
+            return idx, 0
+        if node['decision_type'] != '<=':
+            raise ValueError("LightGBM categorical splits cannot be compiled")
+        missing = node['missing_type']
+        if missing == 'Zero':
+            raise ValueError("LightGBM zero-as-missing splits cannot be compiled")
+        # With missing_type None, LightGBM evaluates NaN as 0.0
+        default_left = node['default_left'] if missing == 'NaN' else 0.0 <= node['threshold']
+        left, left_depth = walk(node['left_child'])
+        right, right_depth = walk(node['right_child'])
+        builder.set_split(idx, int(node['split_feature']), float(node['threshold']), left, right, default_left)
+        return idx, 1 + max(left_depth, right_depth)
+
+    for info in dump['tree_info'][:n_trees]:
+        root, depth = walk(info['tree_structure'])
+        # Leaf values in the dump already include shrinkage
+        builder.add_tree(root, depth)
+    return [builder]
+
+
+def convert_catboost(model) -> list:
+    """
+    CatBoost oblivious trees: every level tests one split (bit = x > border)
+    and the leaf index is sum(bit_i << i). Expanded into full binary trees.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.json')
+        model.save_model(path, format='json')
+        with open(path, 'r', encoding='utf-8') as f:
+            dump = json.load(f)
+
+    float_features = dump['features_info'].get('float_features', [])
+    flat_index = {f['feature_index']: f['flat_feature_index'] for f in float_features}
+    nan_left = {f['feature_index']: f.get('nan_value_treatment') != 'AsTrue' for f in float_features}
+    scale, bias = dump.get('scale_and_bias', [1.0, [0.0]])
+
+    builder = TreeBuilder('le', 'float32')
+    builder.bias = float(np.ravel(bias)[0])
+
+    def expand(splits, leaf_values, level: int, path: int) -> int:
+        idx = builder.new_node()
+        if level == len(splits):
+            builder.set_leaf(idx, float(leaf_values[path]) * scale)
+            return idx
+        split = splits[level]
+        left = expand(splits, leaf_values, level + 1, path)
+        right = expand(splits, leaf_values, level + 1, path | (1 << level))
+        feature = split['float_feature_index']
+        builder.set_split(idx, flat_index[feature], float(np.float32(split['border'])),
+                          left, right, nan_left[feature])
+        return idx
+
+    for tree in dump['oblivious_trees']:
+        splits = tree['splits']
+        if any(s.get('split_type') != 'FloatFeature' for s in splits):
+            raise ValueError("CatBoost categorical (CTR / one-hot) splits cannot be compiled")
+        builder.add_tree(expand(splits, tree['leaf_values'], 0, 0), len(splits))
+    return [builder]
+
+
+CONVERTERS = {
+    'XGBRegressor': convert_xgboost,
+    'LGBMRegressor': convert_lightgbm,
+    'CatBoostRegressor': convert_catboost,
+    'RandomForestRegressor': convert_random_forest,
+    'ExtraTreesRegressor': convert_random_forest,
+    'GradientBoostingRegressor': convert_gradient_boosting,
+}
+
+
+def convert(model, weight: float = 1.0) -> list:
+    """Convert a model (or an ensemble of models) into a list of weighted tree groups"""
+    if hasattr(model, 'models') and hasattr(model, 'weights'):
+        groups = []
+        for member, member_weight in zip(model.models, model.weights):
+            groups.extend(convert(member, weight * float(member_weight)))
+        return groups
+
+    name = type(model).__name__
+    if name not in CONVERTERS:
+        raise ValueError(f"{name} cannot be compiled to tree arrays")
+    groups = CONVERTERS[name](model)
+    for group in groups:
+        group.weight *= weight
+    return groups
+
+
+def _layout(group: TreeBuilder, node_offset: int) -> dict:
+    """
+    Renumber a group's nodes tree by tree (breadth-first) so every right child
+    sits right after its left sibling. Leaves get a NaN threshold, which no
+    comparison passes, so traversal keeps them in place.
+    """
+    nodes = group.nodes
+    order, new_id = [], {}
+    for root in group.roots:
+        new_id[root] = len(order)
+        order.append(root)
+        i = new_id[root]
+        while i < len(order):
+            old = order[i]
+            if nodes['left'][old] != old:
+                for child in (nodes['left'][old], nodes['right'][old]):
+                    new_id[child] = len(order)
+                    order.append(child)
+            i += 1
+
+    layout = {'feature': [], 'threshold': [], 'left': [], 'default_left': [], 'value': []}
+    for old in order:
+        is_leaf = nodes['left'][old] == old
+        layout['feature'].append(nodes['feature'][old])
+        layout['threshold'].append(np.nan if is_leaf else nodes['threshold'][old])
+        layout['left'].append(node_offset + new_id[nodes['left'][old]])
+        layout['default_left'].append(True if is_leaf else nodes['default_left'][old])
+        layout['value'].append(nodes['value'][old])
+    layout['roots'] = [node_offset + new_id[root] for root in group.roots]
+    return layout
+
+
+def compile_model(model, feature_names: list = None, source: str = None) -> CompiledModel:
+    """
+    Flatten a fitted model into a CompiledModel
+
+    Args:
+        model: Fitted estimator, WeightedEnsemble/SimpleVoting or IntervalModel
+        feature_names: Column order the model was trained on
+        source: Path of the pickled model, recorded with its sha256
+    """
+    if hasattr(model, 'quantiles'):
+        # Interval model: point model is output 0, then one output per quantile
+        outputs = ['prediction'] + [quantile_label(q) for q in model.quantiles]
+        groups = [(i, group) for i, member in enumerate(model.models) for group in convert(member)]
+    else:
+        outputs = ['prediction']
+        groups = [(0, group) for group in convert(model)]
+    arrays = {'feature': [], 'threshold': [], 'left': [], 'default_left': [], 'value': [],
+              'roots': [], 'tree_weight': []}
+    meta_groups = []
+    tree_offset = 0
+    for output, group in groups:
+        layout = _layout(group, node_offset=len(arrays['feature']))
+        for key, values in layout.items():
+            arrays[key].extend(values)
+        arrays['tree_weight'].extend(group.tree_weight)
+        meta_groups.append({
+            'decision': group.decision,
+            'dtype': group.dtype,
+            'accumulate': group.accumulate,
+            'weight': group.weight,
+            'bias': group.bias,
+            'max_depth': group.max_depth,
+            'tree_start': tree_offset,
+            'tree_end': tree_offset + len(group.roots),
+            'output': output,
+        })
+        tree_offset += len(group.roots)
+
+    dtypes = {'feature': np.int32, 'threshold': np.float64, 'left': np.int32,
+              'default_left': np.bool_, 'value': np.float64, 'roots': np.int32, 'tree_weight': np.float64}
+    arrays = {key: np.asarray(values, dtype=dtypes[key]) for key, values in arrays.items()}
+
+    meta = {
+        'model_class': type(model).__name__,
+        'feature_names': list(feature_names) if feature_names is not None else None,
+        'groups': meta_groups,
+        'outputs': outputs,
+        'n_trees': int(tree_offset),
+        'n_nodes': len(arrays['feature']),
+    }
+    if hasattr(model, 'quantiles'):
+        meta['interval'] = {'quantiles': list(model.quantiles), 'margin': float(model.margin)}
+    if source:
+        meta['source'] = {'path': source, 'sha256': file_sha256(source)}
+    return CompiledModel(arrays, meta)
+
+
+def export_compiled(model, feature_names: list, directory: str = COMPILED_DIR, source: str = None):
+    """Compile and save a model; returns the CompiledModel"""
+    compiled = compile_model(model, feature_names, source)
+    compiled.save(directory)
+    return compiled
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def _time_predict(predict, X, repeats: int) -> float:
+    """Best-of-N latency in milliseconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predict(X)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _cold_load_seconds(snippet: str) -> float:
+    """Import + load time in a fresh interpreter"""
+    code = ("import time; _t = time.perf_counter()\n" + snippet +
+            "\nprint(time.perf_counter() - _t)")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=root, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def benchmark(model, compiled: CompiledModel, X: pd.DataFrame, model_path: str,
+              compiled_dir: str = COMPILED_DIR, repeats: int = 20) -> pd.DataFrame:
+    """Compare the compiled engine against the library model"""
+    library_pred = model.predict(X)
+    compiled_pred = compiled.predict(X)
+    max_abs_diff = float(np.max(np.abs(library_pred - compiled_pred)))
+
+    single = X.iloc[:1]
+    rows = []
+    for engine, predict, snippet in [
+        ('Library', model.predict,
+         f"import sys; sys.path.insert(0, '.'); import joblib; joblib.load({model_path!r})"),
+        ('Compiled', compiled.predict,
+         "import sys; sys.path.insert(0, '.'); from src.modeling.compiled_trees import CompiledModel; "
+         f"CompiledModel.load({compiled_dir!r})"),
+    ]:
+        rows.append({
+            'Engine': engine,
+            'Batch_Rows': len(X),
+            'Batch_Predict_ms': _time_predict(predict, X, repeats),
+            'Single_Row_Predict_ms': _time_predict(predict, single, repeats),
+            'Import_Load_Seconds': _cold_load_seconds(snippet),
+            'Max_Abs_Diff_Lakhs': 0.0 if engine == 'Library' else max_abs_diff,
+        })
+    return pd.DataFrame(rows)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Compile a trained model to flat tree arrays')
+    parser.add_argument('--model', default='best', help="Registered model name, 'best', or a .pkl path")
+    parser.add_argument('--out', default=None, help='Output directory (default: models/compiled/<name>)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    import joblib
+    from src.modeling.train_all import load_training_data, feature_cols
+    from src.modeling.registry import ModelRegistry
+
+    args = parse_args(argv)
+    registry = ModelRegistry()
+    model_path = args.model if os.path.exists(args.model) else registry.path(args.model)
+    registered = registry.entry(args.model) is not None and registry.path(args.model) == model_path
+    if args.out is None:
+        name = args.model if registered else os.path.splitext(os.path.basename(model_path))[0]
+        args.out = registry.compiled_target(name)
+
+    print("\n" + "="*80)
+    print("⚙️  COMPILING TREE MODEL TO NUMPY ARRAYS")
+    print("="*80)
+
+    model = joblib.load(model_path)
+    compiled = export_compiled(model, feature_cols, args.out, source=model_path)
+    if registered:
+        registry.set_compiled(registry.resolve(args.model), args.out)
+    print(f"✅ {type(model).__name__}: {compiled.n_trees} trees, {compiled.n_nodes} nodes → {args.out}/")
+
+    X, _, _ = load_training_data()
+    report = benchmark(model, compiled, X, model_path, args.out)
+
+    print("\n" + "="*80)
+    print("📊 LIBRARY vs COMPILED")
+    print("="*80)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.6g}"))
+    report.to_csv('reports/compiled_benchmark.csv', index=False)
+    print("\n💾 Report saved: reports/compiled_benchmark.csv")
+    print("="*80)
+    return report
+
+
+if __name__ == "__main__":
+    main()
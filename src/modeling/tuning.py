@@ -0,0 +1,226 @@
+"""
+BOOSTER HYPERPARAMETER TUNING - SUCCESSIVE HALVING
+- Early stopping on a held-out validation fold (carved from the training split)
+- Successive halving: many configs get a small round budget, the best 1/eta
+  survive to the next rung with eta x more rounds
+- Every rung is fitted in parallel through the TrainingScheduler
+
+Usage:
+    python src/modeling/tuning.py                  # 27 configs per booster, eta=3
+    python src/modeling/tuning.py --configs 81 --max-rounds 2000
+
+Writes:
+    reports/tuning_results.csv - every trial (rung, budget, params, score, fit time)
+    reports/tuned_params.json  - chosen config per booster (used by train_all.py --tuned)
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterSampler, train_test_split
+from xgboost import XGBRegressor
+from lightgbm import LGBMRegressor, early_stopping
+from catboost import CatBoostRegressor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.modeling.scheduler import TrainingScheduler
+
+TUNED_PARAMS_PATH = 'reports/tuned_params.json'
+
+SEARCH_SPACES = {
+    'XGBoost': {
+        'learning_rate': [0.03, 0.05, 0.1],
+        'max_depth': [4, 5, 6, 7, 8],
+        'min_child_weight': [1, 3, 5],
+        'subsample': [0.7, 0.85, 1.0],
+        'colsample_bytree': [0.7, 0.85, 1.0],
+    },
+    'LightGBM': {
+        'learning_rate': [0.03, 0.05, 0.1],
+        'num_leaves': [15, 31, 63, 127],
+        'max_depth': [-1, 5, 7, 9],
+        'min_child_samples': [5, 10, 20, 40],
+        'subsample': [0.7, 0.85, 1.0],
+        'colsample_bytree': [0.7, 0.85, 1.0],
+    },
+    'CatBoost': {
+        'learning_rate': [0.03, 0.05, 0.1],
+        'depth': [4, 5, 6, 7, 8],
+        'l2_leaf_reg': [1, 3, 5, 9],
+    },
+}
+
+
+def make_booster(name: str, params: dict, n_rounds: int, patience: int = None):
+    """Create a booster with `n_rounds` boosting rounds (and early stopping if patience is set)"""
+    if name == 'XGBoost':
+        return XGBRegressor(n_estimators=n_rounds, random_state=42, n_jobs=1,
+                            early_stopping_rounds=patience, **params)
+    if name == 'LightGBM':
+        extra = {'subsample_freq': 1} if params.get('subsample', 1.0) < 1.0 else {}
+        return LGBMRegressor(n_estimators=n_rounds, random_state=42, n_jobs=1, verbose=-1, **params, **extra)
+    if name == 'CatBoost':
+        return CatBoostRegressor(iterations=n_rounds, random_state=42, verbose=0, thread_count=1,
+                                 early_stopping_rounds=patience, **params)
+    raise ValueError(f"Unknown booster: {name}")
+
+
+def early_stopping_fit_params(name: str, X_val, y_val, patience: int) -> dict:
+    """fit() kwargs that evaluate on the validation fold"""
+    if name == 'XGBoost':
+        return {'eval_set': [(X_val, y_val)], 'verbose': False}
+    if name == 'LightGBM':
+        return {'eval_set': [(X_val, y_val)], 'callbacks': [early_stopping(patience, verbose=False)]}
+    return {'eval_set': (X_val, y_val)}
+
+
+def best_iteration(name: str, model) -> int:
+    """Number of rounds kept after early stopping"""
+    if name == 'XGBoost':
+        return int(model.best_iteration) + 1
+    if name == 'LightGBM':
+        return int(model.best_iteration_ or model.n_estimators)
+    return int(model.get_best_iteration()) + 1
+
+
+def rung_budgets(n_configs: int, eta: int, max_rounds: int) -> list:
+    """Round budget per rung, smallest first, ending at max_rounds"""
+    n_rungs = 1
+    while eta ** n_rungs <= n_configs:
+        n_rungs += 1
+    return [max(10, int(max_rounds / eta ** (n_rungs - 1 - k))) for k in range(n_rungs)]
+
+
+def successive_halving(name: str, X_train, y_train, X_val, y_val, scheduler,
+                       n_configs: int = 27, eta: int = 3, max_rounds: int = 1000, seed: int = 42):
+    """
+    Tune one booster with successive halving
+
+    Returns:
+        (best trial dict, list of all trial dicts)
+    """
+    configs = list(ParameterSampler(SEARCH_SPACES[name], n_iter=n_configs, random_state=seed))
+    trials = []
+
+    for rung, budget in enumerate(rung_budgets(len(configs), eta, max_rounds)):
+        patience = max(10, budget // 10)
+        print(f"\n  {name} rung {rung + 1}: {len(configs)} configs x {budget} rounds")
+
+        tasks = {f'{name} #{i}': make_booster(name, params, budget, patience) for i, params in enumerate(configs)}
+        fit_params = {task: early_stopping_fit_params(name, X_val, y_val, patience) for task in tasks}
+        fitted = scheduler.run(tasks, X_train, y_train, fit_params=fit_params)
+        fit_seconds = {t['Model']: t['Fit_Seconds'] for t in scheduler.timings}
+
+        rung_trials = []
+        for (task, model), params in zip(fitted.items(), configs):
+            rmse = float(np.sqrt(np.mean((model.predict(X_val) - np.asarray(y_val)) ** 2)))
+            rung_trials.append({
+                'Model': name,
+                'Rung': rung + 1,
+                'Budget_Rounds': budget,
+                'Best_Iteration': best_iteration(name, model),
+                'Val_RMSE': rmse,
+                'Fit_Seconds': fit_seconds[task],
+                'Params': params,
+            })
+        trials.extend(rung_trials)
+
+        rung_trials.sort(key=lambda t: t['Val_RMSE'])
+        keep = max(1, len(rung_trials) // eta)
+        configs = [t['Params'] for t in rung_trials[:keep]]
+
+    best = min((t for t in trials if t['Rung'] == trials[-1]['Rung']), key=lambda t: t['Val_RMSE'])
+    return best, trials
+
+
+def load_tuned_params(path: str = TUNED_PARAMS_PATH) -> dict:
+    """
+    Load chosen booster configs written by this module
+
+    Returns:
+        {booster name: constructor params incl. round count}, or {} if not tuned yet
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        chosen = json.load(f)
+    tuned = {}
+    for name, entry in chosen.items():
+        rounds_param = 'iterations' if name == 'CatBoost' else 'n_estimators'
+        tuned[name] = {**entry['params'], rounds_param: entry['n_rounds']}
+        if name == 'LightGBM' and entry['params'].get('subsample', 1.0) < 1.0:
+            tuned[name]['subsample_freq'] = 1
+    return tuned
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Tune booster hyperparameters with successive halving')
+    parser.add_argument('--configs', type=int, default=27, help='Configs sampled per booster')
+    parser.add_argument('--eta', type=int, default=3, help='Keep 1/eta configs per rung')
+    parser.add_argument('--max-rounds', type=int, default=1000, help='Round budget of the final rung')
+    parser.add_argument('--workers', type=int, default=None, help='Maximum concurrent fits')
+    parser.add_argument('--models', nargs='+', default=list(SEARCH_SPACES), choices=list(SEARCH_SPACES))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from src.modeling.train_all import load_training_data
+
+    args = parse_args(argv)
+
+    print("\n" + "="*80)
+    print("🔍 BOOSTER TUNING - SUCCESSIVE HALVING + EARLY STOPPING")
+    print("="*80)
+
+    X, y, _ = load_training_data()
+    # Same test split as train_all.py; the validation fold comes out of the training part only
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_fit, X_val, y_fit, y_val = train_test_split(X_train, y_train, test_size=0.2, random_state=42)
+    print(f"✅ Fit: {len(X_fit)}, Validation: {len(X_val)} (test split untouched)")
+
+    scheduler = TrainingScheduler(max_workers=args.workers)
+    all_trials = []
+    chosen = {}
+
+    for name in args.models:
+        start = time.perf_counter()
+        best, trials = successive_halving(name, X_fit, y_fit, X_val, y_val, scheduler,
+                                          n_configs=args.configs, eta=args.eta, max_rounds=args.max_rounds)
+        search_seconds = time.perf_counter() - start
+        all_trials.extend(trials)
+        chosen[name] = {
+            'params': best['Params'],
+            'n_rounds': best['Best_Iteration'],
+            'val_rmse': best['Val_RMSE'],
+            'fit_seconds': best['Fit_Seconds'],
+            'search_fit_seconds': sum(t['Fit_Seconds'] for t in trials),
+            'search_wall_seconds': search_seconds,
+            'trials': len(trials),
+        }
+        print(f"\n  ✅ {name}: RMSE={best['Val_RMSE']:.2f}L with {best['Best_Iteration']} rounds "
+              f"(search {search_seconds:.1f}s, {len(trials)} fits)")
+
+    trials_df = pd.DataFrame(all_trials)
+    trials_df['Params'] = trials_df['Params'].apply(json.dumps)
+    trials_df.to_csv('reports/tuning_results.csv', index=False)
+    with open(TUNED_PARAMS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(chosen, f, indent=2)
+
+    print("\n" + "="*80)
+    print("📊 CHOSEN CONFIGS")
+    print("="*80)
+    for name, entry in chosen.items():
+        print(f"  {name:10} rounds={entry['n_rounds']:5d} | RMSE={entry['val_rmse']:6.2f}L | "
+              f"fit={entry['fit_seconds']:.2f}s | {entry['params']}")
+    print(f"\n💾 Trials saved: reports/tuning_results.csv")
+    print(f"💾 Chosen configs saved: {TUNED_PARAMS_PATH}")
+    print("   Use: python src/modeling/train_all.py --tuned")
+    print("="*80)
+    return chosen
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,33 @@
 """
 Phase 2 - NLP & LLM Module
 RealEstateSense: AI-Driven Insight Generation Engine
+
+Submodules are imported on first use of a class (PEP 562), so importing the
+package does not load pandas or the LLM clients.
 """
 
-from .amenity_extractor import AmenityExtractor
-from .summary_generator import PropertySummaryGenerator
-from .quality_scorer import DescriptionQualityScorer
-from .locality_analyzer import LocalityAnalyzer
-from .qa_system import PropertyQASystem
-
-__all__ = [
-    'AmenityExtractor',
-    'PropertySummaryGenerator',
-    'DescriptionQualityScorer',
-    'LocalityAnalyzer',
-    'PropertyQASystem'
-]
+import importlib
+
+_CLASSES = {
+    'AmenityExtractor': '.amenity_extractor',
+    'PropertySummaryGenerator': '.summary_generator',
+    'DescriptionQualityScorer': '.quality_scorer',
+    'LocalityAnalyzer': '.locality_analyzer',
+    'PropertyQASystem': '.qa_system',
+    'PropertyBrochureGenerator': '.brochure_generator',
+    'GenerationEngine': '.generation_engine',
+}
+
+__all__ = list(_CLASSES)
+
+
+def __getattr__(name):
+    if name not in _CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_CLASSES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,24 +10,64 @@ Generates detailed, professional property brochures with:
 """
 
 import os
+import queue
+import sys
 import warnings
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
 warnings.filterwarnings('ignore')
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.lazy_imports import lazy_import
+from src.nlp.generation_engine import DEFAULT_MAX_IN_FLIGHT, GenerationEngine
+from src.nlp.llm_cache import LLMCache
+from src.nlp.llm_client import get_client
+
+requests = lazy_import('requests')
+
+
+# Display order and headings of the text brochure
+BROCHURE_SECTIONS = [
+    ('overview', '📋 PROPERTY OVERVIEW'),
+    ('details', '📊 PROPERTY DETAILS'),
+    ('highlights', '⭐ KEY HIGHLIGHTS'),
+    ('location', '📍 LOCATION ADVANTAGES'),
+    ('amenities', '🏢 AMENITIES & FACILITIES'),
+    ('investment', '💰 INVESTMENT ANALYSIS'),
+    ('target_buyers', '👥 IDEAL FOR'),
+]
+BROCHURE_HEADER = "\n".join(["=" * 80, " " * 25 + "PROPERTY BROCHURE", "=" * 80, ""])
+BROCHURE_FOOTER = "\n".join(["=" * 80, " " * 20 + "Contact for Site Visits & Bookings", "=" * 80])
+
+
+class SectionPrompt(NamedTuple):
+    """Ollama request for one brochure section"""
+    prompt: str
+    max_length: int
+    scope: Optional[tuple] = None   # memo key for sections shared across listings
+    suffix: str = ''                # property-specific text appended to the shared answer
+
+
 class PropertyBrochureGenerator:
     """Generate detailed property brochures using Ollama Local LLM"""
     
-    def __init__(self, use_ollama: bool = True, ollama_model: str = "llama2"):
+    def __init__(self, use_ollama: bool = True, ollama_model: str = "llama2",
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, use_cache: bool = True):
         """
         Initialize the brochure generator with Ollama
         
         Args:
             use_ollama: If True, use Ollama for AI generation (default: True)
             ollama_model: Model to use (default: llama2, options: llama3.1, mistral)
+            max_in_flight: Concurrent Ollama requests (default: $OLLAMA_MAX_IN_FLIGHT or 4)
+            use_cache: Reuse earlier responses to identical prompts (data/cache/llm_responses.sqlite)
         """
         self.use_ollama = use_ollama
         self.ollama_model = ollama_model
         self.ollama_url = os.environ.get('OLLAMA_BASE_URL', 'http://localhost:11434')
+        self.client = get_client(self.ollama_url)
+        self.engine = GenerationEngine(self._generate_with_ollama, max_in_flight)
+        self.cache = LLMCache() if use_ollama and use_cache else None
+        self._profiles = None
         
         # Check if Ollama is available
         if use_ollama:
@@ -46,57 +86,65 @@ class PropertyBrochureGenerator:
     
     def _check_ollama_available(self) -> bool:
         """Check if Ollama is running locally"""
-        try:
-            import requests
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=2)
-            return response.status_code == 200
-        except:
-            return False
+        return self.client.available()
     
-    def _generate_with_ollama(self, prompt: str, max_length: int = 500) -> str:
-        """Generate text using Ollama Local LLM"""
+    def _generate_with_ollama(self, prompt: str, max_length: int = 500, on_token: Callable = None) -> str:
+        """
+        Generate text using Ollama Local LLM
+        
+        Args:
+            on_token: If given, the response is streamed and each fragment passed to it as it arrives
+        """
+        options = {
+            "temperature": 0.7,
+            "num_predict": max_length,
+            "top_p": 0.9
+        }
         try:
-            import requests
-            
-            # Use Local Ollama
-            API_URL = f"{self.ollama_url}/api/generate"
-            
-            payload = {
-                "model": self.ollama_model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "num_predict": max_length,
-                    "top_p": 0.9
-                }
-            }
+            if self.cache is not None:
+                cached = self.cache.get(self.ollama_model, options, prompt)
+                if cached is not None:
+                    if on_token:
+                        on_token(cached)
+                    return cached
             
-            response = requests.post(API_URL, json=payload, timeout=90)
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result.get('response', '')
-                if content and len(content.strip()) > 10:
-                    return content.strip()
-                return ""
+            if on_token:
+                content = ''
+                for token in self.client.stream(self.ollama_model, prompt, options):
+                    on_token(token)
+                    content += token
             else:
-                print(f"⚠️  Ollama Error: Status {response.status_code}")
-                return ""
+                result = self.client.generate(self.ollama_model, prompt, options)
+                content = result.get('response', '')
+            if content and len(content.strip()) > 10:
+                if self.cache is not None:
+                    self.cache.put(self.ollama_model, options, prompt, content.strip())
+                return content.strip()
+            return ""
             
+        except requests.exceptions.HTTPError as e:
+            print(f"⚠️  Ollama Error: Status {e.response.status_code}")
+            return ""
         except requests.exceptions.Timeout:
             print("⚠️  Ollama timeout (model might be slow)")
             return ""
         except requests.exceptions.ConnectionError:
             print("⚠️  Ollama connection failed - is it running?")
             return ""
-        except ImportError:
-            print("⚠️  'requests' module not found")
-            return ""
         except Exception as e:
             print(f"⚠️  Ollama error: {str(e)[:50]}")
             return ""
     
+    def _locality_profile(self, locality: str) -> Dict:
+        """Precomputed profile of a locality ({} if unknown), from the store loaded on first use"""
+        if self._profiles is None:
+            try:
+                from src.locality_profiles import load_profiles
+                self._profiles = load_profiles()
+            except Exception:
+                self._profiles = {}
+        return self._profiles.get(locality, {})
+    
     def _generate_with_template(self, prompt: str, property_data: Dict = None) -> str:
         """Fallback template-based generation - property-specific"""
         # This shouldn't be called if templates are working properly
@@ -106,13 +154,83 @@ class PropertyBrochureGenerator:
     def generate_detailed_brochure(self, property_data: Dict) -> Dict[str, str]:
         """
         Generate a comprehensive property brochure
-        
+
         Args:
             property_data: Dictionary with property details
-            
+
         Returns:
             Dictionary with brochure sections
         """
+        brochure = next(self.generate_brochures([property_data]))
+        if isinstance(brochure, Exception):
+            raise brochure
+        return brochure
+
+    def generate_brochures(self, properties: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Generate brochures for many properties, in input order
+
+        All AI sections of a brochure, and of the next few brochures, are
+        requested concurrently - at most `max_in_flight` Ollama calls at a time.
+        Locality-scoped sections are requested once per scope and shared.
+
+        Args:
+            properties: Property dictionaries (consumed lazily)
+
+        Yields:
+            Brochure dictionaries, same as generate_detailed_brochure - or, for a
+            property that could not be processed, the exception it raised, so one
+            bad listing does not end the whole run
+        """
+        if not self.use_ollama:
+            for property_data in properties:
+                try:
+                    yield self._plan_brochure(property_data)[0]
+                except Exception as e:
+                    yield e
+            return
+
+        def start(property_data):
+            try:
+                brochure, prompts = self._plan_brochure(property_data)
+            except Exception as e:
+                return e
+            futures = {section: (self.engine.submit_once(p.scope, p.prompt, p.max_length) if p.scope
+                                 else self.engine.submit(p.prompt, p.max_length))
+                       for section, p in prompts.items()}
+            return brochure, prompts, futures
+
+        def finish(job):
+            if isinstance(job, Exception):
+                return job
+            brochure, prompts, futures = job
+            try:
+                return self._finish_brochure(brochure, prompts, {section: f.result() for section, f in futures.items()})
+            except Exception as e:
+                return e
+
+        yield from self.engine.pipeline(properties, start, finish)
+
+    def _finish_brochure(self, brochure: Dict, prompts: Dict[str, SectionPrompt], ai_results: Dict[str, str]) -> Dict:
+        """Replace template sections with the AI text that came back (plus any property-specific suffix)"""
+        for section, text in ai_results.items():
+            if text:
+                suffix = prompts[section].suffix
+                brochure[section] = f"{text} {suffix}" if suffix else text
+                brochure['ai_generated'] = True
+        return brochure
+
+    def _plan_brochure(self, property_data: Dict) -> Tuple[Dict, Dict[str, SectionPrompt]]:
+        """
+        Template brochure plus the Ollama prompt for each AI section
+
+        Only the overview is prompted per property; location, amenities,
+        investment outlook and buyer profile prompts carry a scope key shared by
+        every listing in the same locality / tier / price band.
+
+        Returns:
+            (brochure, {section: SectionPrompt})
+        """
         bhk = property_data.get('BHK', 'N/A')
         area = property_data.get('Area_SqFt', 'N/A')
         locality = property_data.get('Locality', 'Unknown')
@@ -120,19 +238,26 @@ class PropertyBrochureGenerator:
         property_type = property_data.get('Property_Type', 'Property')
         furnishing = property_data.get('Furnishing_Status', 'Unfurnished')
         amenities_count = property_data.get('Amenities_Count', 0)
+        # Missing (None/NaN) counts as none; a whole number, since it sizes the amenity list
+        amenities_count = int(amenities_count) if amenities_count is not None and amenities_count == amenities_count else 0
         tier = property_data.get('Locality_Tier', 'Unknown')
         seller_type = property_data.get('Seller_Type', 'Unknown')
         under_construction = property_data.get('Under_Construction', 0)
         
         # Calculate price per sqft
-        price_per_sqft = (float(price) * 100000 / float(area)) if price != 'N/A' and area != 'N/A' else 0
+        price_per_sqft = (float(price) * 100000 / float(area)) if price != 'N/A' and area != 'N/A' and float(area) > 0 else 0
+        # Locality-scoped sections are generated once per locality, tier and price band
+        from src.banding import price_bands
+        price_band = (price_bands(float(price)) if price != 'N/A' else None) or 'Unknown'
+        # Locality character and typical buyers ground the AI sections (prompts only)
+        locality_profile = self._locality_profile(locality) if self.use_ollama else {}
+        character = f"\nLocality Character: {locality_profile['personality']['personality']}" if locality_profile else ""
+        audience = f"\nTypical Buyers Here: {', '.join(locality_profile['target_audience'])}" if locality_profile else ""
         
         brochure = {}
+        prompts = {}
         import random
-        
-        # Track if AI was actually used
-        ai_used = False
-        
+
         # Get additional context if available
         raw_json = property_data.get('Raw_JSON', '')
         description = property_data.get('Description', '')
@@ -172,23 +297,15 @@ class PropertyBrochureGenerator:
             f"Spread across {area} sqft, this property {random.choice(value_phrases)}."
         )
         
-        if self.use_ollama:
-            prompt = f"""Write a unique, compelling property overview (2-3 sentences) for this real estate listing:
+        brochure['overview'] = overview_template
+        prompts['overview'] = SectionPrompt(f"""Write a unique, compelling property overview (2-3 sentences) for this real estate listing:
 
 Property: {bhk} BHK {property_type} in {locality}, Ahmedabad
 Price: ₹{price} Lakhs | Area: {area} sqft | Furnishing: {furnishing}
 Locality Tier: {tier}
 Status: {'Under Construction' if under_construction else 'Ready to Move'}{context}
 
-Write a professional, buyer-focused overview highlighting what makes this property special. Be specific and unique."""
-            ai_result = self._generate_with_ollama(prompt, max_length=150)
-            if ai_result:
-                brochure['overview'] = ai_result
-                ai_used = True
-            else:
-                brochure['overview'] = overview_template
-        else:
-            brochure['overview'] = overview_template
+Write a professional, buyer-focused overview highlighting what makes this property special. Be specific and unique.""", 150)
         
         # 2. Key Highlights
         highlights_template = f"""
@@ -200,24 +317,8 @@ Write a professional, buyer-focused overview highlighting what makes this proper
 • {'Ready to move in' if not under_construction else 'Under construction - attractive pre-launch pricing'}
 """
         
-        if self.use_ollama:
-            prompt = f"""List 6 key highlights for this property (bullet points):
-Property: {bhk} BHK, {area} sqft, {property_type}
-Price: ₹{price} Lakhs (₹{price_per_sqft:.0f}/sqft)
-Location: {locality} ({tier})
-Furnishing: {furnishing}
-Amenities: {amenities_count}
-Status: {'Under Construction' if under_construction else 'Ready to Move'}
-
-Key Highlights:"""
-            ai_result = self._generate_with_ollama(prompt, max_length=200)
-            if ai_result:
-                brochure['highlights'] = ai_result
-                ai_used = True
-            else:
-                brochure['highlights'] = highlights_template
-        else:
-            brochure['highlights'] = highlights_template
+        # Listing facts only - no AI call
+        brochure['highlights'] = highlights_template
         
         # 3. Location Advantages
         location_benefits = {
@@ -243,47 +344,32 @@ Key Highlights:"""
         tier_key = 'Tier 1' if 'Tier 1' in tier else ('Tier 2' if 'Tier 2' in tier else 'Tier 3')
         location_template = '\n'.join(location_benefits.get(tier_key, location_benefits['Tier 2']))
         
-        if self.use_ollama:
-            prompt = f"""Describe location advantages of {locality}, Ahmedabad (3-4 points):
-Locality Tier: {tier}
-Property Type: {property_type}
+        brochure['location'] = location_template
+        prompts['location'] = SectionPrompt(f"""Describe location advantages of {locality}, Ahmedabad (3-4 points):
+Locality Tier: {tier}{character}
+
+Location Advantages:""", 200, scope=('location', locality, tier))
 
-Location Advantages:"""
-            ai_result = self._generate_with_ollama(prompt, max_length=200)
-            if ai_result:
-                brochure['location'] = ai_result
-                ai_used = True
-            else:
-                brochure['location'] = location_template
-        else:
-            brochure['location'] = location_template
-        
         # 4. Amenities Details
-        if self.use_ollama:
-            prompt = f"""List typical amenities for a {property_type} with {amenities_count} amenities (bullet points):
-
-Amenities:"""
-            ai_result = self._generate_with_ollama(prompt, max_length=150)
-            if ai_result:
-                brochure['amenities'] = ai_result
-                ai_used = True
-        
-        if not self.use_ollama or not brochure.get('amenities'):
-            common_amenities = [
-                '• 24x7 Security with CCTV surveillance',
-                '• Covered Car Parking',
-                '• Power Backup',
-                '• Water Supply',
-                '• Lift/Elevator',
-                '• Gymnasium',
-                '• Swimming Pool',
-                '• Children\'s Play Area',
-                '• Clubhouse',
-                '• Landscaped Gardens'
-            ]
-            # Select amenities based on count
-            amenities_to_show = min(amenities_count + 2, len(common_amenities))
-            brochure['amenities'] = '\n'.join(common_amenities[:amenities_to_show])
+        prompts['amenities'] = SectionPrompt(f"""List typical amenities for a {property_type} with {amenities_count} amenities (bullet points):
+
+Amenities:""", 150, scope=('amenities', property_type, amenities_count))
+
+        common_amenities = [
+            '• 24x7 Security with CCTV surveillance',
+            '• Covered Car Parking',
+            '• Power Backup',
+            '• Water Supply',
+            '• Lift/Elevator',
+            '• Gymnasium',
+            '• Swimming Pool',
+            '• Children\'s Play Area',
+            '• Clubhouse',
+            '• Landscaped Gardens'
+        ]
+        # Select amenities based on count
+        amenities_to_show = min(amenities_count + 2, len(common_amenities))
+        brochure['amenities'] = '\n'.join(common_amenities[:amenities_to_show])
         
         # 5. Investment Analysis - Generate varied analysis
         roi_phrases = {
@@ -326,31 +412,23 @@ Amenities:"""
         }
         bhk_key = min(max(bhk_int, 2), 5)
         
-        investment_template = (
-            f"This property promises {random.choice(roi_phrases[tier_key])}. "
+        roi_phrase = random.choice(roi_phrases[tier_key])
+        property_investment = (
             f"{random.choice(market_phrases)} competitive positioning in {locality}. "
             f"The {bhk} BHK layout {random.choice(demand_phrases.get(bhk_key, demand_phrases[3]))}, "
             f"ensuring consistent rental demand and resale liquidity."
         )
+        investment_template = f"This property promises {roi_phrase}. {property_investment}"
         
-        if self.use_ollama:
-            prompt = f"""Write a detailed investment analysis (3-4 sentences) for this property:
-
-Property: {bhk} BHK {property_type}
-Price: ₹{price} Lakhs | Area: {area} sqft | Price/sqft: ₹{price_per_sqft:.0f}
-Location: {locality} ({tier})
-Furnishing: {furnishing}
-Amenities: {amenities_count}{context}
-
-Analyze investment potential, ROI prospects, rental demand, and capital appreciation. Be specific to this property and location."""
-            ai_result = self._generate_with_ollama(prompt, max_length=200)
-            if ai_result:
-                brochure['investment'] = ai_result
-                ai_used = True
-            else:
-                brochure['investment'] = investment_template
-        else:
-            brochure['investment'] = investment_template
+        # Market outlook is shared by the locality and price band; the property's own figures are appended
+        brochure['investment'] = investment_template
+        prompts['investment'] = SectionPrompt(f"""Write a short investment outlook (2-3 sentences) for residential property in {locality}, Ahmedabad:
+
+Locality Tier: {tier}
+Price Band: {price_band}
+
+Analyze ROI prospects, rental demand, and capital appreciation for this locality and budget. Be specific to the location.""", 200,
+                                              scope=('investment', locality, tier, price_band), suffix=property_investment)
         
         # 6. Target Buyer Profile - Generate varied profiles
         buyer_profiles = {
@@ -424,30 +502,21 @@ Analyze investment potential, ROI prospects, rental demand, and capital apprecia
             f"The property's configuration and {locality}'s infrastructure cater specifically to their preferences"
         ]
         
-        target_buyers_template = f"Best suited for {profile}. {random.choice(reasons)}."
-        
-        if self.use_ollama:
-            prompt = f"""Identify the ideal buyer profile for this property (2-3 sentences):
-
-Property: {bhk} BHK {property_type}
-Price: ₹{price} Lakhs | Area: {area} sqft
-Location: {locality} ({tier})
-Furnishing: {furnishing}
-Amenities: {amenities_count}
-
-Describe who would benefit most from this property. Be specific about demographics, lifestyle, and needs."""
-            ai_result = self._generate_with_ollama(prompt, max_length=150)
-            if ai_result:
-                brochure['target_buyers'] = ai_result
-                ai_used = True
-            else:
-                brochure['target_buyers'] = target_buyers_template
-        else:
-            brochure['target_buyers'] = target_buyers_template
-        
-        # Mark whether AI was successfully used for content generation
-        brochure['ai_generated'] = ai_used
+        reason = random.choice(reasons)
+        target_buyers_template = f"Best suited for {profile}. {reason}."
         
+        brochure['target_buyers'] = target_buyers_template
+        prompts['target_buyers'] = SectionPrompt(f"""Identify the ideal buyer profile for homes in {locality}, Ahmedabad (2-3 sentences):
+
+Locality Tier: {tier}{character}{audience}
+Price Band: {price_band}
+
+Describe who would benefit most from buying here in this budget. Be specific about demographics, lifestyle, and needs.""", 150,
+                                                 scope=('target_buyers', locality, tier, price_band), suffix=f"{reason}.")
+
+        # Filled in by _finish_brochure once the AI sections are back
+        brochure['ai_generated'] = False
+
         # 7. Property Details Summary
         brochure['details'] = {
             'Property Type': property_type,
@@ -463,65 +532,79 @@ Describe who would benefit most from this property. Be specific about demographi
             'Status': 'Under Construction' if under_construction else 'Ready to Move'
         }
         
-        return brochure
+        return brochure, prompts
     
     def format_brochure_text(self, brochure: Dict) -> str:
         """Format brochure as plain text"""
-        output = []
-        output.append("=" * 80)
-        output.append(" " * 25 + "PROPERTY BROCHURE")
-        output.append("=" * 80)
-        output.append("")
-        
-        # Overview
-        output.append("📋 PROPERTY OVERVIEW")
-        output.append("-" * 80)
-        output.append(brochure['overview'])
-        output.append("")
-        
-        # Details
-        output.append("📊 PROPERTY DETAILS")
-        output.append("-" * 80)
-        for key, value in brochure['details'].items():
-            output.append(f"  {key:<20}: {value}")
-        output.append("")
-        
-        # Key Highlights
-        output.append("⭐ KEY HIGHLIGHTS")
-        output.append("-" * 80)
-        output.append(brochure['highlights'])
-        output.append("")
-        
-        # Location
-        output.append("📍 LOCATION ADVANTAGES")
-        output.append("-" * 80)
-        output.append(brochure['location'])
-        output.append("")
-        
-        # Amenities
-        output.append("🏢 AMENITIES & FACILITIES")
-        output.append("-" * 80)
-        output.append(brochure['amenities'])
-        output.append("")
-        
-        # Investment
-        output.append("💰 INVESTMENT ANALYSIS")
-        output.append("-" * 80)
-        output.append(brochure['investment'])
-        output.append("")
-        
-        # Target Buyers
-        output.append("👥 IDEAL FOR")
-        output.append("-" * 80)
-        output.append(brochure['target_buyers'])
-        output.append("")
-        
-        output.append("=" * 80)
-        output.append(" " * 20 + "Contact for Site Visits & Bookings")
-        output.append("=" * 80)
-        
+        output = [BROCHURE_HEADER]
+        for section, heading in BROCHURE_SECTIONS:
+            output.append(heading)
+            output.append("-" * 80)
+            output.append(self._section_text(brochure, section))
+            output.append("")
+        output.append(BROCHURE_FOOTER)
         return "\n".join(output)
     
+    def _section_text(self, brochure: Dict, section: str) -> str:
+        if section == 'details':
+            return "\n".join(f"  {key:<20}: {value}" for key, value in brochure['details'].items())
+        return brochure[section]
+    
+    def stream_brochure(self, property_data: Dict, write: Callable[[str], None] = None) -> Dict:
+        """
+        Generate one brochure while rendering it as text, section by section
+        
+        Every AI section starts streaming at once (up to `max_in_flight`); the
+        section being shown prints its tokens as they arrive, and later sections
+        have usually finished by the time they are reached. Same layout as
+        format_brochure_text.
+        
+        Args:
+            property_data: Dictionary with property details
+            write: Receives text pieces (default: print to the terminal without buffering)
+            
+        Returns:
+            The brochure dictionary, same as generate_detailed_brochure
+        """
+        write = write or (lambda text: print(text, end='', flush=True))
+        brochure, prompts = self._plan_brochure(property_data)
+        
+        tokens, futures = {}, {}
+        if self.use_ollama:
+            for section, p in prompts.items():
+                tokens[section] = queue.Queue()
+                futures[section] = self.engine.pool.submit(self._stream_section, p, tokens[section])
+        
+        write(BROCHURE_HEADER + "\n")
+        results = {}
+        for section, heading in BROCHURE_SECTIONS:
+            write(f"{heading}\n{'-' * 80}\n")
+            if section in futures:
+                streamed = False
+                for token in iter(tokens[section].get, None):
+                    write(token)
+                    streamed = True
+                results[section] = futures[section].result()
+                if results[section]:
+                    suffix = prompts[section].suffix
+                    write(f" {suffix}" if suffix else "")
+                else:
+                    # Nothing usable came back - show the template instead
+                    write(("\n" if streamed else "") + brochure[section])
+            else:
+                write(self._section_text(brochure, section))
+            write("\n\n")
+        write(BROCHURE_FOOTER + "\n")
+        
+        return self._finish_brochure(brochure, prompts, results)
+    
+    def _stream_section(self, p: SectionPrompt, tokens: queue.Queue) -> str:
+        """Generate one section, pushing fragments onto `tokens` (None marks the end)"""
+        try:
+            return self._generate_with_ollama(p.prompt, p.max_length, on_token=tokens.put)
+        finally:
+            tokens.put(None)
+    
     def save_brochure_html(self, brochure: Dict, filename: str = 'property_brochure.html'):
         """Save brochure as HTML file"""
         html = f"""
@@ -707,7 +790,7 @@ if __name__ == "__main__":
     print("=" * 80)
     
     # Initialize generator (will use template mode if no API key)
-    generator = PropertyBrochureGenerator(use_hf_api=True)
+    generator = PropertyBrochureGenerator(use_ollama=True)
     
     # Generate brochure
     brochure = generator.generate_detailed_brochure(test_property)
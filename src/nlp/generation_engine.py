@@ -0,0 +1,139 @@
+"""
+Concurrent LLM Generation Engine
+Runs blocking generation calls (one HTTP request each) on a thread pool with a
+fixed in-flight limit, so the sections of a brochure - and several brochures -
+are generated at the same time instead of one request after another.
+
+Usage:
+    engine = GenerationEngine(generator._generate_with_ollama, max_in_flight=4)
+    futures = {'overview': engine.submit(overview_prompt, 150),
+               'location': engine.submit_once(('location', locality), location_prompt, 200)}
+    texts = {name: f.result() for name, f in futures.items()}
+
+    # Benchmark against the local stub server (no Ollama needed)
+    python src/nlp/generation_engine.py --properties 12 --delay 0.3 --max-in-flight 1 4 8
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+DEFAULT_MAX_IN_FLIGHT = int(os.environ.get('OLLAMA_MAX_IN_FLIGHT', 4))
+
+
+class GenerationEngine:
+    """Thread pool that issues at most `max_in_flight` generation calls at once"""
+
+    def __init__(self, generate: Callable[[str, int], str], max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        """
+        Args:
+            generate: Blocking call (prompt, max_length) -> text
+            max_in_flight: Concurrent calls allowed (1 = sequential)
+        """
+        self.generate = generate
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._pool = None
+        self._memo = {}
+        self._memo_lock = threading.Lock()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        # Created on first use, so template-only runs never start threads
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix='llm')
+        return self._pool
+
+    def submit(self, prompt: str, max_length: int) -> Future:
+        return self.pool.submit(self.generate, prompt, max_length)
+
+    def submit_once(self, key, prompt: str, max_length: int) -> Future:
+        """
+        Like submit, but every call with the same key shares the first call's Future
+
+        A call that fails or comes back empty is forgotten once it finishes, so
+        the next call with that key tries again instead of reusing the failure.
+        """
+        with self._memo_lock:
+            future = self._memo.get(key)
+            if future is None:
+                future = self._memo[key] = self.submit(prompt, max_length)
+                created = True
+            else:
+                created = False
+        if created:
+            # Outside the lock: the callback runs right here if the call has already finished
+            future.add_done_callback(lambda f: self._forget_failed(key, f))
+        return future
+
+    def _forget_failed(self, key, future: Future):
+        if future.cancelled() or future.exception() is not None or not future.result():
+            with self._memo_lock:
+                if self._memo.get(key) is future:
+                    del self._memo[key]
+
+    def pipeline(self, items: Iterable, start: Callable, finish: Callable, window: int = None) -> Iterator:
+        """
+        Ordered, bounded fan-out over many items
+
+        start(item) queues an item's calls and returns a handle; finish(handle)
+        waits for them. Up to `window` items are started ahead of the one being
+        finished, which keeps the pool busy without queueing the whole input.
+
+        Yields:
+            finish() results in input order
+        """
+        window = window or self.max_in_flight
+        started = deque()
+        for item in items:
+            started.append(start(item))
+            if len(started) > window:
+                yield finish(started.popleft())
+        while started:
+            yield finish(started.popleft())
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+if __name__ == "__main__":
+    import argparse
+    from src.nlp.brochure_generator import PropertyBrochureGenerator
+    from src.nlp.ollama_stub import start_stub
+
+    parser = argparse.ArgumentParser(description='Time brochure generation against the Ollama stub')
+    parser.add_argument('--properties', type=int, default=12)
+    parser.add_argument('--delay', type=float, default=0.3, help='Stub seconds per generation')
+    parser.add_argument('--max-in-flight', type=int, nargs='+', default=[1, 4, 8])
+    args = parser.parse_args()
+
+    properties = [{'BHK': 2 + i % 3, 'Area_SqFt': 900 + 50 * i, 'Locality': 'Bopal', 'Price_Lakhs': 45 + i,
+                   'Property_Type': 'Apartment', 'Furnishing_Status': 'Semi-Furnished', 'Amenities_Count': 3,
+                   'Locality_Tier': 'Tier 2', 'Seller_Type': 'Owner', 'Under_Construction': 0}
+                  for i in range(args.properties)]
+
+    print("=" * 80)
+    print(f"BROCHURE GENERATION BENCHMARK ({args.properties} properties, {args.delay}s per call)")
+    print("=" * 80)
+    for limit in args.max_in_flight:
+        server, url = start_stub(delay=args.delay)
+        os.environ['OLLAMA_BASE_URL'] = url
+        generator = PropertyBrochureGenerator(use_ollama=True, max_in_flight=limit, use_cache=False)
+        start = time.perf_counter()
+        brochures = list(generator.generate_brochures(properties))
+        elapsed = time.perf_counter() - start
+        generator.engine.close()
+        generator.client.close()
+        server.shutdown()
+        ai = sum(b['ai_generated'] for b in brochures)
+        latency = generator.client.stats.summary()['latency_mean_s']
+        print(f"  max_in_flight={limit:<3} {elapsed:6.2f}s | {server.stats['requests']} calls over "
+              f"{server.stats['connections']} connections (peak {server.stats['max_concurrent']} concurrent) | "
+              f"{latency:.3f}s avg latency | {ai}/{len(brochures)} AI brochures")
@@ -0,0 +1,121 @@
+"""
+Persistent LLM Response Cache
+SQLite store of generated texts keyed by model, options and a normalized
+prompt hash, so re-running brochure generation over the same properties
+reuses earlier answers instead of calling the model again.
+
+Entries expire after `ttl_days`; when the stored texts exceed `max_mb` the
+least recently used ones are evicted.
+
+Usage:
+    cache = LLMCache()
+    text = cache.get('llama2', options, prompt)      # None on a miss
+    cache.put('llama2', options, prompt, text)
+    cache.report()                                   # hit rate of this run
+
+Files:
+    data/cache/llm_responses.sqlite
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+CACHE_PATH = 'data/cache/llm_responses.sqlite'
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so formatting-only differences share an entry"""
+    return re.sub(r'\s+', ' ', prompt).strip()
+
+
+def cache_key(model: str, options: dict, prompt: str) -> str:
+    payload = json.dumps([model, options or {}, normalize_prompt(prompt)], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """Disk-backed prompt -> response cache with TTL and size-bounded LRU eviction"""
+
+    def __init__(self, path: str = CACHE_PATH, ttl_days: float = 30, max_mb: float = 100):
+        """
+        Args:
+            path: SQLite file (created if missing)
+            ttl_days: Age after which an entry is ignored and purged
+            max_mb: Total response text kept before evicting least recently used entries
+        """
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # One connection shared by the generation engine's threads, serialized by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY, model TEXT, response TEXT,
+            size INTEGER, created REAL, last_used REAL)""")
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)')
+        self._conn.execute('DELETE FROM responses WHERE created < ?', (time.time() - self.ttl,))
+        self._conn.commit()
+        self._bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def get(self, model: str, options: dict, prompt: str):
+        """Cached response text, or None"""
+        key = cache_key(model, options, prompt)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT response FROM responses WHERE key = ? AND created >= ?',
+                                     (key, now - self.ttl)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute('UPDATE responses SET last_used = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, model: str, options: dict, prompt: str, response: str):
+        key = cache_key(model, options, prompt)
+        size = len(response.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._conn.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                               (key, model, response, size, now, now))
+            self._bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the store is within max_bytes"""
+        while self._bytes > self.max_bytes:
+            rows = self._conn.execute('SELECT key, size FROM responses ORDER BY last_used LIMIT 100').fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self._bytes <= self.max_bytes:
+                    break
+                self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._bytes -= size
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups * 100 if lookups else 0.0
+
+    def report(self):
+        lookups = self.hits + self.misses
+        if lookups:
+            print(f"🗃️  LLM cache: {self.hits}/{lookups} hits ({self.hit_rate():.1f}%) | "
+                  f"{self._bytes / 1024:.0f} KB stored in {self.path}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
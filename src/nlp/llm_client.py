@@ -0,0 +1,212 @@
+"""
+Shared Ollama Client
+One pooled, keep-alive HTTP session per Ollama server, reused by the brochure
+generator, the chatbot and every availability check, plus per-call metrics:
+latency, time to first token (streamed calls), generation speed (tokens/sec
+from Ollama's eval_count/eval_duration) and error counts.
+
+Usage:
+    from src.nlp.llm_client import get_client
+    client = get_client()                        # $OLLAMA_BASE_URL or localhost:11434
+    if client.available():
+        text = client.generate('llama2', prompt, {'num_predict': 150})['response']
+        for token in client.stream('llama2', prompt):   # NDJSON stream, token by token
+            print(token, end='', flush=True)
+    client.stats.report()
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Iterator
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.lazy_imports import lazy_import
+
+# Imported on the first request, so entry points start without it
+requests = lazy_import('requests')
+
+DEFAULT_URL = 'http://localhost:11434'
+# Keep-alive connections kept per server; above the generation engine's in-flight limit
+POOL_SIZE = 16
+
+
+class LLMStats:
+    """Thread-safe call metrics of one client"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.latencies = []
+        self.first_token = []
+        self.eval_tokens = 0
+        self.eval_seconds = 0.0
+        self.errors = Counter()
+
+    def record(self, latency: float, result: dict = None, error: str = None, first_token: float = None):
+        with self._lock:
+            self.calls += 1
+            self.latencies.append(latency)
+            if first_token is not None:
+                self.first_token.append(first_token)
+            if error:
+                self.errors[error] += 1
+            elif result and result.get('eval_duration'):
+                self.eval_tokens += result.get('eval_count', 0)
+                self.eval_seconds += result['eval_duration'] / 1e9
+
+    def summary(self) -> dict:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            n = len(latencies)
+            first_token = sorted(self.first_token)
+            return {
+                'calls': self.calls,
+                'errors': sum(self.errors.values()),
+                'errors_by_type': dict(self.errors),
+                'latency_mean_s': sum(latencies) / n if n else 0.0,
+                'latency_p50_s': latencies[n // 2] if n else 0.0,
+                'latency_p95_s': latencies[min(n - 1, int(n * 0.95))] if n else 0.0,
+                'streamed': len(first_token),
+                'ttft_mean_s': sum(first_token) / len(first_token) if first_token else 0.0,
+                'ttft_p50_s': first_token[len(first_token) // 2] if first_token else 0.0,
+                'tokens_per_sec': self.eval_tokens / self.eval_seconds if self.eval_seconds else 0.0,
+            }
+
+    def report(self, title: str = 'LLM calls'):
+        s = self.summary()
+        if not s['calls']:
+            return
+        errors = ', '.join(f"{k}: {v}" for k, v in s['errors_by_type'].items()) or 'none'
+        ttft = f"first token avg {s['ttft_mean_s']:.2f}s | " if s['streamed'] else ''
+        print(f"📡 {title}: {s['calls']} | latency avg {s['latency_mean_s']:.2f}s "
+              f"(p50 {s['latency_p50_s']:.2f}s, p95 {s['latency_p95_s']:.2f}s) | {ttft}"
+              f"{s['tokens_per_sec']:.1f} tokens/sec | errors: {errors}")
+
+
+class OllamaClient:
+    """Ollama HTTP API over a pooled requests.Session"""
+
+    def __init__(self, base_url: str = None):
+        """
+        Args:
+            base_url: Ollama server (default: $OLLAMA_BASE_URL or http://localhost:11434)
+        """
+        self.base_url = (base_url or os.environ.get('OLLAMA_BASE_URL', DEFAULT_URL)).rstrip('/')
+        self.stats = LLMStats()
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        # Shared by the generation engine's threads; urllib3 hands each its own pooled connection
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+        return self._session
+
+    def available(self, timeout: float = 2) -> bool:
+        """True if the server answers /api/tags"""
+        try:
+            return self.session.get(f"{self.base_url}/api/tags", timeout=timeout).status_code == 200
+        except Exception:
+            return False
+
+    def generate(self, model: str, prompt: str, options: dict = None, timeout: float = 90) -> dict:
+        """
+        One non-streaming /api/generate call
+
+        Args:
+            model: Ollama model name
+            prompt: Prompt text
+            options: Ollama options (temperature, num_predict, ...)
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            Ollama's response JSON ('response', 'eval_count', ...)
+
+        Raises:
+            requests.exceptions.RequestException (HTTPError for non-200 replies)
+        """
+        payload = {"model": model, "prompt": prompt, "stream": False, "options": options or {}}
+        start = time.perf_counter()
+        try:
+            response = self.session.post(f"{self.base_url}/api/generate", json=payload, timeout=timeout)
+            response.raise_for_status()
+            result = response.json()
+        except Exception as e:
+            self.stats.record(time.perf_counter() - start, error=type(e).__name__)
+            raise
+        self.stats.record(time.perf_counter() - start, result)
+        return result
+
+    def stream(self, model: str, prompt: str, options: dict = None, timeout: float = 90) -> Iterator[str]:
+        """
+        One streaming /api/generate call: Ollama sends NDJSON lines, each with
+        a 'response' fragment, until a final line with done=true and the stats
+
+        Args:
+            Same as generate (timeout applies between chunks)
+
+        Yields:
+            Text fragments as they arrive
+
+        Raises:
+            requests.exceptions.RequestException, or RuntimeError for an error line
+        """
+        payload = {"model": model, "prompt": prompt, "stream": True, "options": options or {}}
+        start = time.perf_counter()
+        first_token = None
+        final = None
+        error = None
+        try:
+            with self.session.post(f"{self.base_url}/api/generate", json=payload,
+                                   timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if 'error' in chunk:
+                        raise RuntimeError(chunk['error'])
+                    token = chunk.get('response', '')
+                    if token:
+                        if first_token is None:
+                            first_token = time.perf_counter() - start
+                        yield token
+                    if chunk.get('done'):
+                        final = chunk   # read on to the end so the connection goes back to the pool
+        except BaseException as e:
+            # GeneratorExit: the caller stopped iterating (break, Ctrl+C) before the reply ended
+            error = 'Cancelled' if isinstance(e, GeneratorExit) else type(e).__name__
+            raise
+        finally:
+            # Every call is counted, however the stream ended
+            self.stats.record(time.perf_counter() - start, final, error=error, first_token=first_token)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+# One client per server URL, shared by every caller in the process
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(base_url: str = None) -> OllamaClient:
+    url = (base_url or os.environ.get('OLLAMA_BASE_URL', DEFAULT_URL)).rstrip('/')
+    with _clients_lock:
+        if url not in _clients:
+            _clients[url] = OllamaClient(url)
+        return _clients[url]
@@ -8,11 +8,19 @@ Aggregates property data by locality and generates:
 - Locality personality/character
 """
 
+import copy
+import os
+import sys
 import pandas as pd
 import numpy as np
 from typing import Dict, List
 from collections import Counter
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.aggregates import load_aggregates
+from src.locality_profiles import (common_amenities, common_bhk, locality_personality, locality_stats,
+                                   target_audience)
+
 class LocalityAnalyzer:
     """Analyze and generate summaries for localities"""
     
@@ -23,173 +31,103 @@ class LocalityAnalyzer:
             # Filter out Unknown localities
             self.df = self.df[self.df['Locality'] != 'Unknown'].copy()
             print(f"✅ Loaded {len(self.df)} properties from {self.df['Locality'].nunique()} localities")
+            # Per-locality rollups, computed once per dataset version
+            self.agg = load_aggregates(data_path, df=self.df)
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             self.df = pd.DataFrame()
+            self.agg = None
+        # Row positions of every locality, grouped once, so no query scans the whole frame
+        self._rows = self.df.groupby('Locality').indices if 'Locality' in self.df.columns else {}
+        # (analysis, locality) -> result, filled on first request
+        self._profiles = {}
+    
+    def _locality_data(self, locality: str) -> pd.DataFrame:
+        """The locality's listings, via the grouped index"""
+        if locality not in self._rows:
+            return self.df.iloc[0:0]
+        return self.df.iloc[self._rows[locality]]
+    
+    def _cached(self, analysis: str, locality: str, compute):
+        """compute(locality) on the first request, the stored result (a copy) afterwards"""
+        key = (analysis, locality)
+        if key not in self._profiles:
+            self._profiles[key] = compute(locality)
+        return copy.deepcopy(self._profiles[key])
+    
+    def get_locality_profile(self, locality: str) -> Dict:
+        """
+        Stats, BHK mix, amenities, audience and personality of a locality (cached)
+
+        For every locality at once use src.locality_profiles.load_profiles().
+        """
+        return {
+            'stats': self.get_locality_stats(locality),
+            'common_bhk': self.get_common_bhk(locality),
+            'amenities': self.get_common_amenities(locality),
+            'target_audience': self.identify_target_audience(locality),
+            'personality': self.determine_locality_personality(locality),
+        }
     
     def get_locality_stats(self, locality: str) -> Dict:
         """Get statistical summary for a locality"""
-        locality_data = self.df[self.df['Locality'] == locality]
-        
-        if len(locality_data) == 0:
+        return self._cached('stats', locality, self._locality_stats)
+    
+    def _locality_stats(self, locality: str) -> Dict:
+        if self.agg is None or locality not in self.agg.locality.index:
             return {'error': f'No data found for {locality}'}
-        
-        stats = {
-            'locality': locality,
-            'total_properties': len(locality_data),
-            'avg_price_lakhs': round(locality_data['Price_Lakhs'].mean(), 2),
-            'median_price_lakhs': round(locality_data['Price_Lakhs'].median(), 2),
-            'min_price_lakhs': round(locality_data['Price_Lakhs'].min(), 2),
-            'max_price_lakhs': round(locality_data['Price_Lakhs'].max(), 2),
-            'avg_area_sqft': round(locality_data['Area_SqFt'].mean(), 0),
-            'median_area_sqft': round(locality_data['Area_SqFt'].median(), 0),
-            'locality_tier': locality_data['Locality_Tier'].mode().values[0] if 'Locality_Tier' in locality_data.columns else 'Unknown'
-        }
-        
-        return stats
+        return locality_stats(locality, self.agg.locality.loc[locality])
     
     def get_common_bhk(self, locality: str) -> List[tuple]:
         """Get most common BHK configurations"""
-        locality_data = self.df[self.df['Locality'] == locality]
-        
-        if len(locality_data) == 0:
+        return self._cached('common_bhk', locality, self._common_bhk)
+    
+    def _common_bhk(self, locality: str) -> List[tuple]:
+        if self.agg is None or locality not in self.agg.locality.index:
             return []
-        
-        bhk_counts = locality_data['BHK'].value_counts()
-        total = len(locality_data)
-        
-        result = []
-        for bhk, count in bhk_counts.head(3).items():
-            percentage = (count / total) * 100
-            result.append((int(bhk), count, round(percentage, 1)))
-        
-        return result
+        return common_bhk(self.agg.locality_bhk_counts(locality), self.agg.locality.loc[locality, 'count'])
     
     def get_common_amenities(self, locality: str) -> List[str]:
         """Get most common amenities in the locality"""
-        locality_data = self.df[self.df['Locality'] == locality]
+        return self._cached('amenities', locality, self._common_amenities)
+    
+    def _common_amenities(self, locality: str) -> List[str]:
+        locality_data = self._locality_data(locality)
         
         if len(locality_data) == 0 or 'Amenities_Count' not in locality_data.columns:
             return []
         
         # Based on amenities count distribution
-        avg_amenities = locality_data['Amenities_Count'].mean()
-        
-        amenities_list = []
-        if avg_amenities >= 4:
-            amenities_list = ['Gym', 'Swimming Pool', 'Security', 'Parking', 'Garden', 'Clubhouse']
-        elif avg_amenities >= 2:
-            amenities_list = ['Security', 'Parking', 'Lift', 'Power Backup']
-        else:
-            amenities_list = ['Basic Security', 'Parking']
-        
-        return amenities_list
+        return common_amenities(locality_data['Amenities_Count'].mean())
     
     def identify_target_audience(self, locality: str) -> List[str]:
         """Identify target audience based on property characteristics"""
-        locality_data = self.df[self.df['Locality'] == locality]
+        return self._cached('target_audience', locality, self._target_audience)
+    
+    def _target_audience(self, locality: str) -> List[str]:
+        locality_data = self._locality_data(locality)
         
         if len(locality_data) == 0:
             return ['General Buyers']
         
-        audience = []
-        
-        # Check BHK distribution
         bhk_mode = locality_data['BHK'].mode().values[0] if len(locality_data['BHK'].mode()) > 0 else 2
-        
-        if bhk_mode >= 4:
-            audience.append('Large Families')
-        elif bhk_mode == 3:
-            audience.append('Families')
-        elif bhk_mode == 2:
-            audience.append('Small Families / Working Professionals')
-        else:
-            audience.append('Students / Bachelors')
-        
-        # Check price range
-        avg_price = locality_data['Price_Lakhs'].mean()
-        if avg_price >= 100:
-            audience.append('High-Income Buyers')
-        elif avg_price >= 60:
-            audience.append('Upper-Middle Class')
-        elif avg_price >= 40:
-            audience.append('Middle Class')
-        else:
-            audience.append('Budget Buyers')
-        
-        # Check property type
+        apartment_share = None
         if 'Property_Type' in locality_data.columns:
-            apt_ratio = (locality_data['Property_Type'] == 'Apartment').sum() / len(locality_data)
-            if apt_ratio > 0.8:
-                audience.append('Apartment Seekers')
-            elif apt_ratio < 0.3:
-                audience.append('Independent House Seekers')
-        
-        return audience
+            apartment_share = (locality_data['Property_Type'] == 'Apartment').sum() / len(locality_data)
+        return target_audience(bhk_mode, locality_data['Price_Lakhs'].mean(), apartment_share)
     
     def determine_locality_personality(self, locality: str) -> Dict[str, str]:
         """Determine locality character/personality"""
-        locality_data = self.df[self.df['Locality'] == locality]
+        return self._cached('personality', locality, self._locality_personality)
+    
+    def _locality_personality(self, locality: str) -> Dict[str, str]:
+        locality_data = self._locality_data(locality)
         
         if len(locality_data) == 0:
             return {'personality': 'Unknown', 'description': 'No data available'}
         
-        stats = self.get_locality_stats(locality)
-        avg_price = stats['avg_price_lakhs']
-        tier = stats['locality_tier']
-        property_count = stats['total_properties']
-        
-        personality = []
-        description_parts = []
-        
-        # Price-based personality
-        if tier == 'Tier 1' or avg_price >= 100:
-            personality.append('Premium')
-            description_parts.append('high-end residential area')
-        elif tier == 'Tier 2' or avg_price >= 50:
-            personality.append('Mid-Range')
-            description_parts.append('well-established residential locality')
-        else:
-            personality.append('Budget-Friendly')
-            description_parts.append('affordable housing option')
-        
-        # Activity level
-        if property_count >= 100:
-            personality.append('Highly Active')
-            description_parts.append('high market activity')
-        elif property_count >= 50:
-            personality.append('Active')
-            description_parts.append('good market activity')
-        else:
-            personality.append('Emerging')
-            description_parts.append('developing area')
-        
-        # Amenities level
         avg_amenities = locality_data['Amenities_Count'].mean() if 'Amenities_Count' in locality_data.columns else 0
-        if avg_amenities >= 4:
-            personality.append('Amenity-Rich')
-            description_parts.append('excellent amenities')
-        elif avg_amenities >= 2:
-            personality.append('Well-Facilitated')
-            description_parts.append('good basic facilities')
-        
-        # Size preference
-        avg_area = stats['avg_area_sqft']
-        if avg_area >= 1500:
-            personality.append('Spacious')
-            description_parts.append('larger properties')
-        elif avg_area >= 1000:
-            personality.append('Comfortable')
-            description_parts.append('moderately-sized properties')
-        else:
-            personality.append('Compact')
-            description_parts.append('compact living spaces')
-        
-        return {
-            'personality': ' & '.join(personality),
-            'description': f"A {', '.join(description_parts)}",
-            'character_tags': personality
-        }
+        return locality_personality(self.get_locality_stats(locality), avg_amenities)
     
     def generate_locality_summary(self, locality: str, use_llm: bool = False) -> str:
         """
@@ -199,15 +137,16 @@ class LocalityAnalyzer:
             locality: Locality name
             use_llm: If True, use LLM for generation (requires setup)
         """
-        stats = self.get_locality_stats(locality)
+        profile = self.get_locality_profile(locality)
+        stats = profile['stats']
         
         if 'error' in stats:
             return stats['error']
         
-        bhk_distribution = self.get_common_bhk(locality)
-        amenities = self.get_common_amenities(locality)
-        target_audience = self.identify_target_audience(locality)
-        personality = self.determine_locality_personality(locality)
+        bhk_distribution = profile['common_bhk']
+        amenities = profile['amenities']
+        target_audience = profile['target_audience']
+        personality = profile['personality']
         
         # Build summary
         summary = f"""
@@ -282,12 +221,15 @@ LOCALITY COMPARISON: {locality1.upper()} vs {locality2.upper()}
     
     def get_top_localities_by_metric(self, metric: str = 'price', top_n: int = 10) -> pd.DataFrame:
         """Get top localities by a specific metric"""
+        table = self.agg.locality.sort_index()
         if metric == 'price':
-            return self.df.groupby('Locality')['Price_Lakhs'].agg(['mean', 'median', 'count']).sort_values('mean', ascending=False).head(top_n)
+            stats = table[['price_mean', 'price_median', 'count']].set_axis(['mean', 'median', 'count'], axis=1)
+            return stats.sort_values('mean', ascending=False).head(top_n)
         elif metric == 'area':
-            return self.df.groupby('Locality')['Area_SqFt'].agg(['mean', 'median', 'count']).sort_values('mean', ascending=False).head(top_n)
+            stats = table[['area_mean', 'area_median', 'count']].set_axis(['mean', 'median', 'count'], axis=1)
+            return stats.sort_values('mean', ascending=False).head(top_n)
         elif metric == 'activity':
-            return self.df.groupby('Locality').size().sort_values(ascending=False).head(top_n)
+            return table['count'].sort_values(ascending=False).head(top_n)
         else:
             return pd.DataFrame()
 
@@ -0,0 +1,136 @@
+"""
+Local Ollama Stub Server
+Mimics the Ollama endpoints the project uses (GET /api/tags, POST /api/generate)
+with a fixed per-request delay and canned text, so LLM code paths can be run
+and timed without a model. Like Ollama, /api/generate streams NDJSON chunks
+(spread over the delay) unless the request sets "stream": false.
+
+Usage:
+    python src/nlp/ollama_stub.py --port 11435 --delay 0.5
+    OLLAMA_BASE_URL=http://localhost:11435 python main_phase2.py
+
+    # In-process (benchmarks / checks)
+    from src.nlp.ollama_stub import start_stub
+    server, url = start_stub(delay=0.2)
+    ...
+    print(server.stats)              # requests served, peak concurrency, TCP connections opened
+    server.shutdown()
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CANNED_RESPONSE = ("This stub response stands in for a model completion. It is long enough "
+                   "to pass the generator's minimum-length check and says nothing specific.")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler; server settings live on self.server"""
+
+    # Keep-alive, like Ollama, so clients can reuse pooled connections; headers and
+    # body go out in one buffered write so delayed ACKs don't stall reused sockets
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.stats['connections'] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload: dict, status: int = 200):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_ndjson(self, model: str, words: list, stats: dict):
+        """One NDJSON line per word, chunked transfer encoding, delay spread across the words"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        lines = [{'model': model, 'response': (' ' if i else '') + word, 'done': False}
+                 for i, word in enumerate(words)]
+        lines.append({'model': model, 'response': '', **stats})
+        for line in lines:
+            if not line['done']:
+                time.sleep(self.server.delay / len(words))
+            data = (json.dumps(line) + '\n').encode('utf-8')
+            self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        if self.path == '/api/tags':
+            self._send_json({'models': [{'name': 'llama2:latest'}]})
+        else:
+            self._send_json({'error': 'not found'}, 404)
+
+    def do_POST(self):
+        if self.path != '/api/generate':
+            self._send_json({'error': 'not found'}, 404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        server = self.server
+        with server.lock:
+            server.stats['requests'] += 1
+            server.in_flight += 1
+            server.stats['max_concurrent'] = max(server.stats['max_concurrent'], server.in_flight)
+        try:
+            model = request.get('model', 'llama2')
+            words = CANNED_RESPONSE.split()
+            stats = {'done': True, 'eval_count': len(words), 'eval_duration': int(server.delay * 1e9)}
+            if request.get('stream', True):
+                self._stream_ndjson(model, words, stats)
+            else:
+                time.sleep(server.delay)
+                self._send_json({'model': model, 'response': CANNED_RESPONSE, **stats})
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+def make_server(host: str = '127.0.0.1', port: int = 0, delay: float = 0.5) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.delay = delay
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.stats = {'requests': 0, 'max_concurrent': 0, 'connections': 0}
+    return server
+
+
+def start_stub(port: int = 0, delay: float = 0.5) -> tuple:
+    """
+    Serve the stub from a background thread
+
+    Returns:
+        (server, base_url) - call server.shutdown() when done
+    """
+    server = make_server(port=port, delay=delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve a stand-in for the Ollama API')
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--delay', type=float, default=0.5, help='Seconds per /api/generate request')
+    args = parser.parse_args()
+
+    server = make_server(port=args.port, delay=args.delay)
+    print(f"🧪 Ollama stub on http://127.0.0.1:{args.port} ({args.delay}s per generation) - Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n👋 Served {server.stats['requests']} generations over {server.stats['connections']} connections "
+              f"(peak {server.stats['max_concurrent']} concurrent)")
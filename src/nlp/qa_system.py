@@ -3,10 +3,16 @@ Property Q&A System (Simple RAG-like approach)
 Answers natural language questions about properties
 """
 
+import os
+import sys
 import pandas as pd
 from typing import Dict, List
 import re
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.aggregates import load_aggregates
+from src.locality_profiles import load_profiles
+
 class PropertyQASystem:
     """Answer questions about properties using rule-based approach"""
     
@@ -16,13 +22,20 @@ class PropertyQASystem:
             self.df = pd.read_csv(data_path)
             self.df = self.df[self.df['Locality'] != 'Unknown'].copy()
             print(f"✅ Loaded {len(self.df)} properties for Q&A")
+            # Statistics answers read the materialized rollups, not the rows
+            self.agg = load_aggregates(data_path, df=self.df)
+            # Locality questions are answered from the precomputed profiles
+            self.profiles = load_profiles(data_path, df=self.df)
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             self.df = pd.DataFrame()
+            self.agg = None
+            self.profiles = {}
     
     def answer_question(self, question: str) -> str:
         """Answer a question about properties"""
         question_lower = question.lower()
+        locality = self._mentioned_locality(question_lower)
         
         # Price-related questions
         if any(word in question_lower for word in ['cheap', 'affordable', 'budget', 'cheapest']):
@@ -40,6 +53,8 @@ class PropertyQASystem:
                 return self._answer_best_localities()
             elif 'compare' in question_lower:
                 return self._answer_compare_localities(question_lower)
+            elif locality:
+                return self._answer_locality_profile(locality)
         
         # BHK-related questions
         elif 'bhk' in question_lower:
@@ -53,8 +68,38 @@ class PropertyQASystem:
         elif 'how many' in question_lower or 'total' in question_lower:
             return self._answer_count_query(question_lower)
         
+        # A locality by name ("Tell me about Bopal")
+        elif locality:
+            return self._answer_locality_profile(locality)
+        
         else:
-            return "I can answer questions about:\n• Prices (cheapest, expensive, average)\n• Localities (best, compare)\n• BHK configurations\n• Property sizes\n• Total counts and statistics"
+            return "I can answer questions about:\n• Prices (cheapest, expensive, average)\n• Localities (best, compare, or any locality by name)\n• BHK configurations\n• Property sizes\n• Total counts and statistics"
+    
+    def _mentioned_locality(self, question: str):
+        """Locality named in the question (longest match, so 'South Bopal' beats 'Bopal'), or None"""
+        for locality in sorted(self.profiles, key=len, reverse=True):
+            if locality.lower() in question:
+                return locality
+        return None
+    
+    def _answer_locality_profile(self, locality: str) -> str:
+        """Profile of one locality"""
+        profile = self.profiles[locality]
+        stats = profile['stats']
+        
+        result = f"\n📍 {locality} ({stats['locality_tier']}):\n\n"
+        result += f"• Properties: {stats['total_properties']}\n"
+        result += f"• Average Price: ₹{stats['avg_price_lakhs']}L (median ₹{stats['median_price_lakhs']}L)\n"
+        result += f"• Price Range: ₹{stats['min_price_lakhs']}L - ₹{stats['max_price_lakhs']}L\n"
+        result += f"• Average Area: {stats['avg_area_sqft']:.0f} sqft\n"
+        if profile['common_bhk']:
+            result += "• Popular: " + ', '.join(f"{bhk} BHK ({pct}%)" for bhk, _, pct in profile['common_bhk']) + "\n"
+        result += f"• Character: {profile['personality']['personality']}\n"
+        result += f"• Ideal For: {', '.join(profile['target_audience'])}\n"
+        if profile['amenities']:
+            result += f"• Common Amenities: {', '.join(profile['amenities'])}\n"
+        
+        return result
     
     def _answer_cheapest_properties(self, question: str) -> str:
         """Find cheapest properties"""
@@ -95,19 +140,18 @@ class PropertyQASystem:
     
     def _answer_average_price(self, question: str) -> str:
         """Calculate average prices"""
-        overall_avg = self.df['Price_Lakhs'].mean()
-        overall_median = self.df['Price_Lakhs'].median()
+        overall = self.agg.overall
         
         result = f"\n💰 Price Statistics:\n\n"
-        result += f"• Overall Average: ₹{overall_avg:.2f} Lakhs\n"
-        result += f"• Overall Median: ₹{overall_median:.2f} Lakhs\n"
-        result += f"• Price Range: ₹{self.df['Price_Lakhs'].min()}L - ₹{self.df['Price_Lakhs'].max()}L\n\n"
+        result += f"• Overall Average: ₹{overall['price_mean']:.2f} Lakhs\n"
+        result += f"• Overall Median: ₹{overall['price_median']:.2f} Lakhs\n"
+        result += f"• Price Range: ₹{overall['price_min']}L - ₹{overall['price_max']}L\n\n"
         
         # By tier
-        if 'Locality_Tier' in self.df.columns:
+        if self.agg.tier is not None:
             result += "By Locality Tier:\n"
             for tier in ['Tier 1', 'Tier 2', 'Tier 3']:
-                tier_avg = self.df[self.df['Locality_Tier'] == tier]['Price_Lakhs'].mean()
+                tier_avg = self.agg.tier['price_mean'].get(tier, float('nan'))
                 result += f"• {tier}: ₹{tier_avg:.2f}L (avg)\n"
         
         return result
@@ -118,13 +162,13 @@ class PropertyQASystem:
         
         # By average price (premium)
         result += "Most Premium (Highest Avg Price):\n"
-        top_by_price = self.df.groupby('Locality')['Price_Lakhs'].mean().nlargest(5)
+        top_by_price = self.agg.locality['price_mean'].sort_index().nlargest(5)
         for loc, price in top_by_price.items():
             result += f"• {loc}: ₹{price:.2f}L\n"
         
         # By property count (most active)
         result += "\nMost Active (Most Properties):\n"
-        top_by_count = self.df['Locality'].value_counts().head(5)
+        top_by_count = self.agg.locality['count'].head(5)
         for loc, count in top_by_count.items():
             result += f"• {loc}: {count} properties\n"
         
@@ -133,18 +177,14 @@ class PropertyQASystem:
     def _answer_compare_localities(self, question: str) -> str:
         """Compare localities mentioned in question"""
         # Simple: just show top 3 localities comparison
-        top_3 = self.df.groupby('Locality').agg({
-            'Price_Lakhs': 'mean',
-            'Area_SqFt': 'mean',
-            'BHK': 'mean'
-        }).nlargest(3, 'Price_Lakhs')
+        top_3 = self.agg.locality[['price_mean', 'area_mean', 'bhk_mean']].sort_index().nlargest(3, 'price_mean')
         
         result = "\n📊 Locality Comparison (Top 3):\n\n"
         for loc, data in top_3.iterrows():
             result += f"• {loc}:\n"
-            result += f"  Avg Price: ₹{data['Price_Lakhs']:.2f}L\n"
-            result += f"  Avg Area: {data['Area_SqFt']:.0f} sqft\n"
-            result += f"  Avg BHK: {data['BHK']:.1f}\n\n"
+            result += f"  Avg Price: ₹{data['price_mean']:.2f}L\n"
+            result += f"  Avg Area: {data['area_mean']:.0f} sqft\n"
+            result += f"  Avg BHK: {data['bhk_mean']:.1f}\n\n"
         
         return result
     
@@ -152,12 +192,11 @@ class PropertyQASystem:
         """Answer BHK-related questions"""
         result = "\n🏠 BHK Distribution:\n\n"
         
-        bhk_counts = self.df['BHK'].value_counts().sort_index()
-        total = len(self.df)
+        bhk_stats = self.agg.bhk.sort_index()
+        total = self.agg.overall['count']
         
-        for bhk, count in bhk_counts.items():
+        for bhk, count, avg_price in bhk_stats[['count', 'price_mean']].itertuples():
             percentage = (count / total) * 100
-            avg_price = self.df[self.df['BHK'] == bhk]['Price_Lakhs'].mean()
             result += f"• {int(bhk)} BHK: {count} properties ({percentage:.1f}%) | Avg Price: ₹{avg_price:.2f}L\n"
         
         return result
@@ -166,14 +205,14 @@ class PropertyQASystem:
         """Answer area/size-related questions"""
         result = "\n📏 Property Size Statistics:\n\n"
         
-        result += f"• Average Area: {self.df['Area_SqFt'].mean():.0f} sqft\n"
-        result += f"• Median Area: {self.df['Area_SqFt'].median():.0f} sqft\n"
-        result += f"• Range: {self.df['Area_SqFt'].min():.0f} - {self.df['Area_SqFt'].max():.0f} sqft\n\n"
+        overall = self.agg.overall
+        result += f"• Average Area: {overall['area_mean']:.0f} sqft\n"
+        result += f"• Median Area: {overall['area_median']:.0f} sqft\n"
+        result += f"• Range: {overall['area_min']:.0f} - {overall['area_max']:.0f} sqft\n\n"
         
         # By BHK
         result += "Average Area by BHK:\n"
-        for bhk in sorted(self.df['BHK'].unique()):
-            avg_area = self.df[self.df['BHK'] == bhk]['Area_SqFt'].mean()
+        for bhk, avg_area in self.agg.bhk['area_mean'].sort_index().items():
             result += f"• {int(bhk)} BHK: {avg_area:.0f} sqft\n"
         
         return result
@@ -181,12 +220,12 @@ class PropertyQASystem:
     def _answer_count_query(self, question: str) -> str:
         """Answer counting questions"""
         result = "\n📊 Dataset Statistics:\n\n"
-        result += f"• Total Properties: {len(self.df)}\n"
-        result += f"• Unique Localities: {self.df['Locality'].nunique()}\n"
+        result += f"• Total Properties: {self.agg.overall['count']}\n"
+        result += f"• Unique Localities: {self.agg.overall['n_localities']}\n"
         
-        if 'Property_Type' in self.df.columns:
+        if self.agg.property_type is not None:
             result += f"\nBy Property Type:\n"
-            for ptype, count in self.df['Property_Type'].value_counts().items():
+            for ptype, count in self.agg.property_type['count'].items():
                 result += f"• {ptype}: {count}\n"
         
         return result
@@ -204,6 +243,7 @@ if __name__ == "__main__":
         "What are the cheapest properties?",
         "Show me the average price",
         "Which are the best localities?",
+        "Tell me about Bopal",
         "Tell me about BHK distribution"
     ]
     
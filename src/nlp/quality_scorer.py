@@ -190,7 +190,65 @@ class DescriptionQualityScorer:
             'rating': rating,
             'score_out_of_100': round(overall * 10, 1)
         }
-    
+
+    def calculate_scores_frame(self, df, descriptions) -> 'pd.DataFrame':
+        """
+        calculate_overall_score for every row of a DataFrame at once
+
+        Completeness is computed column-wise; the text scores run once per
+        distinct description (most listings share an empty or identical one).
+
+        Args:
+            df: Properties (same fields as property_data)
+            descriptions: Description text of each row, aligned with df
+
+        Returns:
+            DataFrame indexed like df with the calculate_overall_score keys as columns
+        """
+        import numpy as np
+        import pandas as pd
+
+        def filled(field):
+            # Same test as score_completeness: present, truthy and not 'nan'
+            if field not in df.columns:
+                return np.zeros(len(df), dtype=bool)
+            col = df[field]
+            return (col.notna() & (col.astype(str) != 'nan') & ~col.isin([0, ''])).to_numpy()
+
+        core_fields = ['BHK', 'Area_SqFt', 'Price_Lakhs', 'Locality', 'Property_Type']
+        additional_fields = ['Furnishing_Status', 'Seller_Type', 'Under_Construction', 'Amenities_Count']
+        score = sum(filled(f) * 2 for f in core_fields) + sum(filled(f) * 1 for f in additional_fields)
+        completeness = score / (2 * len(core_fields) + len(additional_fields)) * 10
+
+        codes, unique = pd.factorize(pd.Series(list(descriptions), index=df.index, dtype=object))
+        text_scores = np.array([(self.score_clarity(d), self.score_amenities(d), self.score_attractiveness(d))
+                                for d in unique], dtype=np.float64).reshape(-1, 3)
+        clarity, amenities, attractiveness = text_scores[codes].T
+
+        # Weighted average (completeness is most important)
+        overall = (
+            completeness * 0.35 +
+            clarity * 0.25 +
+            amenities * 0.20 +
+            attractiveness * 0.20
+        )
+        rating = np.select([overall >= 8, overall >= 6, overall >= 4], ['Excellent', 'Good', 'Fair'], default='Poor')
+
+        def rounded(values, digits):
+            # Python's round once per distinct score (np.round can differ on ties like 7.675)
+            codes, unique = pd.factorize(values)
+            return np.array([round(float(v), digits) for v in unique], dtype=np.float64)[codes]
+
+        return pd.DataFrame({
+            'completeness_score': rounded(completeness, 2),
+            'clarity_score': rounded(clarity, 2),
+            'amenities_score': rounded(amenities, 2),
+            'attractiveness_score': rounded(attractiveness, 2),
+            'overall_score': rounded(overall, 2),
+            'rating': rating,
+            'score_out_of_100': rounded(overall * 10, 1)
+        }, index=df.index)
+
     def get_improvement_suggestions(self, scores: Dict) -> list:
         """Get suggestions to improve listing quality"""
         suggestions = []
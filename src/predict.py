@@ -2,15 +2,19 @@
 SINGLE PROPERTY PRICE PREDICTION
 Interactive prediction for individual properties
 """
-import joblib
-import pandas as pd
-import numpy as np
 import sys
 import os
 
 # Add src directory to path to import config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.config import TIER_1_LOCALITIES, TIER_2_LOCALITIES, TIER_3_LOCALITIES
+from src.modeling.registry import ArtifactIntegrityError, ModelRegistry
+from src.modeling.intervals import (INTERVAL_MODEL, QUANTILES, interval_is_current,
+                                    compiled_predict_interval)
+from src.banding import price_bands
+from src.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')   # loaded after the property details are entered
 
 def get_user_input():
     """Get property features from user"""
@@ -187,23 +191,69 @@ def engineer_features(data):
     
     return data
 
-def predict_price(property_data):
-    """Predict price using trained model"""
-    try:
-        # Load model and encoders
-        # Use XGBoost (model_2) as it's a standard model without custom classes
+def load_model(registry=None):
+    """Load the best registered model, falling back to standalone base models"""
+    registry = registry or ModelRegistry()
+
+    # Compiled arrays are memory-mapped, so concurrent predictors share one copy
+    compiled = registry.compiled('best')
+    if compiled is not None:
+        print(f"📊 Using compiled best model ({registry.resolve('best')}, {compiled.n_trees} trees)")
+        return compiled
+
+    # Ensembles are importable from src.modeling.ensembles, so the best model
+    # can be unpickled here whatever ranked first
+    for name in ['best', 'XGBoost', 'RandomForest']:
         try:
-            model = joblib.load('models/model_2_xgboost.pkl')
-            print("📊 Using XGBoost model (R² = 0.8376)")
-        except:
-            # Fall back to other standard models
-            try:
-                model = joblib.load('models/model_5_randomforest.pkl')
-                print("📊 Using Random Forest model (R² = 0.8267)")
-            except:
-                raise Exception("No compatible model found. Please train models first.")
-        
-        encoders = joblib.load('models/label_encoders.pkl')
+            model = registry.get(name)
+        except ArtifactIntegrityError as e:
+            print(f"⚠️  Skipping {registry.resolve(name)}: {e}")
+            continue
+        except Exception:
+            continue
+        print(f"📊 Using {registry.resolve(name)} model ({type(model).__name__})")
+        return model
+    raise Exception("No compatible model found. Please train models first.")
+
+def load_interval_model(registry=None):
+    """
+    Point + quantile predictor for the best model, if one was trained for it
+
+    Returns:
+        Callable X -> (point, lower, upper), or None
+    """
+    registry = registry or ModelRegistry()
+    if not interval_is_current(registry):
+        return None
+
+    compiled = registry.compiled(INTERVAL_MODEL)
+    if compiled is not None:
+        print(f"📊 Using compiled {registry.resolve('best')} model + quantile models ({compiled.n_trees} trees)")
+        return lambda X: compiled_predict_interval(compiled, X)
+    try:
+        model = registry.get(INTERVAL_MODEL)
+    except ArtifactIntegrityError as e:
+        print(f"⚠️  No prediction interval: {e}")
+        return None
+    except Exception:
+        return None
+    print(f"📊 Using {registry.resolve('best')} model + quantile models")
+    return model.predict_interval
+
+def predict_price(property_data, registry=None):
+    """
+    Predict price using trained model
+
+    Args:
+        registry: Shared ModelRegistry (e.g. of a main.py session) whose loaded
+            models are reused; a fresh one is read from disk if omitted
+    """
+    try:
+        # Load model (with its quantile models when available) and encoders
+        registry = registry or ModelRegistry()
+        predict_interval = load_interval_model(registry)
+        model = load_model(registry) if predict_interval is None else None
+        encoders = registry.encoders()
         
         # Engineer features
         property_data = engineer_features(property_data)
@@ -233,25 +283,18 @@ def predict_price(property_data):
         # Select features in correct order
         X = df[feature_cols]
         
-        # Predict
-        predicted_price = model.predict(X)[0]
+        # Predict (point and interval bounds come from one batched call)
+        if predict_interval is not None:
+            point, lower, upper = predict_interval(X)
+            predicted_price, low_price, high_price = point[0], lower[0], upper[0]
+            interval_note = f"{QUANTILES[-1] - QUANTILES[0]:.0%} prediction interval, calibrated on held-out listings"
+        else:
+            predicted_price = model.predict(X)[0]
+            low_price, high_price = predicted_price * 0.9, predicted_price * 1.1
+            interval_note = "±10% - no interval model trained yet"
         
         # Determine price band
-        price_bands = [
-            (0, 20, '0-20L (Budget)'),
-            (20, 40, '20-40L (Affordable)'),
-            (40, 60, '40-60L (Mid-Range)'),
-            (60, 80, '60-80L (Premium)'),
-            (80, 100, '80-100L (Luxury)'),
-            (100, 120, '100-120L (High-End)'),
-            (120, float('inf'), '120L+ (Ultra-Luxury)')
-        ]
-        
-        price_band = None
-        for min_price, max_price, band in price_bands:
-            if min_price <= predicted_price < max_price:
-                price_band = band
-                break
+        price_band = price_bands(predicted_price)
         
         # Display results
         print("\n" + "="*80)
@@ -259,8 +302,8 @@ def predict_price(property_data):
         print("="*80)
         print(f"\n💰 Predicted Price: ₹{predicted_price:.2f} Lakhs")
         print(f"📊 Price Band: {price_band}")
-        print(f"\n📈 Price Range: ₹{predicted_price*0.9:.2f}L - ₹{predicted_price*1.1:.2f}L")
-        print(f"   (±10% confidence interval)")
+        print(f"\n📈 Price Range: ₹{low_price:.2f}L - ₹{high_price:.2f}L")
+        print(f"   ({interval_note})")
         
         # Additional insights
         print("\n" + "="*80)
@@ -0,0 +1,112 @@
+"""
+Shared feature engineering for the enhanced training file
+- Row-level features depend only on the row itself
+- Locality aggregates (count, median area, most common BHK, median price) are
+  kept as mergeable per-locality state, so newly scraped rows can be folded
+  in without recomputing them from the whole dataset
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+
+RAW_COLUMNS = ['Price_Lakhs', 'Area_SqFt', 'BHK', 'Property_Type', 'Furnishing_Status', 'Locality',
+               'Locality_Tier', 'Seller_Type', 'Under_Construction', 'Amenities_Count', 'Source_Website']
+
+AGGREGATES_PATH = 'data/training/locality_aggregates.json'
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Content hash of every listing over the raw (pre-engineering) columns"""
+    return pd.util.hash_pandas_object(df[RAW_COLUMNS], index=False).values
+
+
+def price_categories(prices: pd.Series, bucket_size: int = 20) -> pd.Series:
+    """20 Lakh price buckets ('0-20L', '20-40L', ...)"""
+    buckets = np.arange(0, prices.max() + bucket_size, bucket_size)
+    return pd.cut(prices, bins=buckets,
+                  labels=[f'{int(buckets[i])}-{int(buckets[i+1])}L' for i in range(len(buckets)-1)],
+                  include_lowest=True)
+
+
+def add_row_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Engineered features that need nothing but the row itself"""
+    df['Area_Per_BHK'] = df['Area_SqFt'] / df['BHK']
+    df['Is_Large_Apartment'] = (df['BHK'] >= 4).astype(int)
+    df['Is_Premium_Locality'] = (df['Locality_Tier'] == 'Tier 1').astype(int)
+    df['Is_Budget_Locality'] = (df['Locality_Tier'] == 'Tier 3').astype(int)
+    df['BHK_Area_Category'] = pd.cut(df['Area_SqFt'], bins=[0, 800, 1500, 3000, 10000],
+                                     labels=['Small', 'Medium', 'Large', 'XLarge'])
+    df['BHK_Area_Combo'] = df['BHK'].astype(str) + '_' + df['BHK_Area_Category'].astype(str)
+    df['High_Amenity'] = (df['Amenities_Count'] >= 3).astype(int)
+    df['Construction_Category'] = np.where(df['Under_Construction'].astype(bool),
+                                           'Under_Construction', 'Ready_To_Move')
+    return df
+
+
+class LocalityAggregates:
+    """
+    Per-locality state behind the Locality_* features: sorted areas and
+    prices (for exact medians) and BHK counts (for the mode)
+    """
+
+    def __init__(self, state: dict = None):
+        self.state = state or {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame):
+        state = {}
+        for locality, group in df.groupby('Locality'):
+            state[locality] = {
+                'areas': np.sort(group['Area_SqFt'].values).tolist(),
+                'prices': np.sort(group['Price_Lakhs'].values).tolist(),
+                'bhk_counts': {str(k): int(v) for k, v in group['BHK'].value_counts().items()},
+            }
+        return cls(state)
+
+    def update(self, delta: pd.DataFrame):
+        """Fold new listings into the per-locality state"""
+        for locality, group in delta.groupby('Locality'):
+            entry = self.state.setdefault(locality, {'areas': [], 'prices': [], 'bhk_counts': {}})
+            for key, column in (('areas', 'Area_SqFt'), ('prices', 'Price_Lakhs')):
+                current = np.asarray(entry[key], dtype=float)
+                new = np.sort(group[column].values)
+                entry[key] = np.insert(current, np.searchsorted(current, new), new).tolist()
+            for bhk, n in group['BHK'].value_counts().items():
+                entry['bhk_counts'][str(bhk)] = entry['bhk_counts'].get(str(bhk), 0) + int(n)
+        return self
+
+    def to_frame(self) -> pd.DataFrame:
+        rows = {}
+        for locality, entry in self.state.items():
+            counts = {float(k): v for k, v in entry['bhk_counts'].items()}
+            top = max(counts.values())
+            rows[locality] = {
+                'Locality_Property_Count': len(entry['areas']),
+                'Locality_Median_Area': float(np.median(entry['areas'])),
+                # Ties resolve to the smallest BHK, like Series.mode()[0]
+                'Locality_Common_BHK': min(k for k, v in counts.items() if v == top),
+                'Locality_Median_Price': float(np.median(entry['prices'])),
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """(Re)compute the Locality_* columns of every row from the current state"""
+        table = self.to_frame()
+        for col in table.columns:
+            df[col] = df['Locality'].map(table[col])
+        return df
+
+    def save(self, path: str = AGGREGATES_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+
+    @classmethod
+    def load(cls, path: str = AGGREGATES_PATH):
+        """Saved state, or None if it has not been written yet"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
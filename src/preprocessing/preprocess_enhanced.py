@@ -12,7 +12,9 @@ import re
 from datetime import datetime
 import sys
 sys.path.append('src')
+sys.path.append('.')
 from config import AHMEDABAD_LOCALITIES, NORMALIZED_LOCALITIES, LOCALITY_TIERS, DATA_PATHS
+from src.preprocessing.features import price_categories, add_row_features, LocalityAggregates, AGGREGATES_PATH
 
 print("\n" + "="*70)
 print("ENHANCED DATA PREPROCESSING - BUCKETING & FEATURE ENGINEERING")
@@ -59,10 +61,7 @@ buckets = np.arange(0, max_price + bucket_size, bucket_size)
 print(f"📊 Creating {len(buckets)-1} buckets with {bucket_size}L size")
 
 # Create price categories
-df['Price_Category'] = pd.cut(df['Price_Lakhs'], 
-                               bins=buckets, 
-                               labels=[f'{int(buckets[i])}-{int(buckets[i+1])}L' for i in range(len(buckets)-1)],
-                               include_lowest=True)
+df['Price_Category'] = price_categories(df['Price_Lakhs'], bucket_size)
 
 print(f"✅ Price categories created!")
 print(f"\n📊 Top 10 Price Categories:")
@@ -81,34 +80,28 @@ print("\n" + "="*70)
 print("STEP 2: FEATURE ENGINEERING")
 print("="*70)
 
+# Row-level features (shared with incremental training, see src/preprocessing/features.py)
+df = add_row_features(df)
+
 # 1. Area per BHK (useful proxy for room size)
-df['Area_Per_BHK'] = df['Area_SqFt'] / df['BHK']
 print(f"✅ Added: Area_Per_BHK (Range: {df['Area_Per_BHK'].min():.0f} - {df['Area_Per_BHK'].max():.0f})")
 
 # 2. Is_Large_Apartment (BHK >= 4)
-df['Is_Large_Apartment'] = (df['BHK'] >= 4).astype(int)
 print(f"✅ Added: Is_Large_Apartment ({df['Is_Large_Apartment'].sum()} properties, {df['Is_Large_Apartment'].sum()/len(df)*100:.1f}%)")
 
 # 3. Is_Premium_Locality (Tier 1)
-df['Is_Premium_Locality'] = (df['Locality_Tier'] == 'Tier 1').astype(int)
 print(f"✅ Added: Is_Premium_Locality ({df['Is_Premium_Locality'].sum()} properties, {df['Is_Premium_Locality'].sum()/len(df)*100:.1f}%)")
 
 # 4. Is_Budget_Locality (Tier 3)
-df['Is_Budget_Locality'] = (df['Locality_Tier'] == 'Tier 3').astype(int)
 print(f"✅ Added: Is_Budget_Locality ({df['Is_Budget_Locality'].sum()} properties, {df['Is_Budget_Locality'].sum()/len(df)*100:.1f}%)")
 
 # 5. BHK_Area_Interaction (categorical interaction)
-df['BHK_Area_Category'] = pd.cut(df['Area_SqFt'], bins=[0, 800, 1500, 3000, 10000], 
-                                  labels=['Small', 'Medium', 'Large', 'XLarge'])
-df['BHK_Area_Combo'] = df['BHK'].astype(str) + '_' + df['BHK_Area_Category'].astype(str)
 print(f"✅ Added: BHK_Area_Combo ({df['BHK_Area_Combo'].nunique()} unique combinations)")
 
 # 6. High Amenity Property
-df['High_Amenity'] = (df['Amenities_Count'] >= 3).astype(int)
 print(f"✅ Added: High_Amenity ({df['High_Amenity'].sum()} properties, {df['High_Amenity'].sum()/len(df)*100:.1f}%)")
 
 # 7. Property Age Category (Under_Construction vs Ready)
-df['Construction_Category'] = df['Under_Construction'].apply(lambda x: 'Under_Construction' if x else 'Ready_To_Move')
 print(f"✅ Added: Construction_Category")
 
 # ============================================================================
@@ -119,24 +112,21 @@ print("\n" + "="*70)
 print("STEP 3: LOCALITY-BASED STATISTICAL FEATURES")
 print("="*70)
 
+# Per-locality state, saved so incremental training can fold in new listings
+aggregates = LocalityAggregates.from_frame(df)
+df = aggregates.apply(df)
+aggregates.save(AGGREGATES_PATH)
+
 # Count of properties in each locality (popularity metric)
-locality_counts = df['Locality'].value_counts()
-df['Locality_Property_Count'] = df['Locality'].map(locality_counts)
 print(f"✅ Added: Locality_Property_Count (Range: {df['Locality_Property_Count'].min()} - {df['Locality_Property_Count'].max()})")
 
 # Median area in each locality (area patterns - more robust to outliers)
-locality_median_area = df.groupby('Locality')['Area_SqFt'].median()
-df['Locality_Median_Area'] = df['Locality'].map(locality_median_area)
 print(f"✅ Added: Locality_Median_Area (Range: {df['Locality_Median_Area'].min():.0f} - {df['Locality_Median_Area'].max():.0f})")
 
 # Most common BHK in locality
-locality_mode_bhk = df.groupby('Locality')['BHK'].agg(lambda x: x.mode()[0] if len(x.mode()) > 0 else x.median())
-df['Locality_Common_BHK'] = df['Locality'].map(locality_mode_bhk)
 print(f"✅ Added: Locality_Common_BHK")
 
 # Median price in each locality (target variable pattern - for reference only, NOT used in training)
-locality_median_price = df.groupby('Locality')['Price_Lakhs'].median()
-df['Locality_Median_Price'] = df['Locality'].map(locality_median_price)
 print(f"✅ Added: Locality_Median_Price (Range: {df['Locality_Median_Price'].min():.1f}L - {df['Locality_Median_Price'].max():.1f}L)")
 print(f"⚠️  Note: Locality_Median_Price is for analysis only, NOT used in model training (price leakage risk)")
 
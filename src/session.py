@@ -0,0 +1,47 @@
+"""
+CLI SESSION
+State shared between the actions of one main.py process: the encoded
+training data and the model registry (which caches loaded and freshly
+trained models, encoders and compiled arrays).
+
+Data is keyed by file modification time, so preprocessing in the same
+session (or in another terminal) is picked up on the next access. The
+registry re-reads its manifest when another process has rewritten it.
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TRAINING_PATH = 'data/training/training_data_enhanced.csv'
+
+
+class Session:
+    """Loaded data and models reused across menu actions"""
+
+    def __init__(self):
+        self._registry = None
+        self._training = {}
+
+    @property
+    def registry(self):
+        """Model registry, created on first use"""
+        if self._registry is None:
+            from src.modeling.registry import ModelRegistry
+            self._registry = ModelRegistry()
+        return self._registry
+
+    def refresh(self):
+        """Pick up models registered by other processes since the last action"""
+        if self._registry is not None and self._registry.refresh():
+            print("🔄 Model registry changed on disk - reloaded manifest")
+
+    def training_data(self, path: str = TRAINING_PATH):
+        """(X, y, label_encoders) as built by train_all.load_training_data, cached per file version"""
+        from src.modeling.train_all import load_training_data
+        key = (path, os.path.getmtime(path))
+        if key not in self._training:
+            self._training = {key: load_training_data(path)}
+        else:
+            print(f"\n📂 Reusing loaded training data ({len(self._training[key][0])} records)")
+        return self._training[key]
@@ -0,0 +1,118 @@
+"""
+STARTUP-TIME BENCHMARK
+Measures how long each entry point takes to import (everything that runs
+before its menu / prompt appears) with `python -X importtime`, in a fresh
+interpreter per run, and checks it against a regression budget.
+
+Usage:
+    python src/startup_benchmark.py              # all entry points, exit 1 if over budget
+    python src/startup_benchmark.py --repeats 5  # best of 5 runs each
+
+Writes:
+    reports/startup_times.csv - import time, wall time, budget and heaviest imports
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = 'reports/startup_times.csv'
+
+# Entry point -> (module imported, budget in ms for its own import time).
+# Budgets leave ~2x headroom over the lazy-import baseline; an eager pandas
+# (~350ms) or scikit-learn / booster (~1.5s) import anywhere fails them.
+ENTRY_POINTS = {
+    'main.py': ('main', 50),
+    'main_phase2.py': ('main_phase2', 75),
+    'chatbot.py': ('chatbot', 75),
+    'property_finder.py': ('property_finder', 75),
+    'generate_brochure.py': ('generate_brochure', 75),
+    'src/predict.py': ('src.predict', 400),
+    'src/modeling/train_all.py': ('src.modeling.train_all', 800),
+}
+
+
+def parse_importtime(stderr: str, module: str) -> tuple:
+    """
+    Parse `-X importtime` output
+
+    Returns:
+        (cumulative import time of `module` in ms, [(direct import, ms), ...] heaviest first)
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        name = name[1:]                      # drop the separator space; the rest is 2 per level
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, name.strip(), int(cumulative_us)))
+
+    # Children are printed before their parent: the direct imports of the
+    # target are the depth-1 rows since the previous top-level row
+    end = max(i for i, row in enumerate(rows) if row[0] == 0 and row[1] == module)
+    start = end
+    while start > 0 and rows[start - 1][0] > 0:
+        start -= 1
+    children = sorted(((name, us / 1000) for depth, name, us in rows[start:end] if depth == 1),
+                      key=lambda item: -item[1])
+    return rows[end][2] / 1000, children
+
+
+def measure(module: str, repeats: int = 3) -> dict:
+    """Best-of-N import and wall time of `module` in a fresh interpreter"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             cwd=ROOT, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+        wall_ms = (time.perf_counter() - start) * 1000
+        if out.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{out.stderr[-2000:]}")
+        import_ms, children = parse_importtime(out.stderr, module)
+        if best is None or import_ms < best['import_ms']:
+            best = {'import_ms': import_ms, 'wall_ms': wall_ms, 'children': children}
+    return best
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark entry-point startup time')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per entry point (best is kept)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    print("\n" + "="*80)
+    print("⏱️  STARTUP-TIME BENCHMARK (python -X importtime)")
+    print("="*80)
+
+    rows = []
+    for entry, (module, budget_ms) in ENTRY_POINTS.items():
+        result = measure(module, args.repeats)
+        ok = result['import_ms'] <= budget_ms
+        heaviest = ', '.join(f"{name} {ms:.0f}ms" for name, ms in result['children'][:3])
+        print(f"  {'✅' if ok else '❌'} {entry:28} import {result['import_ms']:7.1f}ms "
+              f"(budget {budget_ms}ms) | wall {result['wall_ms']:6.0f}ms | {heaviest}")
+        rows.append({'Entry_Point': entry, 'Module': module, 'Import_ms': round(result['import_ms'], 1),
+                     'Wall_ms': round(result['wall_ms'], 1), 'Budget_ms': budget_ms,
+                     'Within_Budget': ok, 'Heaviest_Imports': heaviest})
+
+    report_path = os.path.join(ROOT, REPORT_PATH)
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    pd.DataFrame(rows).to_csv(report_path, index=False)
+
+    over = [row['Entry_Point'] for row in rows if not row['Within_Budget']]
+    print("="*80)
+    if over:
+        print(f"❌ Over budget: {', '.join(over)} (report: {REPORT_PATH})")
+        return 1
+    print(f"✅ All entry points within budget (report: {REPORT_PATH})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())